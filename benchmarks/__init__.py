@@ -0,0 +1,29 @@
+"""Benchmarks of the hot paths of FiPy
+
+The benchmarks follow the conventions of `airspeed velocity`_, so::
+
+    $ asv run
+
+measures them for the commits of the repository and::
+
+    $ asv publish
+
+draws their scaling with problem size and their history.  Methods named
+``time_*`` are timed and methods named ``peakmem_*`` record the peak
+memory.  A benchmark that needs something that isn't installed raises
+`NotImplementedError` in its `setup` and is skipped.
+
+Without asv::
+
+    $ python -m benchmarks [--quick] [pattern ...]
+
+runs the benchmarks in the working tree and prints one JSON record per
+benchmark and set of parameters.
+
+Benchmarks of the linear solvers only run for the solver suite selected
+with :envvar:`FIPY_SOLVERS` (or the default suite), so repeat them for
+each suite of interest.
+
+.. _airspeed velocity: https://asv.readthedocs.io
+"""
+from __future__ import unicode_literals
@@ -0,0 +1,107 @@
+"""Run the benchmarks without `asv`
+
+    $ python -m benchmarks [--quick] [--repeat N] [pattern ...]
+
+Prints a JSON record of the time or peak memory of each benchmark, for
+each set of parameters, whose name contains one of the patterns.  With
+``--quick``, problems are limited to 10000 cells.
+
+The peak memory is the most allocated, as traced by `tracemalloc`, while
+the benchmark runs for the second time.  Unlike the peak resident memory
+recorded by `asv`, it excludes the memory in use before the benchmark
+starts.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import sys
+import timeit
+import tracemalloc
+
+MODULES = ["meshes", "terms", "solvers", "variables", "files"]
+
+def _benchmarks(pattern):
+    for name in MODULES:
+        module = importlib.import_module("benchmarks." + name)
+        for className, cls in sorted(vars(module).items()):
+            if (not inspect.isclass(cls) or cls.__module__ != module.__name__
+                or className.startswith("_")):
+                continue
+            for methodName in sorted(vars(cls)):
+                if methodName.startswith(("time_", "peakmem_")):
+                    fullName = "%s.%s.%s" % (name, className, methodName)
+                    if not pattern or any(p in fullName for p in pattern):
+                        yield fullName, cls, methodName
+
+def _run(cls, methodName, params, repeat):
+    benchmark = cls()
+    try:
+        if hasattr(benchmark, "setup"):
+            benchmark.setup(*params)
+    except NotImplementedError:
+        return None
+
+    method = getattr(benchmark, methodName)
+    try:
+        if methodName.startswith("time_"):
+            # at least 0.1 s per repeat
+            number, elapsed = 1, 0.
+            while True:
+                elapsed = timeit.timeit(lambda: method(*params), number=number)
+                if elapsed > 0.1:
+                    break
+                number *= 10
+            times = [elapsed / number]
+            times += [t / number for t in timeit.repeat(lambda: method(*params),
+                                                        number=number,
+                                                        repeat=repeat - 1)]
+            return {"time": min(times), "number": number}
+        else:
+            # leave out one-time imports and caches
+            method(*params)
+            tracemalloc.start()
+            try:
+                method(*params)
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return {"peakmem": peak}
+    finally:
+        if hasattr(benchmark, "teardown"):
+            benchmark.teardown(*params)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Run the FiPy benchmarks")
+    parser.add_argument("pattern", nargs="*",
+                        help="only run benchmarks whose names contain a pattern")
+    parser.add_argument("--quick", action="store_true",
+                        help="limit problems to 10000 cells")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timings to take the best of")
+    args = parser.parse_args(argv)
+
+    for fullName, cls, methodName in _benchmarks(args.pattern):
+        params = getattr(cls, "params", ())
+        names = getattr(cls, "param_names", ())
+        if params and not isinstance(params[0], list):
+            params = (params,)
+        for combination in itertools.product(*params):
+            record = dict(zip(names, combination))
+            if args.quick and record.get("cells", 0) > 10000:
+                continue
+            result = _run(cls, methodName, combination, repeat=args.repeat)
+            if result is not None:
+                record["benchmark"] = fullName
+                record.update(result)
+                print(json.dumps(record))
+                sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
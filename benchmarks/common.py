@@ -0,0 +1,65 @@
+"""Problems shared by the benchmarks
+"""
+from __future__ import division
+from __future__ import unicode_literals
+
+from fipy import CellVariable, Grid1D, Grid2D, Grid3D, Tri2D, numerix
+
+# numbers of cells, spanning the range where Python overhead dominates to
+# where memory bandwidth does
+SIZES = [100, 10000, 1000000]
+
+def makeMesh(kind, numberOfCells):
+    """Return a mesh of `kind` with about `numberOfCells` cells
+    """
+    if kind == "Grid1D":
+        return Grid1D(nx=numberOfCells, dx=1. / numberOfCells)
+    elif kind == "Grid2D":
+        n = int(round(numberOfCells**(1. / 2)))
+        return Grid2D(nx=n, ny=n, dx=1. / n, dy=1. / n)
+    elif kind == "Grid3D":
+        n = int(round(numberOfCells**(1. / 3)))
+        return Grid3D(nx=n, ny=n, nz=n, dx=1. / n, dy=1. / n, dz=1. / n)
+    elif kind == "NonUniformGrid2D":
+        n = int(round(numberOfCells**(1. / 2)))
+        dx = numerix.linspace(1., 2., n)
+        # a `Grid2D` with variable spacing is a `NonUniformGrid2D`
+        return Grid2D(dx=dx / dx.sum(), dy=dx / dx.sum())
+    elif kind == "Tri2D":
+        # four triangles to a square
+        n = int(round((numberOfCells / 4.)**(1. / 2)))
+        return Tri2D(nx=n, ny=n, dx=1. / n, dy=1. / n)
+    elif kind == "Gmsh2D":
+        from fipy import Gmsh2D
+        from fipy.meshes.gmshMesh import gmshVersion
+        if gmshVersion() is None:
+            raise NotImplementedError("Gmsh is not installed")
+        # equilateral triangles
+        cellSize = (4. / (numerix.sqrt(3.) * numberOfCells))**(1. / 2)
+        return Gmsh2D("""
+            cellSize = %g;
+            Point(1) = {0, 0, 0, cellSize};
+            Point(2) = {1, 0, 0, cellSize};
+            Point(3) = {1, 1, 0, cellSize};
+            Point(4) = {0, 1, 0, cellSize};
+            Line(5) = {1, 2};
+            Line(6) = {2, 3};
+            Line(7) = {3, 4};
+            Line(8) = {4, 1};
+            Line Loop(9) = {5, 6, 7, 8};
+            Plane Surface(10) = {9};
+        """ % cellSize)
+    else:
+        raise ValueError("Unknown mesh: %s" % kind)
+
+def makeVariable(mesh, rank=0, hasOld=False):
+    """Return a smoothly varying, constrained `CellVariable` on `mesh`
+    """
+    x = mesh.cellCenters[0]
+    value = numerix.sin(numerix.pi * x)
+    if rank == 1:
+        value = numerix.resize(value, (mesh.dim, mesh.numberOfCells))
+    var = CellVariable(mesh=mesh, value=value, rank=rank, hasOld=hasOld)
+    if rank == 0:
+        var.constrain(0., where=mesh.exteriorFaces)
+    return var
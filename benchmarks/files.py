@@ -0,0 +1,79 @@
+"""Writing and reading of meshes and solutions
+"""
+from __future__ import unicode_literals
+from builtins import object
+
+import os
+import shutil
+import tempfile
+
+from fipy import TSVViewer
+from fipy.tools import dump
+
+from benchmarks.common import SIZES, makeMesh, makeVariable
+
+class Dump(object):
+    """Pickle a mesh and solution with `fipy.tools.dump`
+    """
+    params = (["Grid2D", "Tri2D"], SIZES)
+    param_names = ["mesh", "cells"]
+    timeout = 300
+
+    def setup(self, mesh, cells):
+        self.var = makeVariable(makeMesh(mesh, cells))
+        self.dirname = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dirname, "var.dmp")
+        dump.write(self.var, filename=self.filename)
+
+    def teardown(self, mesh, cells):
+        shutil.rmtree(self.dirname)
+
+    def time_write(self, mesh, cells):
+        dump.write(self.var, filename=self.filename)
+
+    def time_read(self, mesh, cells):
+        dump.read(self.filename)
+
+    def peakmem_read(self, mesh, cells):
+        dump.read(self.filename)
+
+class Checkpoint(object):
+    """Write and read the values of solutions with `writeCheckpoint`
+    """
+    params = ([False, True], SIZES)
+    param_names = ["compress", "cells"]
+
+    def setup(self, compress, cells):
+        mesh = makeMesh("Grid2D", cells)
+        self.vars = {"phi": makeVariable(mesh),
+                     "velocity": makeVariable(mesh, rank=1)}
+        self.dirname = tempfile.mkdtemp()
+        dump.writeCheckpoint(self.dirname, self.vars, compress=compress)
+
+    def teardown(self, compress, cells):
+        shutil.rmtree(self.dirname)
+
+    def time_write(self, compress, cells):
+        dump.writeCheckpoint(self.dirname, self.vars, compress=compress)
+
+    def time_read(self, compress, cells):
+        values = dump.readCheckpoint(self.dirname)
+        for value in values.values():
+            value.sum()
+
+class TSV(object):
+    """Write a solution as tab-separated values
+    """
+    params = (["Grid2D"], SIZES[:-1])
+    param_names = ["mesh", "cells"]
+
+    def setup(self, mesh, cells):
+        self.var = makeVariable(makeMesh(mesh, cells))
+        self.dirname = tempfile.mkdtemp()
+        self.viewer = TSVViewer(vars=(self.var,))
+
+    def teardown(self, mesh, cells):
+        shutil.rmtree(self.dirname)
+
+    def time_write(self, mesh, cells):
+        self.viewer.plot(filename=os.path.join(self.dirname, "var.tsv"))
@@ -0,0 +1,52 @@
+"""Construction of meshes and of their geometry
+"""
+from __future__ import unicode_literals
+from builtins import object
+
+from benchmarks.common import SIZES, makeMesh
+
+class MeshConstruction(object):
+    params = (["Grid1D", "Grid2D", "Grid3D", "NonUniformGrid2D", "Tri2D", "Gmsh2D"],
+              SIZES)
+    param_names = ["mesh", "cells"]
+    timeout = 300
+
+    def setup(self, kind, cells):
+        if kind == "Gmsh2D":
+            # skip if Gmsh is missing
+            makeMesh(kind, 100)
+
+    def time_construction(self, kind, cells):
+        makeMesh(kind, cells)
+
+    def peakmem_construction(self, kind, cells):
+        makeMesh(kind, cells)
+
+class MeshGeometry(object):
+    """The geometry and connectivity needed by the terms
+
+    Structured grids calculate these on demand.
+    """
+    params = (["Grid2D", "Grid3D", "NonUniformGrid2D", "Tri2D", "Gmsh2D"],
+              SIZES)
+    param_names = ["mesh", "cells"]
+    timeout = 300
+
+    def setup(self, kind, cells):
+        self.mesh = makeMesh(kind, cells)
+
+    def time_geometry(self, kind, cells):
+        mesh = self.mesh
+        mesh.cellVolumes
+        mesh._faceAreas
+        mesh._cellDistances
+        mesh._orientedFaceNormals
+        mesh._cellToCellDistances
+        mesh.cellFaceIDs
+        mesh.exteriorFaces
+
+    def time_connectivity(self, kind, cells):
+        mesh = self.mesh
+        mesh._adjacentCellIDs
+        mesh._cellToCellIDs
+        mesh.interiorFaceIDs
@@ -0,0 +1,44 @@
+"""Solution of the linear system of a diffusion problem by each solver
+"""
+from __future__ import unicode_literals
+from builtins import object
+
+import fipy.solvers
+from fipy import DiffusionTerm, ImplicitSourceTerm, TransientTerm
+
+from benchmarks.common import SIZES, makeMesh, makeVariable
+
+class LinearSolve(object):
+    """A time step of a diffusion-dominated problem
+
+    Only the solver suite in use runs (see :envvar:`FIPY_SOLVERS`).
+    """
+    params = (["scipy", "pysparse", "trilinos", "petsc", "pyamg", "pyamgx"],
+              ["LinearPCGSolver", "LinearGMRESSolver", "LinearBicgstabSolver",
+               "LinearLUSolver"],
+              SIZES[:-1] + [250000])
+    param_names = ["suite", "solver", "cells"]
+    timeout = 600
+
+    def setup(self, suite, solver, cells):
+        if suite != fipy.solvers.solver:
+            raise NotImplementedError("%s solvers are not in use" % suite)
+        if not hasattr(fipy.solvers, solver):
+            raise NotImplementedError("%s has no %s" % (suite, solver))
+
+        self.var = makeVariable(makeMesh("Grid2D", cells), hasOld=True)
+        self.eq = (TransientTerm(coeff=1e-3)
+                   == DiffusionTerm(coeff=1.)
+                   - ImplicitSourceTerm(coeff=1.))
+        self.solver = getattr(fipy.solvers, solver)(tolerance=1e-10)
+        self.value = self.var.value.copy()
+
+    def _solve(self):
+        self.var.value = self.value
+        self.eq.solve(var=self.var, dt=1., solver=self.solver)
+
+    def time_solve(self, suite, solver, cells):
+        self._solve()
+
+    def peakmem_solve(self, suite, solver, cells):
+        self._solve()
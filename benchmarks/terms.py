@@ -0,0 +1,90 @@
+"""Assembly of the matrix and RHS vector of each kind of term
+"""
+from __future__ import unicode_literals
+from builtins import object
+
+from fipy import (CentralDifferenceConvectionTerm, DiffusionTerm,
+                  ExplicitDiffusionTerm, ExponentialConvectionTerm,
+                  FaceVariable, ImplicitSourceTerm, PowerLawConvectionTerm,
+                  TransientTerm, UpwindConvectionTerm, VanLeerConvectionTerm)
+from fipy.solvers import DefaultSolver
+
+from benchmarks.common import SIZES, makeMesh, makeVariable
+
+def _makeTerm(kind, var):
+    mesh = var.mesh
+    velocity = FaceVariable(mesh=mesh, rank=1, value=1.)
+    if kind == "TransientTerm":
+        return TransientTerm(coeff=1. + var)
+    elif kind == "DiffusionTerm":
+        return DiffusionTerm(coeff=1.)
+    elif kind == "DiffusionTerm(variable)":
+        return DiffusionTerm(coeff=1. + var.arithmeticFaceValue**2)
+    elif kind == "ExplicitDiffusionTerm":
+        return ExplicitDiffusionTerm(coeff=1.)
+    elif kind == "ImplicitSourceTerm":
+        return ImplicitSourceTerm(coeff=var)
+    elif kind == "UpwindConvectionTerm":
+        return UpwindConvectionTerm(coeff=velocity)
+    elif kind == "CentralDifferenceConvectionTerm":
+        return CentralDifferenceConvectionTerm(coeff=velocity)
+    elif kind == "ExponentialConvectionTerm":
+        return ExponentialConvectionTerm(coeff=velocity)
+    elif kind == "PowerLawConvectionTerm":
+        return PowerLawConvectionTerm(coeff=velocity)
+    elif kind == "VanLeerConvectionTerm":
+        return VanLeerConvectionTerm(coeff=velocity)
+    else:
+        raise ValueError("Unknown term: %s" % kind)
+
+class TermAssembly(object):
+    """Build a term and convert its matrix for the default solver
+
+    Terms whose inputs haven't changed reuse their last build, so the
+    solution is changed before each build.
+    """
+    params = (["TransientTerm", "DiffusionTerm", "DiffusionTerm(variable)",
+               "ExplicitDiffusionTerm", "ImplicitSourceTerm",
+               "UpwindConvectionTerm", "CentralDifferenceConvectionTerm",
+               "ExponentialConvectionTerm", "PowerLawConvectionTerm",
+               "VanLeerConvectionTerm"],
+              ["Grid2D", "Tri2D"],
+              SIZES)
+    param_names = ["term", "mesh", "cells"]
+    timeout = 300
+
+    def setup(self, kind, mesh, cells):
+        self.var = makeVariable(makeMesh(mesh, cells), hasOld=True)
+        self.term = _makeTerm(kind, self.var)
+        self.solver = DefaultSolver()
+        # build once, so that one-time setup isn't timed
+        self._assemble()
+
+    def _assemble(self):
+        self.var.value = self.var.value
+        self.term._prepareLinearSystem(var=self.var, solver=self.solver,
+                                       boundaryConditions=(), dt=1.)
+        self.solver.matrix.matrix
+
+    def time_assembly(self, kind, mesh, cells):
+        self._assemble()
+
+    def peakmem_assembly(self, kind, mesh, cells):
+        self._assemble()
+
+class TermReuse(object):
+    """Rebuild an equation whose inputs haven't changed
+    """
+    params = (["Grid2D"], SIZES)
+    param_names = ["mesh", "cells"]
+
+    def setup(self, mesh, cells):
+        self.var = makeVariable(makeMesh(mesh, cells), hasOld=True)
+        self.eq = TransientTerm() == DiffusionTerm(coeff=1.)
+        self.solver = DefaultSolver()
+        self.eq._prepareLinearSystem(var=self.var, solver=self.solver,
+                                     boundaryConditions=(), dt=1.)
+
+    def time_reuse(self, mesh, cells):
+        self.eq._prepareLinearSystem(var=self.var, solver=self.solver,
+                                     boundaryConditions=(), dt=1.)
@@ -0,0 +1,60 @@
+"""Evaluation of `Variable` expressions, gradients, and interpolation
+"""
+from __future__ import unicode_literals
+from builtins import object
+
+from fipy import numerix
+
+from benchmarks.common import SIZES, makeMesh, makeVariable
+
+class ExpressionEvaluation(object):
+    """Recalculate a typical phase field expression after a change
+    """
+    params = (["Grid2D", "Tri2D"], SIZES)
+    param_names = ["mesh", "cells"]
+
+    def setup(self, mesh, cells):
+        self.phase = makeVariable(makeMesh(mesh, cells))
+        phase = self.phase
+        self.expression = (30 * phase**2 * (1 - phase)**2
+                           * numerix.exp(-phase) / (1 + phase**2))
+        self.expression.value
+
+    def time_expression(self, mesh, cells):
+        self.phase.value = self.phase.value
+        self.expression.value
+
+    def peakmem_expression(self, mesh, cells):
+        self.phase.value = self.phase.value
+        self.expression.value
+
+class Gradients(object):
+    params = (["grad", "faceGrad", "faceGradAverage", "leastSquaresGrad"],
+              ["Grid2D", "Grid3D", "Tri2D"],
+              SIZES)
+    param_names = ["gradient", "mesh", "cells"]
+    timeout = 300
+
+    def setup(self, gradient, mesh, cells):
+        self.var = makeVariable(makeMesh(mesh, cells))
+        self.gradient = getattr(self.var, gradient)
+        self.gradient.value
+
+    def time_gradient(self, gradient, mesh, cells):
+        self.var.value = self.var.value
+        self.gradient.value
+
+class Interpolation(object):
+    params = (["arithmeticFaceValue", "harmonicFaceValue", "minmodFaceValue"],
+              ["Grid2D", "Tri2D"],
+              SIZES)
+    param_names = ["interpolation", "mesh", "cells"]
+
+    def setup(self, interpolation, mesh, cells):
+        self.var = makeVariable(makeMesh(mesh, cells))
+        self.faceValue = getattr(self.var, interpolation)
+        self.faceValue.value
+
+    def time_interpolation(self, interpolation, mesh, cells):
+        self.var.value = self.var.value
+        self.faceValue.value
@@ -0,0 +1,367 @@
+from __future__ import division
+from __future__ import unicode_literals
+from builtins import range
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+from scipy.sparse.linalg import LinearOperator
+
+from fipy.matrices.sparseMatrix import _SparseMatrix
+from fipy.tools import numerix
+
+class _MatrixFreeMeshMatrix(_SparseMatrix):
+    """Linear operator of a set of `Term` objects, applied without a matrix
+
+    Terms build into this class exactly as they build into a sparse
+    matrix, but the contributions are kept in the form the terms produce
+    them:
+
+    - the coefficients of the interior faces, which are applied to the
+      values of the cells on either side of each face.  Conservative
+      terms, such as diffusion and convection, only need one or two
+      coefficients per face to express the flux through it,
+    - diagonal coefficients, one per cell,
+    - any other entries, as (row, column, value) triplets.
+
+    Storage thus scales with the number of faces, rather than with the
+    number of nonzeros and their indices.  `matrix` is a
+    `scipy.sparse.linalg.LinearOperator` that also provides the
+    `diagonal()`, e.g., for Jacobi preconditioning.
+
+    >>> from fipy import (CellVariable, Grid2D, DiffusionTerm,
+    ...                   TransientTerm, ImplicitSourceTerm,
+    ...                   ExponentialConvectionTerm)
+    >>> from fipy.matrices.scipyMatrix import _ScipyMeshMatrix
+    >>> mesh = Grid2D(nx=5, ny=4)
+    >>> var = CellVariable(mesh=mesh, value=mesh.x * mesh.y)
+    >>> var.constrain(1., where=mesh.facesLeft)
+    >>> var.faceGrad.constrain([[1.], [0.]], where=mesh.facesRight)
+    >>> eq = (TransientTerm(coeff=2.)
+    ...       == DiffusionTerm(coeff=mesh.x.arithmeticFaceValue + 1.)
+    ...       + ExponentialConvectionTerm(coeff=(1., 0.5))
+    ...       - ImplicitSourceTerm(coeff=mesh.y))
+    >>> _, L, b = eq._buildAndAddMatrices(var, _MatrixFreeMeshMatrix, dt=0.1)
+    >>> _, S, c = eq._buildAndAddMatrices(var, _ScipyMeshMatrix, dt=0.1)
+    >>> print(numerix.allclose(b, c))
+    True
+    >>> print(numerix.allclose(L.numpyArray, S.numpyArray))
+    True
+    >>> print(numerix.allclose(L.matrix.diagonal(), S.takeDiagonal()))
+    True
+    >>> x = numerix.arange(mesh.numberOfCells, dtype=float)
+    >>> print(numerix.allclose(L.matrix * x, S * x))
+    True
+
+    The blocks of coupled equations are offset as usual
+
+    >>> v0 = CellVariable(mesh=mesh, value=mesh.x)
+    >>> v1 = CellVariable(mesh=mesh, value=mesh.y)
+    >>> eq = ((TransientTerm(var=v0) == DiffusionTerm(coeff=2., var=v1)
+    ...                                 + ImplicitSourceTerm(coeff=1., var=v0))
+    ...       & (TransientTerm(var=v1) == DiffusionTerm(coeff=3., var=v0)))
+    >>> coupled = eq._verifyVar(None)
+    >>> _, L, b = eq._buildAndAddMatrices(coupled, _MatrixFreeMeshMatrix, dt=1.)
+    >>> _, S, c = eq._buildAndAddMatrices(coupled, _ScipyMeshMatrix, dt=1.)
+    >>> print(numerix.allclose(L.numpyArray, S.numpyArray))
+    True
+    """
+
+    _offsets = (0, 0)
+
+    def __init__(self, mesh, bandwidth=0, sizeHint=None,
+                 numberOfVariables=1, numberOfEquations=1):
+        """Creates a `_MatrixFreeMeshMatrix` associated with a `Mesh`.
+
+        Parameters
+        ----------
+        mesh : ~fipy.meshes.mesh.Mesh
+            The `Mesh` to assemble the operator for.
+        bandwidth : int
+            Ignored.
+        sizeHint : int
+            Ignored.
+        numberOfVariables : int
+            The columns of the operator are determined by
+            `numberOfVariables * mesh.numberOfCells`.
+        numberOfEquations : int
+            The rows of the operator are determined by
+            `numberOfEquations * mesh.numberOfCells`.
+        """
+        self.mesh = mesh
+        self.numberOfVariables = numberOfVariables
+        self.numberOfEquations = numberOfEquations
+
+        self._faces = []
+        self._diagonals = []
+        self._triplets = []
+
+        super(_MatrixFreeMeshMatrix, self).__init__()
+
+    @property
+    def _shape(self):
+        N = self.mesh.numberOfCells
+        return (self.numberOfEquations * N, self.numberOfVariables * N)
+
+    @property
+    def _range(self):
+        return list(range(self._shape[1])), list(range(self._shape[0]))
+
+    @property
+    def matrix(self):
+        return _MatrixFreeOperator(self)
+
+    def copy(self):
+        copy = _MatrixFreeMeshMatrix(mesh=self.mesh,
+                                     numberOfVariables=self.numberOfVariables,
+                                     numberOfEquations=self.numberOfEquations)
+        copy._faces = list(self._faces)
+        copy._diagonals = list(self._diagonals)
+        copy._triplets = list(self._triplets)
+        return copy
+
+    def __getitem__(self, index):
+        return self.numpyArray[index]
+
+    def __iadd__(self, other):
+        if numerix.shape(other) == () and other == 0:
+            return self
+        self._faces += other._faces
+        self._diagonals += other._diagonals
+        self._triplets += other._triplets
+        return self
+
+    def __add__(self, other):
+        if numerix.shape(other) == () and other == 0:
+            return self
+        return self.copy().__iadd__(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if numerix.shape(other) == () and other == 0:
+            return self
+        return self + (-1) * other
+
+    def __isub__(self, other):
+        return self.__iadd__((-1) * other)
+
+    def __mul__(self, other):
+        if isinstance(other, _SparseMatrix):
+            raise NotImplementedError("Matrix-free operators cannot be multiplied together")
+        elif numerix.shape(other) == ():
+            result = _MatrixFreeMeshMatrix(mesh=self.mesh,
+                                           numberOfVariables=self.numberOfVariables,
+                                           numberOfEquations=self.numberOfEquations)
+            result._faces = [(offsets, IDs, tuple(other * c for c in coeffs))
+                             for offsets, IDs, coeffs in self._faces]
+            result._diagonals = [(offsets, other * vector)
+                                 for offsets, vector in self._diagonals]
+            result._triplets = [(other * vector, id1, id2)
+                                for vector, id1, id2 in self._triplets]
+            return result
+        else:
+            return self.matvec(numerix.asarray(other))
+
+    def __rmul__(self, other):
+        if numerix.shape(other) == ():
+            return self * other
+        else:
+            raise NotImplementedError
+
+    def __neg__(self):
+        return self * -1
+
+    def addAt(self, vector, id1, id2):
+        assert len(id1) == len(id2) == len(vector)
+
+        self._triplets.append((numerix.asarray(vector, dtype='d').ravel(),
+                               numerix.asarray(id1).ravel(),
+                               numerix.asarray(id2).ravel()))
+
+    def addAtDiagonal(self, vector):
+        if isinstance(vector, (int, float)):
+            vector = numerix.repeat(vector, self.mesh.numberOfCells)
+
+        self._diagonals.append((self._offsets, numerix.asarray(vector, dtype='d').ravel()))
+
+    @property
+    def _faceIDs(self):
+        """The cells on either side of each interior face of the mesh
+
+        They are forgotten, along with the rest of the topology of the
+        mesh, if its faces are connected.  Uniform grids, which don't
+        calculate their topology on demand, keep them as they are.
+        """
+        if not hasattr(self.mesh, '_matrixFreeFaceIDs'):
+            interiorFaces = numerix.nonzero(self.mesh.interiorFaces)[0]
+            self.mesh._matrixFreeFaceIDs = tuple(numerix.take(ids, interiorFaces)
+                                                 for ids in self.mesh._adjacentCellIDs)
+        return self.mesh._matrixFreeFaceIDs
+
+    def _addAtPattern(self, vector, key, ids):
+        """Keep the coefficients of scalar face and cell patterns
+
+        The four blocks of coefficients of the interior faces (see
+        `_addInteriorFaceCoefficients()`) are kept per face, as compactly
+        as `_faceCoefficients()` allows, with the IDs of the adjacent
+        cells kept by the mesh.  Cell patterns are diagonal.  Anything
+        else is kept as triplets.
+        """
+        vector = numerix.asarray(vector, dtype='d').ravel()
+
+        if key == ("interiorFaces", 1):
+            F = len(vector) // 4
+            self._faces.append((self._offsets,
+                                self._faceIDs,
+                                self._faceCoefficients(*[vector[i * F:(i + 1) * F]
+                                                         for i in range(4)])))
+        elif key == ("cells", 1):
+            self._diagonals.append((self._offsets, vector))
+        else:
+            rowOffset, colOffset = self._offsets
+            id1, id2 = ids()
+            self.addAt(vector, numerix.asarray(id1) + rowOffset, numerix.asarray(id2) + colOffset)
+
+    @staticmethod
+    def _faceCoefficients(c11, c12, c21, c22):
+        """Compact form of the coefficients of the interior faces
+
+        `c11`, `c12`, `c21`, and `c22` are the contributions of the cells
+        on either side of each face to the first and second cell.  If
+        the term is conservative, what leaves one cell enters the other,
+        so only the flux through the face, :math:`c_{11} x_1 + c_{12} x_2`,
+        is needed.  If the flux is driven by the difference between the
+        two cells, :math:`c_{12} (x_2 - x_1)`, one coefficient is enough.
+
+        >>> print(len(_MatrixFreeMeshMatrix._faceCoefficients(numerix.array((-1., -2.)),
+        ...                                                   numerix.array((1., 2.)),
+        ...                                                   numerix.array((1., 2.)),
+        ...                                                   numerix.array((-1., -2.)))))
+        1
+        >>> print(len(_MatrixFreeMeshMatrix._faceCoefficients(numerix.array((1., 0.)),
+        ...                                                   numerix.array((0., 1.)),
+        ...                                                   numerix.array((-1., 0.)),
+        ...                                                   numerix.array((0., -1.)))))
+        2
+        >>> print(len(_MatrixFreeMeshMatrix._faceCoefficients(numerix.array((1., 0.)),
+        ...                                                   numerix.array((0., 1.)),
+        ...                                                   numerix.array((0., 0.)),
+        ...                                                   numerix.array((1., 1.)))))
+        4
+        """
+        if numerix.array_equal(c21, -c11) and numerix.array_equal(c22, -c12):
+            if numerix.array_equal(c12, -c11):
+                return (numerix.array(c12),)
+            else:
+                return (numerix.array(c11), numerix.array(c12))
+        else:
+            return tuple(numerix.array(c) for c in (c11, c12, c21, c22))
+
+    @staticmethod
+    def _faceContributions(coeffs, x1, x2):
+        """Contributions of the faces to the first and second cells
+        """
+        if len(coeffs) == 1:
+            flux = coeffs[0] * (x2 - x1)
+            return flux, -flux
+        elif len(coeffs) == 2:
+            flux = coeffs[0] * x1 + coeffs[1] * x2
+            return flux, -flux
+        else:
+            c11, c12, c21, c22 = coeffs
+            return c11 * x1 + c12 * x2, c21 * x1 + c22 * x2
+
+    @staticmethod
+    def _faceDiagonals(coeffs):
+        """Diagonal coefficients of the faces for the first and second cells
+        """
+        if len(coeffs) == 1:
+            return -coeffs[0], -coeffs[0]
+        elif len(coeffs) == 2:
+            return coeffs[0], -coeffs[1]
+        else:
+            return coeffs[0], coeffs[3]
+
+    def matvec(self, x):
+        """Apply the operator to `x`, face by face and cell by cell
+        """
+        x = numerix.ravel(x)
+        N = self.mesh.numberOfCells
+        y = numerix.zeros(self._shape[0], dtype=numerix.result_type(x, 1.))
+
+        for (rowOffset, colOffset), (id1, id2), coeffs in self._faces:
+            xs = x[colOffset:colOffset + N]
+            to1, to2 = self._faceContributions(coeffs, numerix.take(xs, id1), numerix.take(xs, id2))
+            y[rowOffset:rowOffset + N] += (numerix.bincount(id1, weights=to1, minlength=N)
+                                           + numerix.bincount(id2, weights=to2, minlength=N))
+
+        for (rowOffset, colOffset), vector in self._diagonals:
+            n = len(vector)
+            y[rowOffset:rowOffset + n] += vector * x[colOffset:colOffset + n]
+
+        for vector, id1, id2 in self._triplets:
+            y += numerix.bincount(id1, weights=vector * numerix.take(x, id2), minlength=len(y))
+
+        return y
+
+    def takeDiagonal(self):
+        N = self.mesh.numberOfCells
+        diagonal = numerix.zeros(min(self._shape), 'd')
+
+        for (rowOffset, colOffset), (id1, id2), coeffs in self._faces:
+            if rowOffset == colOffset:
+                diagonal1, diagonal2 = self._faceDiagonals(coeffs)
+                diagonal[rowOffset:rowOffset + N] += (numerix.bincount(id1, weights=diagonal1, minlength=N)
+                                                      + numerix.bincount(id2, weights=diagonal2, minlength=N))
+
+        for (rowOffset, colOffset), vector in self._diagonals:
+            if rowOffset == colOffset:
+                diagonal[rowOffset:rowOffset + len(vector)] += vector
+
+        for vector, id1, id2 in self._triplets:
+            onDiagonal = (id1 == id2)
+            diagonal += numerix.bincount(id1[onDiagonal], weights=vector[onDiagonal],
+                                         minlength=len(diagonal))
+
+        return diagonal
+
+    def putDiagonal(self, vector):
+        if isinstance(vector, (int, float)):
+            vector = numerix.repeat(vector, min(self._shape))
+
+        self._diagonals.append(((0, 0), numerix.asarray(vector, dtype='d') - self.takeDiagonal()))
+
+    @property
+    def numpyArray(self):
+        return numerix.array([self.matvec(column)
+                              for column in numerix.identity(self._shape[1])]).T
+
+    def flush(self):
+        """Deletes the coefficients, unless they are to be cached
+        """
+        if not getattr(self, 'cache', False):
+            self._faces = []
+            self._diagonals = []
+            self._triplets = []
+
+class _MatrixFreeOperator(LinearOperator):
+    """`LinearOperator` of a `_MatrixFreeMeshMatrix`
+    """
+    def __init__(self, matrix):
+        self._meshMatrix = matrix
+        super(_MatrixFreeOperator, self).__init__(dtype=numerix.dtype('d'),
+                                                  shape=matrix._shape)
+
+    def _matvec(self, x):
+        return self._meshMatrix.matvec(x)
+
+    def diagonal(self):
+        return self._meshMatrix.takeDiagonal()
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
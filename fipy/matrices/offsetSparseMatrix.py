@@ -19,6 +19,11 @@ def OffsetSparseMatrix(SparseMatrix, numberOfVariables, numberOfEquations):
             SparseMatrix.__init__(self, mesh=mesh, bandwidth=bandwidth, sizeHint=sizeHint,
                                   numberOfVariables=numberOfVariables, numberOfEquations=numberOfEquations)
 
+        @property
+        def _offsets(self):
+            return (self.mesh.numberOfCells * self.equationIndex,
+                    self.mesh.numberOfCells * self.varIndex)
+
         def put(self, vector, id1, id2):
             SparseMatrix.put(self, vector, id1 + self.mesh.numberOfCells * self.equationIndex, id2 + self.mesh.numberOfCells * self.varIndex)
 
@@ -5,6 +5,7 @@ __docformat__ = 'restructuredtext'
 __all__ = []
 
 import scipy.sparse as sp
+from fipy.tools import instrumentation
 from fipy.tools import numerix
 
 from fipy.matrices.sparseMatrix import _SparseMatrix
@@ -30,6 +31,112 @@ class _ScipyMatrix(_SparseMatrix):
 
         super(_ScipyMatrix, self).__init__()
 
+    @property
+    def matrix(self):
+        """The internal SciPy matrix, including any pending contributions
+        """
+        if self._pending:
+            self._assemble()
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, matrix):
+        self._matrix = matrix
+        self._pending = []
+
+    @matrix.deleter
+    def matrix(self):
+        del self._matrix
+        self._pending = []
+
+    @property
+    def _sparsityPatterns(self):
+        """Storage for sparsity patterns that can be reused
+
+        Without a mesh, nothing is known to recur, so nothing is kept.
+        """
+        return {}
+
+    def _assemble(self):
+        """Add all pending contributions to the matrix in one pass
+
+        `addAt`, `_addAtPattern`, and `+=` of other `_ScipyMatrix` objects
+        only collect (row, column, value) triplets.  These are converted to
+        CSR format together, the first time the matrix is needed.  When all
+        contributions come from frozen sparsity patterns, the combined
+        pattern is cached as well, so the sum costs a single scatter of the
+        values.  The bands of a structured grid (see `_ScipyGridStencil`)
+        are summed, along with any contributions to the diagonal, and
+        copied into the CSR structure without any scatter at all.
+
+        >>> L = _ScipyMatrixFromShape(rows=3, cols=3)
+        >>> L.addAt([1., 2.], [0, 1], [0, 2])
+        >>> L.addAt([3., 4.], [0, 2], [0, 1])
+        >>> print(len(L._pending))
+        2
+        >>> print(L)
+         4.000000      ---        ---    
+            ---        ---     2.000000  
+            ---     4.000000      ---    
+        >>> print(len(L._pending))
+        0
+        """
+        with instrumentation._timed("conversion"):
+            pending, self._pending = self._pending, []
+            shape = self._matrix.shape
+
+            bands = [(vector, ids) for key, vector, ids in pending
+                     if isinstance(ids, _ScipyGridStencil)]
+            if bands:
+                pending = [(key, vector, ids) for key, vector, ids in pending
+                           if not isinstance(ids, _ScipyGridStencil)]
+                stencil = bands[0][1]
+                band = numerix.array(bands[0][0])
+                for vector, ids in bands[1:]:
+                    band += vector
+
+                if all(key is not None and ids._isDiagonal for key, vector, ids in pending):
+                    for key, vector, ids in pending:
+                        band[stencil.center] += vector
+                    pending = []
+                    temp = stencil.fill(band)
+                else:
+                    pending.insert(0, (stencil.key, stencil.values(band), stencil.pattern))
+
+            if pending:
+                temp = self._assemblePending(pending, shape)
+
+            if self._matrix.nnz == 0:
+                self._matrix = temp
+            else:
+                self._matrix = self._matrix + temp
+
+    def _assemblePending(self, pending, shape):
+        """Convert pending triplets and sparsity patterns to a CSR matrix
+        """
+        keys = tuple(key for key, vector, ids in pending)
+        vector = numerix.concatenate([vector for key, vector, ids in pending])
+
+        if None not in keys:
+            if len(pending) == 1:
+                pattern = pending[0][2]
+            else:
+                patterns = self._sparsityPatterns
+                if keys not in patterns:
+                    patterns[keys] = _ScipySparsityPattern.union([ids for key, vector, ids in pending],
+                                                                 shape=shape)
+                pattern = patterns[keys]
+            temp = pattern.fill(vector)
+        else:
+            ids = [ids if key is None else ids.positions
+                   for key, vector, ids in pending]
+            temp = sp.csr_matrix((vector,
+                                  (numerix.concatenate([id1 for id1, id2 in ids]),
+                                   numerix.concatenate([id2 for id1, id2 in ids]))),
+                                 shape)
+
+        return temp
+
     def copy(self):
         return _ScipyMatrix(matrix=self.matrix.copy())
 
@@ -44,7 +151,16 @@ class _ScipyMatrix(_SparseMatrix):
         return self._iadd(other)
 
     def _iadd(self, other, sign=1):
-        if hasattr(other, "matrix"):
+        if (sign == 1
+            and isinstance(other, _ScipyMatrix)
+            and other._matrix.shape == self._matrix.shape):
+            # defer the addition, so that all the contributions to a
+            # (coupled) matrix are assembled together
+            self._pending = self._pending + other._pending
+            if other._matrix.nnz > 0:
+                coo = other._matrix.tocoo()
+                self._pending.append((None, coo.data, (coo.row, coo.col)))
+        elif hasattr(other, "matrix"):
             self.matrix = self.matrix + (sign * other.matrix)
         elif isinstance(other, (float, int)):
             fillVec = numerix.repeat(other, self.matrix.nnz)
@@ -157,7 +273,7 @@ class _ScipyMatrix(_SparseMatrix):
 
     @property
     def _shape(self):
-        return self.matrix.shape
+        return self._matrix.shape
 
     @property
     def _range(self):
@@ -246,19 +362,33 @@ class _ScipyMatrix(_SparseMatrix):
             12.300000  10.000000   3.000000  
                 ---     3.141593   2.960000  
              2.500000      ---     2.200000  
+
+        The contributions are copied, as they are only added when the
+        matrix is next needed, so changing the arrays afterwards has no
+        effect
+
+            >>> L = _ScipyMatrixFromShape(rows=2, cols=2)
+            >>> v, ids = numerix.array([1., 2.]), numerix.array([0, 1])
+            >>> L.addAt(v, ids, ids)
+            >>> v[:] = 99.
+            >>> ids[:] = 0
+            >>> print(L)
+             1.000000      ---    
+                ---     2.000000  
         """
         assert len(id1) == len(id2) == len(vector)
 
-        temp = sp.csr_matrix((vector, (id1, id2)), self.matrix.shape)
-
-        self.matrix = self.matrix + temp
+        self._pending.append((None,
+                              numerix.array(vector, dtype='d').ravel(),
+                              (numerix.array(id1).ravel(),
+                               numerix.array(id2).ravel())))
 
     def addAtDiagonal(self, vector):
         if isinstance(vector, (int, float)):
             vector = numerix.repeat(vector, self._shape[0])
 
         ids = numerix.arange(len(vector))
-        self.addAt(vector, ids, ids)
+        self._addAtPattern(vector, key=("diagonal", len(vector)), ids=lambda: (ids, ids))
 
     @property
     def numpyArray(self):
@@ -429,6 +559,150 @@ class _ScipyBaseMeshMatrix(_ScipyMatrixFromShape):
                                                    matrix=matrix,
                                                    storeZeros=storeZeros)
 
+    def _addAtPattern(self, vector, key, ids):
+        """Add elements of `vector` using a sparsity pattern frozen on the mesh
+
+        The CSR structure and the scatter map from `vector` to the
+        nonzeros are computed the first time `key` is seen for this mesh,
+        matrix shape and block offset.  Subsequent calls only refill the
+        values.  The values are held until the matrix is assembled, along
+        with any other pending contributions.
+
+        Parameters
+        ----------
+        vector : array_like
+            The values to add.
+        key : tuple
+            Identifies the positions returned by `ids` for `self.mesh`.
+        ids : callable
+            Returns the row and column indices, (`id1`, `id2`), of `vector`.
+
+        Examples
+        --------
+
+        >>> from fipy import Grid1D
+        >>> from fipy.tools import serialComm
+        >>> mesh = Grid1D(nx=3, communicator=serialComm)
+        >>> ids = lambda: ([0, 1, 1, 0, 2], [0, 1, 0, 0, 2])
+        >>> L = _ScipyMeshMatrix(mesh=mesh)
+        >>> L._addAtPattern([1., 2., 3., 4., 5.], key=("test",), ids=ids)
+        >>> print(L)
+         5.000000      ---        ---    
+         3.000000   2.000000      ---    
+            ---        ---     5.000000  
+        >>> L = _ScipyMeshMatrix(mesh=mesh)
+        >>> L._addAtPattern([2., 4., 6., 8., 10.], key=("test",), ids=None)
+        >>> L._addAtPattern([1., 1., 1., 1., 1.], key=("test",), ids=None)
+        >>> print(L)
+        12.000000      ---        ---    
+         7.000000   5.000000      ---    
+            ---        ---    11.000000  
+
+        The values are copied, so they can be changed before the matrix
+        is assembled
+
+        >>> L = _ScipyMeshMatrix(mesh=mesh)
+        >>> v = numerix.array([1., 2., 3., 4., 5.])
+        >>> L._addAtPattern(v, key=("test",), ids=None)
+        >>> v[:] = 99.
+        >>> print(L)
+         5.000000      ---        ---    
+         3.000000   2.000000      ---    
+            ---        ---     5.000000  
+        """
+        rowOffset, colOffset = self._offsets
+        patternKey = (key, self._shape, rowOffset, colOffset)
+        patterns = self._sparsityPatterns
+
+        if patternKey not in patterns:
+            id1, id2 = ids()
+            patterns[patternKey] = _ScipySparsityPattern(id1=numerix.asarray(id1) + rowOffset,
+                                                         id2=numerix.asarray(id2) + colOffset,
+                                                         shape=self._shape)
+
+        self._pending.append((patternKey,
+                              numerix.array(vector, dtype='d').ravel(),
+                              patterns[patternKey]))
+
+    @property
+    def _gridStencil(self):
+        """Band structure of the interior faces, if the mesh is a structured grid
+
+        Only scalar, unshifted blocks use it.
+        """
+        N = self.mesh.numberOfCells
+        cellShape = self.mesh._gridCellShape
+        if (cellShape is None
+            or int(numerix.prod(cellShape)) != N
+            or self._offsets != (0, 0)
+            or self._shape != (N, N)):
+            return None
+
+        patterns = self._sparsityPatterns
+        key = ("gridStencil", cellShape)
+        if key not in patterns:
+            patterns[key] = _ScipyGridStencil(cellShape=cellShape)
+        return patterns[key]
+
+    def _addAtGridStencil(self, coeffs):
+        """Add the coefficients of the interior faces of a structured grid
+
+        The coefficients are gathered into a band by `_ScipyGridStencil`
+        and held until the matrix is assembled.
+
+        Parameters
+        ----------
+        coeffs : tuple
+            The 'cell 1 diag', 'cell 1 offdiag', 'cell 2 offdiag' and
+            'cell 2 diag' coefficients at every face of the mesh.
+
+        Examples
+        --------
+
+        >>> from fipy import Grid2D
+        >>> from fipy.tools import serialComm
+        >>> mesh = Grid2D(nx=3, ny=2, communicator=serialComm)
+        >>> c = numerix.arange(mesh.numberOfFaces, dtype=float)
+        >>> coeffs = (c + 1, -c, 10 * c, c + 2)
+        >>> id1, id2 = mesh._adjacentCellIDs
+        >>> interiorFaces = numerix.nonzero(mesh.interiorFaces)[0]
+        >>> id1 = numerix.take(id1, interiorFaces)
+        >>> id2 = numerix.take(id2, interiorFaces)
+        >>> L1 = _ScipyMeshMatrix(mesh=mesh)
+        >>> for coeff, rows, cols in zip(coeffs,
+        ...                              (id1, id1, id2, id2),
+        ...                              (id1, id2, id1, id2)):
+        ...     L1.addAt(numerix.take(coeff, interiorFaces), rows, cols)
+        >>> L2 = _ScipyMeshMatrix(mesh=mesh)
+        >>> L2._addAtGridStencil(coeffs)
+        >>> print(numerix.allequal(L1.numpyArray, L2.numpyArray))
+        True
+
+        Contributions to the diagonal are added to the band
+
+        >>> L1.addAtDiagonal(numerix.arange(6.))
+        >>> L2 = _ScipyMeshMatrix(mesh=mesh)
+        >>> L2._addAtGridStencil(coeffs)
+        >>> L2.addAtDiagonal(numerix.arange(6.))
+        >>> print(len(L2._pending))
+        2
+        >>> print(numerix.allequal(L1.numpyArray, L2.numpyArray))
+        True
+        """
+        stencil = self._gridStencil
+        self._pending.append((stencil.key, stencil.band(*coeffs), stencil))
+
+    @property
+    def _sparsityPatterns(self):
+        """Sparsity patterns frozen on the mesh
+
+        They are forgotten, along with the rest of the topology of the
+        mesh, if its faces are connected.
+        """
+        if not hasattr(self.mesh, '_sparsityPatterns'):
+            self.mesh._sparsityPatterns = {}
+        return self.mesh._sparsityPatterns
+
     def _getGhostedValues(self, var):
         """Obtain current ghost values from across processes
 
@@ -589,6 +863,262 @@ class _ScipyMeshMatrix(_ScipyRowMeshMatrix):
         """
         pass
 
+class _ScipySparsityPattern(object):
+    """Frozen CSR structure of a set of (possibly repeated) matrix positions
+
+    Duplicated positions are summed by `fill`, as they are by `addAt`.
+    """
+    def __init__(self, id1, id2, shape):
+        """Creates a `_ScipySparsityPattern`.
+
+        Parameters
+        ----------
+        id1 : array_like of int
+            The row indices.
+        id2 : array_like of int
+            The column indices.
+        shape : tuple of int
+            The shape of the matrix.
+        """
+        rows, cols = shape
+        keys = (numerix.asarray(id1, dtype='int64').ravel() * cols
+                + numerix.asarray(id2, dtype='int64').ravel())
+        keys, self.scatter = numerix.unique(keys, return_inverse=True)
+
+        rowCounts = numerix.bincount(keys // cols, minlength=rows)
+
+        if max(len(keys), cols) < numerix.iinfo('int32').max:
+            indexType = 'int32'
+        else:
+            indexType = 'int64'
+
+        self.indptr = numerix.concatenate(([0], numerix.cumsum(rowCounts))).astype(indexType)
+        self.indices = (keys % cols).astype(indexType)
+        self.shape = shape
+
+    @classmethod
+    def union(cls, patterns, shape):
+        """Combine patterns, such that their values can be filled together
+
+        Parameters
+        ----------
+        patterns : list of ~fipy.matrices.scipyMatrix._ScipySparsityPattern
+            The patterns to combine, in the order their values will be
+            concatenated.
+        shape : tuple of int
+            The shape of the matrix.
+
+        Returns
+        -------
+        ~fipy.matrices.scipyMatrix._ScipySparsityPattern
+
+        Examples
+        --------
+
+        >>> pattern1 = _ScipySparsityPattern(id1=[2, 0, 2], id2=[1, 0, 1], shape=(3, 3))
+        >>> pattern2 = _ScipySparsityPattern(id1=[0, 1], id2=[0, 2], shape=(3, 3))
+        >>> union = _ScipySparsityPattern.union([pattern1, pattern2], shape=(3, 3))
+        >>> print(union.fill([1., 2., 3., 4., 5.]).toarray())
+        [[ 6.  0.  0.]
+         [ 0.  0.  5.]
+         [ 0.  4.  0.]]
+        """
+        rows = numerix.concatenate([pattern._rows for pattern in patterns])
+        cols = numerix.concatenate([pattern.indices for pattern in patterns])
+        union = cls(id1=rows, id2=cols, shape=shape)
+
+        offsets = numerix.cumsum([0] + [len(pattern.indices) for pattern in patterns[:-1]])
+        union.scatter = union.scatter[numerix.concatenate([pattern.scatter + offset
+                                                           for pattern, offset
+                                                           in zip(patterns, offsets)])]
+
+        return union
+
+    @property
+    def _rows(self):
+        """Row index of each nonzero
+        """
+        return numerix.repeat(numerix.arange(self.shape[0]), numerix.diff(self.indptr))
+
+    @property
+    def _isDiagonal(self):
+        """Whether the values of the pattern are the diagonal of the matrix, in order
+        """
+        if not hasattr(self, '_diagonal'):
+            rows, cols = self.shape
+            ids = numerix.arange(rows)
+            self._diagonal = (rows == cols == len(self.scatter) == len(self.indices)
+                              and numerix.array_equal(self.scatter, ids)
+                              and numerix.array_equal(self.indices, ids)
+                              and numerix.array_equal(self.indptr, numerix.arange(rows + 1)))
+        return self._diagonal
+
+    @property
+    def positions(self):
+        """Row and column indices of each of the values of the pattern
+        """
+        return (self._rows[self.scatter], self.indices[self.scatter])
+
+    def fill(self, vector):
+        """Assemble a matrix with this structure from `vector`
+
+        Parameters
+        ----------
+        vector : array_like
+            The values at each of the positions of the pattern.
+
+        Returns
+        -------
+        ~scipy.sparse.csr_matrix
+
+        Examples
+        --------
+
+        >>> pattern = _ScipySparsityPattern(id1=[2, 0, 2, 0], id2=[1, 0, 1, 2], shape=(3, 3))
+        >>> print(pattern.fill([1., 2., 3., 4.]).toarray())
+        [[ 2.  0.  4.]
+         [ 0.  0.  0.]
+         [ 0.  4.  0.]]
+        """
+        data = numerix.bincount(self.scatter,
+                                weights=numerix.asarray(vector, dtype='d').ravel(),
+                                minlength=len(self.indices))
+        matrix = sp.csr_matrix((data, self.indices.copy(), self.indptr.copy()),
+                               shape=self.shape, copy=False)
+        matrix.has_sorted_indices = True
+
+        return matrix
+
+class _ScipyGridStencil(object):
+    """Band structure of the interior faces of a structured grid
+
+    Each cell of a structured grid is only coupled to its neighbors on
+    either side along each axis, at fixed offsets in the numbering of the
+    cells.  The coefficients of the interior faces are summed into a
+    band, with one row per offset, from slices of the face arrays.
+    The band is copied into the fixed CSR structure with a single `take`,
+    so no index arrays are needed beyond those computed once per mesh.
+
+    >>> stencil = _ScipyGridStencil(cellShape=(2, 3))
+    >>> print(stencil.offsets)
+    [-3 -1  0  1  3]
+    >>> print(stencil.pattern.fill(numerix.ones(len(stencil.pattern.indices))).toarray())
+    [[ 1.  1.  0.  1.  0.  0.]
+     [ 1.  1.  1.  0.  1.  0.]
+     [ 0.  1.  1.  0.  0.  1.]
+     [ 1.  0.  0.  1.  1.  0.]
+     [ 0.  1.  0.  1.  1.  1.]
+     [ 0.  0.  1.  0.  1.  1.]]
+    """
+    def __init__(self, cellShape):
+        """Creates a `_ScipyGridStencil`.
+
+        Parameters
+        ----------
+        cellShape : tuple of int
+            The shape of the array of cells, slowest axis first (see
+            `_gridCellShape`).
+        """
+        self.cellShape = tuple(cellShape)
+        dim = len(self.cellShape)
+        N = int(numerix.prod(self.cellShape))
+        self.shape = (N, N)
+        self.key = (("gridStencil",), self.shape, 0, 0)
+
+        # the lower neighbor along `axis` is at row `axis` of the band,
+        # the cell itself at row `dim`, and the upper neighbor at
+        # row `2 * dim - axis`
+        strides = [int(numerix.prod(self.cellShape[axis + 1:])) for axis in range(dim)]
+        self.offsets = numerix.array([-stride for stride in strides] + [0] + strides[::-1])
+        self.center = dim
+
+        self._faceBlocks = []
+        start = 0
+        for axis in range(dim):
+            blockShape = list(self.cellShape)
+            blockShape[axis] += 1
+            size = int(numerix.prod(blockShape))
+            self._faceBlocks.append((slice(start, start + size), tuple(blockShape)))
+            start += size
+
+        valid = numerix.ones((len(self.offsets),) + self.cellShape, dtype=bool)
+        for axis in range(dim):
+            valid[(axis,) + self._cells(axis, 0)] = False
+            valid[(2 * dim - axis,) + self._cells(axis, -1)] = False
+        gather = numerix.nonzero(valid.ravel())[0]
+        rows = gather % N
+        cols = rows + self.offsets[gather // N]
+        self.pattern = _ScipySparsityPattern(id1=rows, id2=cols, shape=self.shape)
+
+        # gather the band directly in the order of the nonzeros
+        self._gather = gather[numerix.argsort(self.pattern.scatter)]
+        self.pattern.scatter = numerix.arange(len(gather))
+
+    def _cells(self, axis, index):
+        """Index of the cells at `index` along `axis`
+        """
+        cells = [slice(None)] * len(self.cellShape)
+        cells[axis] = index
+        return tuple(cells)
+
+    def band(self, c11, c12, c21, c22):
+        """Sum the coefficients of the interior faces into a band
+
+        Parameters
+        ----------
+        c11, c12, c21, c22 : array_like
+            The 'cell 1 diag', 'cell 1 offdiag', 'cell 2 offdiag' and
+            'cell 2 diag' coefficients at every face of the mesh.
+
+        Returns
+        -------
+        ndarray
+            The coefficients coupling each cell to each of `offsets`, one
+            row per offset.
+        """
+        band = numerix.zeros((len(self.offsets),) + self.cellShape, 'd')
+        coeffs = [numerix.asarray(coeff, dtype='d').ravel() for coeff in (c11, c12, c21, c22)]
+        dim = len(self.cellShape)
+
+        for axis, (faces, blockShape) in enumerate(self._faceBlocks):
+            interior = self._cells(axis, slice(1, -1))
+            c11, c12, c21, c22 = [coeff[faces].reshape(blockShape)[interior]
+                                  for coeff in coeffs]
+            lower = self._cells(axis, slice(None, -1))
+            upper = self._cells(axis, slice(1, None))
+            band[(self.center,) + lower] += c11
+            band[(self.center,) + upper] += c22
+            band[(2 * dim - axis,) + lower] = c12
+            band[(axis,) + upper] = c21
+
+        return band.reshape((len(self.offsets), self.shape[0]))
+
+    def values(self, band):
+        """The values of `band` at each of the nonzeros of `pattern`
+        """
+        return band.ravel().take(self._gather)
+
+    def fill(self, band):
+        """Assemble a matrix from `band`
+
+        Parameters
+        ----------
+        band : ndarray
+            The coefficients coupling each cell to each of `offsets`, one
+            row per offset.
+
+        Returns
+        -------
+        ~scipy.sparse.csr_matrix
+        """
+        matrix = sp.csr_matrix((self.values(band),
+                                self.pattern.indices.copy(),
+                                self.pattern.indptr.copy()),
+                               shape=self.shape, copy=False)
+        matrix.has_sorted_indices = True
+
+        return matrix
+
 class _ScipyIdentityMatrix(_ScipyMatrixFromShape):
     """
     Represents a sparse identity matrix for scipy.
@@ -117,6 +117,42 @@ class _SparseMatrix(object):
     def addAtDiagonal(self, vector):
         raise NotImplementedError
 
+    _offsets = (0, 0)
+
+    def _addAtPattern(self, vector, key, ids):
+        """Add elements of `vector` at positions that only depend on `key`
+
+        Subclasses that can freeze a sparsity pattern override this to
+        compute the structure and the scatter map from `vector` to the
+        nonzeros once, and then only refill the values on later calls.
+
+        Parameters
+        ----------
+        vector : array_like
+            The values to add.
+        key : tuple
+            Identifies the positions returned by `ids` for `self.mesh`.
+        ids : callable
+            Returns the row and column indices, (`id1`, `id2`), of `vector`.
+        """
+        id1, id2 = ids()
+        self.addAt(vector, id1, id2)
+
+    _gridStencil = None
+
+    def _addAtGridStencil(self, coeffs):
+        """Add the coefficients of the interior faces of a structured grid
+
+        Only called when `_gridStencil` is not `None`.
+
+        Parameters
+        ----------
+        coeffs : tuple
+            The 'cell 1 diag', 'cell 1 offdiag', 'cell 2 offdiag' and
+            'cell 2 diag' coefficients at every face of the mesh.
+        """
+        raise NotImplementedError
+
     def exportMmf(self, filename):
         raise NotImplementedError
 
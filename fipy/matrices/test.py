@@ -10,7 +10,7 @@ if solver == 'trilinos':
 elif solver == 'no-pysparse':
     docTestModuleNames = ('trilinosMatrix',)
 elif solver == 'scipy' or solver == 'pyamg':
-    docTestModuleNames = ('scipyMatrix',)
+    docTestModuleNames = ('scipyMatrix', 'matrixFreeMatrix')
 elif solver == 'pysparse':
     docTestModuleNames = ('pysparseMatrix',)
 elif solver == 'pyamgx':
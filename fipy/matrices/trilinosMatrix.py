@@ -798,6 +798,29 @@ class _TrilinosBaseMeshMatrix(_TrilinosMatrixFromShape):
                                                       sizeHint=sizeHint,
                                                       matrix=matrix)
 
+    def _meshCached(self, key, create):
+        """Obtain an Epetra object shared by all matrices on this mesh
+
+        `Epetra.Map` and `Epetra.Import` objects only depend on the
+        distribution of the mesh and on the number of equations and
+        variables, but their construction requires communication between
+        processes.  They are built once and then kept with the mesh, so
+        that new matrices, solves, and vectors can reuse them.
+
+        Parameters
+        ----------
+        key : tuple
+            Identifies the object among those cached for the mesh.
+        create : function
+            Builds the object, if it has not been cached yet.
+        """
+        if not hasattr(self.mesh, "_trilinosCache"):
+            self.mesh._trilinosCache = {}
+        cache = self.mesh._trilinosCache
+        if key not in cache:
+            cache[key] = create()
+        return cache[key]
+
     @property
     def rowMap(self):
         comm = self.mesh.communicator.epetra_comm
@@ -927,7 +950,8 @@ class _TrilinosRowMeshMatrix(_TrilinosBaseMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalNonOverlappingRowIDs), 0, comm)
+        return self._meshCached(("nonOverlappingRowMap", self._m2m.numberOfEquations),
+                                lambda: Epetra.Map(-1, list(self._m2m.globalNonOverlappingRowIDs), 0, comm))
 
     @property
     def domainMap(self):
@@ -976,7 +1000,8 @@ class _TrilinosColMeshMatrix(_TrilinosBaseMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalOverlappingColIDs), 0, comm)
+        return self._meshCached(("overlappingColMap", self._m2m.numberOfVariables),
+                                lambda: Epetra.Map(-1, list(self._m2m.globalOverlappingColIDs), 0, comm))
 
     @property
     def domainMap(self):
@@ -988,7 +1013,8 @@ class _TrilinosColMeshMatrix(_TrilinosBaseMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalNonOverlappingColIDs), 0, comm)
+        return self._meshCached(("nonOverlappingColMap", self._m2m.numberOfVariables),
+                                lambda: Epetra.Map(-1, list(self._m2m.globalNonOverlappingColIDs), 0, comm))
 
 class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
     def __init__(self, mesh, numberOfVariables=1, numberOfEquations=1,
@@ -1030,7 +1056,17 @@ class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
         comm = self.mesh.communicator.epetra_comm
         # Epetra.Map(numGlobalElements, myGlobalElements, indexBase, comm)
         # Specify -1 to have the constructor compute the number of global elements.
-        return Epetra.Map(-1, list(self._m2m.globalOverlappingColIDs), 0, comm)
+        return self._meshCached(("overlappingColMap", self._m2m.numberOfVariables),
+                                lambda: Epetra.Map(-1, list(self._m2m.globalOverlappingColIDs), 0, comm))
+
+    @property
+    def _overlappingImporter(self):
+        """`Epetra.Import` from the `domainMap` to the ghosted `colMap`
+        """
+        return self._meshCached(("overlappingImport",
+                                 self._m2m.numberOfEquations,
+                                 self._m2m.numberOfVariables),
+                                lambda: Epetra.Import(self.colMap, self.domainMap))
 
     def asTrilinosMeshMatrix(self):
         self.finalize()
@@ -1054,8 +1090,7 @@ class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
 
         overlapping_result = Epetra.Vector(self.colMap)
         overlapping_result.Import(nonoverlapping_result,
-                                  Epetra.Import(self.colMap,
-                                                self.domainMap),
+                                  self._overlappingImporter,
                                   Epetra.Insert)
 
         return overlapping_result
@@ -1136,8 +1171,7 @@ class _TrilinosMeshMatrix(_TrilinosRowMeshMatrix):
                     if other_map.SameAs(self.colMap):
                         overlapping_result = Epetra.Vector(self.colMap)
                         overlapping_result.Import(nonoverlapping_result,
-                                                  Epetra.Import(self.colMap,
-                                                                self.domainMap),
+                                                  self._overlappingImporter,
                                                   Epetra.Insert)
 
                         return overlapping_result
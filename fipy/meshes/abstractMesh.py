@@ -64,6 +64,13 @@ class AbstractMesh(object):
     def getNearestCell(self, point):
         return self._getCellsByID([self._getNearestCellID(point)])[0]
 
+    def _getContainingCellID(self, points):
+        """Return the IDs of the cells that contain `points`.
+
+        For a uniform grid, this is the cell with the nearest center.
+        """
+        return self._getNearestCellID(points)
+
     def _getCellFaceIDsInternal(self):
         return self._cellFaceIDs
 
@@ -87,6 +94,18 @@ class AbstractMesh(object):
     def _isOrthogonal(self):
         return self.topology._isOrthogonal
 
+    @property
+    def _gridCellShape(self):
+        """Shape of the array of cells, slowest axis first, if the cells and
+        faces are numbered like those of a structured grid, otherwise `None`.
+
+        The faces of a structured grid are numbered in blocks, one for
+        each axis, in the same order as the cells.  The block of faces
+        normal to an axis has the shape of the cells, with one more face
+        than cells along that axis.
+        """
+        return None
+
     """Geometry properties"""
 
     @property
@@ -914,6 +933,149 @@ class AbstractMesh(object):
     def _cellAreaProjections(self):
         return self._cellNormals * self._cellAreas
 
+    """Compressed connectivity
+
+    The faces of all the cells are listed one cell after another in
+    `_cellFaceIndices`, with the orientation of each face, with respect to
+    its cell, in `_cellFaceOrientations`.  The faces of cell `i` are
+    ``_cellFaceIndices[_cellFaceOffsets[i]:_cellFaceOffsets[i+1]]``.
+    Unlike `cellFaceIDs`, there is no padding to mask."""
+
+    def _sumOverCellFaces(self, values):
+        """Sum `values`, listed like `_cellFaceIndices`, over the faces of each cell
+
+        >>> from fipy import Grid2D, Tri2D
+        >>> mesh = Grid2D(nx=2, ny=1) + (Tri2D(nx=1, ny=1) + [[2], [0]]) # doctest: +SERIAL
+        >>> print(numerix.diff(mesh._cellFaceOffsets)) # doctest: +SERIAL
+        [4 4 3 3 3 3]
+        >>> ones = numerix.ones(len(mesh._cellFaceIndices))
+        >>> print(mesh._sumOverCellFaces(ones)) # doctest: +SERIAL
+        [ 4.  4.  3.  3.  3.  3.]
+
+        The sum of the outward area projections around each cell is zero
+
+        >>> areaProjections = numerix.take(mesh._areaProjections,
+        ...                                mesh._cellFaceIndices, axis=1)
+        >>> print(numerix.allclose(mesh._sumOverCellFaces(areaProjections
+        ...                                               * mesh._cellFaceOrientations),
+        ...                        0.)) # doctest: +SERIAL
+        True
+        """
+        offsets = self._cellFaceOffsets
+        if len(self._cellFaceIndices) == 0:
+            return numerix.zeros(numerix.shape(values)[:-1] + (len(offsets) - 1,),
+                                 dtype=numerix.asarray(values).dtype)
+        return numerix.add.reduceat(values, offsets[:-1], axis=-1)
+
+    @property
+    def _leastSquaresGradMatrix(self):
+        """Geometry of the least-squares cell gradient, built on first use.
+
+        Returns the displacements to the neighbors of each cell, the
+        adjugate of the normal matrix of each cell and its determinant.
+        The least-squares gradient is the product of the adjugate with the
+        displacement-weighted differences to the neighbors, divided by the
+        determinant.
+
+        >>> from fipy.meshes import Grid2D, Grid3D, Tri2D
+        >>> from fipy.meshes.mesh import Mesh
+        >>> from fipy.tools import numerix
+        >>> from fipy.tools.numerix import MA
+
+        Cells with fewer faces than `_maxFacesPerCell`, such as the
+        triangles joined to a grid or the pyramid on top of a cube,
+
+        >>> x, y, z = numerix.indices((2, 2, 2)).reshape((3, -1), order='F')
+        >>> vertices = numerix.concatenate((numerix.array((x, y, z), 'd'),
+        ...                                 [[0.5], [0.5], [2.]]), axis=1)
+        >>> faces = MA.masked_values([[0, 4, 0, 2, 0, 1, 4, 5, 7, 6],
+        ...                           [1, 5, 1, 3, 2, 3, 5, 7, 6, 4],
+        ...                           [3, 7, 5, 7, 6, 7, 8, 8, 8, 8],
+        ...                           [2, 6, 4, 6, 4, 5, -1, -1, -1, -1]], -1)
+        >>> cells = MA.masked_values([[0, 1], [1, 6], [2, 7], [3, 8], [4, 9], [5, -1]], -1)
+        >>> meshes = (Grid2D(dx=(1., 2.), dy=(1., 3., 2.)),
+        ...           Grid3D(dx=(1., 2.), dy=(1., 3.), dz=(2., 1.)),
+        ...           Grid2D(nx=2, ny=2) + (Tri2D(nx=2, ny=2) + [[2], [0]]),
+        ...           Mesh(vertexCoords=vertices, faceVertexIDs=faces, cellFaceIDs=cells))
+
+        have normal matrices summed over their own faces only
+
+        >>> for mesh in meshes:
+        ...     distanceNormals, adjugate, determinant = mesh._leastSquaresGradMatrix
+        ...     normal = numerix.sum(distanceNormals[:, numerix.newaxis]
+        ...                          * distanceNormals[numerix.newaxis], axis=2)
+        ...     identity = numerix.einsum('ijn,jkn->ikn', adjugate, normal) / determinant
+        ...     print(numerix.allclose(identity,
+        ...                            numerix.identity(mesh.dim)[..., numerix.newaxis]))
+        True
+        True
+        True
+        True
+
+        so the gradient is the same as solving the least-squares problem of
+        each cell in turn
+
+        >>> from fipy.variables.cellVariable import CellVariable
+        >>> for mesh in meshes:
+        ...     x = mesh.cellCenters
+        ...     var = CellVariable(mesh=mesh, value=numerix.sum(x**2, axis=0) + x[0] * x[1])
+        ...     grad = numerix.array(var.leastSquaresGrad)
+        ...     distanceNormals = mesh._cellToCellDistances * mesh._cellNormals
+        ...     differences = MA.filled(numerix.take(numerix.array(var), mesh._cellToCellIDs)
+        ...                             - numerix.array(var), 0.)
+        ...     solved = []
+        ...     for cell in range(mesh.numberOfCells):
+        ...         faces = ~MA.getmaskarray(mesh.cellFaceIDs[:, cell])
+        ...         d = MA.getdata(distanceNormals)[:, faces, cell]
+        ...         solved.append(numerix.linalg.solve(d.dot(d.T),
+        ...                                            d.dot(differences[faces, cell])))
+        ...     print(numerix.allclose(grad, numerix.transpose(solved)))
+        True
+        True
+        True
+        True
+        """
+        if not hasattr(self, "_leastSquaresDistanceNormals"):
+            (self._leastSquaresDistanceNormals,
+             self._leastSquaresAdjugate,
+             self._leastSquaresDeterminant) = self._calcLeastSquaresGradMatrix()
+
+        return (self._leastSquaresDistanceNormals,
+                self._leastSquaresAdjugate,
+                self._leastSquaresDeterminant)
+
+    def _calcLeastSquaresGradMatrix(self):
+        # the padded faces of cells with fewer than `_maxFacesPerCell`
+        # faces must contribute nothing
+        distanceNormals = numerix.MA.filled(self._cellToCellDistances
+                                            * self._cellNormals, 0.)
+        # sum of the outer products of the displacements over the faces
+        d = distanceNormals
+        m = numerix.sum(d[:, numerix.newaxis] * d[numerix.newaxis], axis=2)
+
+        if self.dim == 1:
+            adjugate = numerix.ones_like(m)
+            determinant = m[0, 0]
+        elif self.dim == 2:
+            adjugate = numerix.array([[m[1, 1], -m[0, 1]],
+                                      [-m[1, 0], m[0, 0]]])
+            determinant = m[0, 0] * m[1, 1] - m[0, 1] * m[1, 0]
+        else:
+            adjugate = numerix.array([[m[1, 1] * m[2, 2] - m[1, 2] * m[2, 1],
+                                       m[0, 2] * m[2, 1] - m[0, 1] * m[2, 2],
+                                       m[0, 1] * m[1, 2] - m[0, 2] * m[1, 1]],
+                                      [m[1, 2] * m[2, 0] - m[1, 0] * m[2, 2],
+                                       m[0, 0] * m[2, 2] - m[0, 2] * m[2, 0],
+                                       m[0, 2] * m[1, 0] - m[0, 0] * m[1, 2]],
+                                      [m[1, 0] * m[2, 1] - m[1, 1] * m[2, 0],
+                                       m[0, 1] * m[2, 0] - m[0, 0] * m[2, 1],
+                                       m[0, 0] * m[1, 1] - m[0, 1] * m[1, 0]]])
+            determinant = (m[0, 0] * adjugate[0, 0]
+                           + m[0, 1] * adjugate[1, 0]
+                           + m[0, 2] * adjugate[2, 0])
+
+        return distanceNormals, adjugate, determinant
+
     """
     Special methods
     """
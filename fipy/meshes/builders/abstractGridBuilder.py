@@ -17,7 +17,7 @@ class _AbstractGridBuilder(object):
     NumPtsCalcClass = None
 
     def buildGridData(self, ds, ns, overlap, communicator,
-                            cacheOccupiedNodes=False):
+                            cacheOccupiedNodes=False, partition=None):
         """
         Build and save any information relevant to the construction of a grid.
         Generalized to handle any dimension. Has side-effects.
@@ -41,8 +41,39 @@ class _AbstractGridBuilder(object):
             Spacing in each grid direction, e.g. `[dx, dy]`
         ns : list
             Number of grid spacings in each direction, e.g. `[nx, ny]`
-        offset : list
-            Displacement of grid spacings, e.g., `[Ox, Oy]`
+        overlap : int
+            Number of overlapping cells for parallel simulations
+        communicator : ~fipy.tools.comms.commWrapper.CommWrapper
+            Object with `procID` and `Nproc` attributes
+        cacheOccupiedNodes : bool
+            Whether to store the number of processes that hold cells
+        partition : tuple of int or str, optional
+            Number of processes along each grid direction, e.g.,
+            `(px, py, pz)`, whose product must be `Nproc`.  If `"auto"`,
+            `Nproc` is factored to minimize the number of cut faces
+            between processes.  Default (`None`) partitions only the last
+            grid direction into slabs.
+
+        Process 5 of 12 holds the top right block of the front layer of a
+        `(2, 3, 2)` process grid, so it overlaps its neighbors to the left,
+        bottom, and back
+
+        >>> from fipy.meshes.builders import _Grid3DBuilder
+        >>> from fipy.meshes.builders.utilityClasses import _UniformNumPts
+        >>> class _Comm(object):
+        ...     procID, Nproc = 5, 12
+        >>> gb = _Grid3DBuilder()
+        >>> gb.NumPtsCalcClass = _UniformNumPts
+        >>> gb.buildGridData([1., 1., 1.], [10, 10, 10], 2, _Comm(),
+        ...                  partition=(2, 3, 2))
+        >>> print(gb.globalShape)
+        (10, 10, 10)
+        >>> print(gb.ns)
+        (7, 6, 7)
+        >>> print(gb.offset)
+        (3, 4, 0)
+        >>> print(sorted(gb.overlap.items()))
+        [('back', 2), ('bottom', 2), ('front', 0), ('left', 2), ('right', 0), ('top', 0)]
         """
 
         dim = len(ns)
@@ -83,28 +114,40 @@ class _AbstractGridBuilder(object):
         procID = communicator.procID
         Nproc = communicator.Nproc
 
-        overlap = min(overlap, newNs[-1])
-        cellsPerNode = max(newNs[-1] // Nproc, overlap)
-        occupiedNodes = min(newNs[-1] // (cellsPerNode or 1), Nproc)
+        partition = self._calcPartition(newNs, Nproc, partition)
+        procIDs = self._calcProcIDs(procID, partition)
 
-        (firstOverlap,
-         secOverlap,
-         overlap) = self._buildOverlap(overlap, procID, occupiedNodes)
+        overlaps = [min(overlap, n) for n in newNs]
+        cellsPerNode = [max(n // nodes, o) for n, nodes, o
+                        in zip(newNs, partition, overlaps)]
+        occupiedNodes = [min(n // (cpn or 1), nodes) for n, cpn, nodes
+                         in zip(newNs, cellsPerNode, partition)]
 
-        offsetArg = min(procID, occupiedNodes-1) * cellsPerNode - firstOverlap
-        offset = self._packOffset(offsetArg)
+        (firstOverlaps,
+         secOverlaps,
+         overlap) = self._buildOverlap(overlaps, procIDs, occupiedNodes)
+
+        offsetArgs = [min(pid, occupied - 1) * cpn - first
+                      for pid, occupied, cpn, first
+                      in zip(procIDs, occupiedNodes, cellsPerNode, firstOverlaps)]
+        offset = self._packOffset(offsetArgs)
 
         """
         local nx, [ny, [nz]] calculation
         """
-        local_n = cellsPerNode * (procID < occupiedNodes)
+        localNs = []
+        for n, pid, occupied, cpn, first, sec in zip(newNs, procIDs,
+                                                     occupiedNodes, cellsPerNode,
+                                                     firstOverlaps, secOverlaps):
+            local_n = cpn * (pid < occupied)
 
-        if procID == occupiedNodes - 1:
-            local_n += (newNs[-1] - cellsPerNode * occupiedNodes)
+            if pid == occupied - 1:
+                local_n += (n - cpn * occupied)
 
-        local_n += firstOverlap + secOverlap
+            localNs.append(local_n + first + sec)
 
-        newNs = tuple(newNs[:-1] + [local_n])
+        globalNs = tuple(newNs)
+        newNs = tuple(localNs)
 
         """
         post-parallel
@@ -136,6 +179,9 @@ class _AbstractGridBuilder(object):
         self.globalNumberOfCells = globalNumCells
         self.globalNumberOfFaces = globalNumFaces
 
+        self.globalShape = globalNs
+        self.partition = partition
+
         self.offset = offset
         self.overlap = overlap
 
@@ -144,7 +190,7 @@ class _AbstractGridBuilder(object):
         self.numberOfCells = numCells
 
         if cacheOccupiedNodes:
-            self.occupiedNodes = occupiedNodes
+            self.occupiedNodes = reduce(self._mult, occupiedNodes)
 
     @property
     def gridData(self):
@@ -200,7 +246,8 @@ class _AbstractGridBuilder(object):
         """
         Dimensionally independent face-number calculation.
 
-        >>> from fipy.meshes.builders import *
+        >>> from fipy.meshes.builders import (_Grid1DBuilder, _Grid2DBuilder,
+        ...                                   _Grid3DBuilder)
 
         >>> gb = _Grid1DBuilder()
         >>> gb._calcGlobalNumFaces([1])
@@ -244,9 +291,94 @@ class _AbstractGridBuilder(object):
     def _calcNs(self, ns, ds):
         return self.NumPtsCalcClass.calcNs(ns, ds)
 
-    def _buildOverlap(self, overlap, procID, occupiedNodes):
-        (first, sec) = (overlap * (procID > 0) * (procID < occupiedNodes),
-                        overlap * (procID < occupiedNodes - 1))
+    def _calcPartition(self, ns, Nproc, partition):
+        """
+        Determine the number of processes along each grid direction.
+
+        >>> from fipy.meshes.builders import _Grid3DBuilder
+
+        >>> gb3 = _Grid3DBuilder()
+        >>> print(gb3._calcPartition([10, 10, 10], 8, None))
+        (1, 1, 8)
+        >>> print(gb3._calcPartition([10, 10, 10], 8, (2, 4, 1)))
+        (2, 4, 1)
+        >>> print(gb3._calcPartition([10, 10, 10], 8, "auto"))
+        (2, 2, 2)
+        >>> print(gb3._calcPartition([10, 10, 40], 8, "auto"))
+        (1, 1, 8)
+        >>> print(gb3._calcPartition([10, 20, 10], 12, "auto"))
+        (2, 3, 2)
+        >>> print(gb3._calcPartition([10, 10, 10], 8, (2, 2)))
+        Traceback (most recent call last):
+            ...
+        ValueError: partition (2, 2) does not decompose 8 processes in 3 dimensions
+        """
+        dim = len(ns)
+
+        if partition is None:
+            return (1,) * (dim - 1) + (Nproc,)
+        elif partition == "auto":
+            if 0 in ns:
+                return (1,) * (dim - 1) + (Nproc,)
+
+            numberOfCells = reduce(self._mult, ns)
+
+            def cost(factors):
+                # avoid starving processes of cells, then minimize the
+                # number of faces cut by the process boundaries
+                return (sum(p > n for p, n in zip(factors, ns)),
+                        sum((p - 1) * (numberOfCells // n)
+                            for p, n in zip(factors, ns)))
+
+            # `min` returns the first of equal candidates, which favors
+            # splitting the trailing directions, as for the slab default
+            return min(self._factorizations(Nproc, dim), key=cost)
+        else:
+            partition = tuple(int(p) for p in partition)
+            if len(partition) != dim or reduce(self._mult, partition) != Nproc:
+                raise ValueError("partition %s does not decompose %d processes in %d dimensions"
+                                 % (str(partition), Nproc, dim))
+            return partition
+
+    @staticmethod
+    def _factorizations(N, dim):
+        """
+        Generate all ordered factorizations of `N` into `dim` factors.
+
+        >>> print(list(_AbstractGridBuilder._factorizations(4, 2)))
+        [(1, 4), (2, 2), (4, 1)]
+        """
+        if dim == 1:
+            yield (N,)
+        else:
+            for p in range(1, N + 1):
+                if N % p == 0:
+                    for rest in _AbstractGridBuilder._factorizations(N // p, dim - 1):
+                        yield (p,) + rest
+
+    @staticmethod
+    def _calcProcIDs(procID, partition):
+        """
+        Position of process `procID` in the Cartesian grid of processes
+        described by `partition`, with the first direction varying fastest.
+
+        >>> print(_AbstractGridBuilder._calcProcIDs(5, (2, 3, 1)))
+        (1, 2, 0)
+        """
+        procIDs = []
+        for nodes in partition:
+            procIDs.append(procID % nodes)
+            procID //= nodes
+
+        return tuple(procIDs)
+
+    def _buildOverlap(self, overlaps, procIDs, occupiedNodes):
+        first = [overlap * (procID > 0) * (procID < occupied)
+                 for overlap, procID, occupied
+                 in zip(overlaps, procIDs, occupiedNodes)]
+        sec = [overlap * (procID < occupied - 1)
+               for overlap, procID, occupied
+               in zip(overlaps, procIDs, occupiedNodes)]
 
         return first, sec, self._packOverlap(first, sec)
 
@@ -68,7 +68,8 @@ class _Grid2DBuilder(_AbstractGridBuilder):
     def _specificGridData(self):
         return [self.numberOfHorizontalRows,
                 self.numberOfVerticalColumns,
-                self.numberOfHorizontalFaces]
+                self.numberOfHorizontalFaces,
+                self.globalShape]
 
     @staticmethod
     def createVertices(nx, ny, dx, dy, numVerts, numVertCols):
@@ -161,10 +162,11 @@ class _Grid2DBuilder(_AbstractGridBuilder):
             return cellFaceIDs
 
     def _packOverlap(self, first, second):
-        return {'left': 0, 'right': 0, 'bottom': first, 'top': second}
+        return {'left': first[0], 'right': second[0],
+                'bottom': first[1], 'top': second[1]}
 
     def _packOffset(self, arg):
-        return (0, arg)
+        return tuple(arg)
 
 class _NonuniformGrid2DBuilder(_Grid2DBuilder):
 
@@ -211,10 +213,12 @@ class _UniformGrid2DBuilder(_Grid2DBuilder):
 
         super(_UniformGrid2DBuilder, self).__init__()
 
-    def buildGridData(self, ds, ns, overlap, communicator, origin):
+    def buildGridData(self, ds, ns, overlap, communicator, origin,
+                      partition=None):
         # call super for side-effects
         super(_UniformGrid2DBuilder, self).buildGridData(ds, ns, overlap,
-                                                        communicator)
+                                                        communicator,
+                                                        partition=partition)
 
         self.origin = _UniformOrigin.calcOrigin(origin,
                                                 self.offset, self.ds, self.scale)
@@ -42,7 +42,8 @@ class _Grid3DBuilder(_AbstractGridBuilder):
                 self.numberOfYZFaces,
                 self.numberOfHorizontalRows,
                 self.numberOfVerticalColumns,
-                self.numberOfLayersDeep]
+                self.numberOfLayersDeep,
+                self.globalShape]
 
 
     @staticmethod
@@ -136,11 +137,12 @@ class _Grid3DBuilder(_AbstractGridBuilder):
 
 
     def _packOverlap(self, first, second):
-        return {'left': 0, 'right': 0, 'bottom' : 0, 'top' : 0,
-                'front': first, 'back': second}
+        return {'left': first[0], 'right': second[0],
+                'bottom' : first[1], 'top' : second[1],
+                'front': first[2], 'back': second[2]}
 
     def _packOffset(self, arg):
-        return (0, 0, arg)
+        return tuple(arg)
 
 class _NonuniformGrid3DBuilder(_Grid3DBuilder):
 
@@ -197,9 +199,11 @@ class _UniformGrid3DBuilder(_Grid3DBuilder):
 
         super(_UniformGrid3DBuilder, self).__init__()
 
-    def buildGridData(self, ds, ns, overlap, communicator, origin):
+    def buildGridData(self, ds, ns, overlap, communicator, origin,
+                      partition=None):
         super(_UniformGrid3DBuilder, self).buildGridData(ds, ns, overlap,
-                                                        communicator)
+                                                        communicator,
+                                                        partition=partition)
 
         self.origin = _UniformOrigin.calcOrigin(origin,
                                                 self.offset, self.ds, self.scale)
@@ -12,9 +12,9 @@ class _PeriodicGrid1DBuilder(_NonuniformGrid1DBuilder):
         return super(_PeriodicGrid1DBuilder, self).buildGridData(*args,
                                                                 **kwargs)
 
-    def _buildOverlap(self, overlap, procID, occupiedNodes):
-        if occupiedNodes == 1:
-            return super(_PeriodicGrid1DBuilder, self)._buildOverlap(overlap,
-                     procID, occupiedNodes)
+    def _buildOverlap(self, overlaps, procIDs, occupiedNodes):
+        if occupiedNodes[0] == 1:
+            return super(_PeriodicGrid1DBuilder, self)._buildOverlap(overlaps,
+                     procIDs, occupiedNodes)
         else:
-            return (overlap, overlap, {'left': overlap, 'right': overlap})
+            return (overlaps, overlaps, {'left': overlaps[0], 'right': overlaps[0]})
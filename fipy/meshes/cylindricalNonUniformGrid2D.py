@@ -29,31 +29,25 @@ class CylindricalNonUniformGrid2D(NonUniformGrid2D):
         super(CylindricalNonUniformGrid2D, self).__init__(dx=dx, dy=dy, nx=nx, ny=ny, overlap=overlap,
                         communicator=communicator, *args, **kwargs)
 
-        self._faceAreas *= self.faceCenters[0].value
-
-        self._scaledFaceAreas = self._scale['area'] * self._faceAreas
-        self._areaProjections = self.faceNormals * self._faceAreas
-        self._orientedAreaProjections = self._calcOrientedAreaProjections()
-        self._faceAspectRatios = self._calcFaceAspectRatios()
-
-        self._cellAreas = self._calcCellAreas()
-        self._cellNormals = self._calcCellNormals()
-
+        # before any geometry is calculated from the vertices
         self.vertexCoords += self.origin
         self.args['origin'] = self.origin
 
-    def _calcFaceCenters(self):
-        return super(CylindricalNonUniformGrid2D, self)._calcFaceCenters() + self.origin
+    def _calcFaceAreas(self):
+        return super(CylindricalNonUniformGrid2D, self)._calcFaceAreas() * self._faceCenters[0]
 
     def _calcCellVolumes(self):
-        return super(CylindricalNonUniformGrid2D, self)._calcCellVolumes() \
-          * self._calcCellCenters()[0]
+        # revolve the planar cells about the axis
+        planarFaceAreas = super(CylindricalNonUniformGrid2D, self)._calcFaceAreas()
+        tmp = self._faceCenters[0] * planarFaceAreas * self.faceNormals[0]
+        tmp = numerix.take(tmp, self._cellFaceIndices) * self._cellFaceOrientations
+        return self._sumOverCellFaces(tmp) * self._cellCenters[0]
 
     def _translate(self, vector):
         return CylindricalNonUniformGrid2D(dx=self.args['dx'], nx=self.args['nx'],
                                            dy=self.args['dy'], ny=self.args['ny'],
                                            origin=self.args['origin'] + vector,
-                                           overlap=self.args['overlap'])
+                                           overlap=self.args['overlap'], partition=self.args['partition'])
 
     def __mul__(self, factor):
         if numerix.shape(factor) is ():
@@ -62,7 +56,7 @@ class CylindricalNonUniformGrid2D(NonUniformGrid2D):
         return CylindricalNonUniformGrid2D(dx=self.args['dx'] * numerix.array(factor[0]), nx=self.args['nx'],
                                            dy=self.args['dy'] * numerix.array(factor[1]), ny=self.args['ny'],
                                            origin=self.args['origin'] * factor,
-                                           overlap=self.args['overlap'])
+                                           overlap=self.args['overlap'], partition=self.args['partition'])
 
     def _test(self):
         """
@@ -29,7 +29,7 @@ class CylindricalUniformGrid2D(UniformGrid2D):
         return CylindricalUniformGrid2D(dx = self.args['dx'], nx = self.args['nx'],
                                         dy = self.args['dy'], ny = self.args['ny'],
                                         origin=numerix.array(self.args['origin']) + vector,
-                                        overlap=self.args['overlap'])
+                                        overlap=self.args['overlap'], partition=self.args['partition'])
 
     @property
     def _faceAreas(self):
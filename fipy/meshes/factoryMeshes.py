@@ -49,7 +49,7 @@ def _dnl(dx, nx, Lx):
 def Grid3D(dx=1., dy=1., dz=1.,
            nx=None, ny=None, nz=None,
            Lx=None, Ly=None, Lz=None,
-           overlap=2, communicator=parallelComm):
+           overlap=2, communicator=parallelComm, partition=None):
 
     r""" Factory function to select between `UniformGrid3D` and
     `NonUniformGrid3D`. If `L{x,y,z}` is specified, the length of the domain
@@ -85,6 +85,12 @@ def Grid3D(dx=1., dy=1., dz=1.,
         Generally, `fipy.tools.serialComm` or `fipy.tools.parallelComm`.
         Select `~fipy.tools.serialComm` to create a serial mesh when
         running in parallel; mostly used for test purposes.
+    partition : tuple of int or str
+        Number of processes along each direction for parallel
+        simulations, e.g., `(px, py, pz)`, whose product must be the number
+        of processes.  Select `"auto"` to choose the process grid that
+        cuts the fewest faces.  By default, the mesh is divided into slabs
+        along the depth direction.
     """
 
     if numerix.getShape(dx) == () \
@@ -97,13 +103,15 @@ def Grid3D(dx=1., dy=1., dz=1.,
         from fipy.meshes.uniformGrid3D import UniformGrid3D
         return UniformGrid3D(dx = dx, dy = dy, dz = dz,
                              nx = nx or 1, ny = ny or 1, nz = nz or 1,
-                             overlap=overlap, communicator=communicator)
+                             overlap=overlap, communicator=communicator,
+                             partition=partition)
     else:
         from fipy.meshes.nonUniformGrid3D import NonUniformGrid3D
         return NonUniformGrid3D(dx = dx, dy = dy, dz = dz, nx = nx, ny = ny, nz = nz,
-                                overlap=overlap, communicator=communicator)
+                                overlap=overlap, communicator=communicator,
+                                partition=partition)
 
-def Grid2D(dx=1., dy=1., nx=None, ny=None, Lx=None, Ly=None, overlap=2, communicator=parallelComm):
+def Grid2D(dx=1., dy=1., nx=None, ny=None, Lx=None, Ly=None, overlap=2, communicator=parallelComm, partition=None):
     r""" Factory function to select between `UniformGrid2D` and
     `NonUniformGrid2D`. If `L{x,y}` is specified, the length of the domain is
     always `L{x,y}` regardless of `d{x,y}`, unless `d{x,y}` is a list of
@@ -135,6 +143,12 @@ def Grid2D(dx=1., dy=1., nx=None, ny=None, Lx=None, Ly=None, overlap=2, communic
         Generally, `fipy.tools.serialComm` or `fipy.tools.parallelComm`.
         Select `~fipy.tools.serialComm` to create a serial mesh when
         running in parallel; mostly used for test purposes.
+    partition : tuple of int or str
+        Number of processes along each direction for parallel
+        simulations, e.g., `(px, py)`, whose product must be the number
+        of processes.  Select `"auto"` to choose the process grid that
+        cuts the fewest faces.  By default, the mesh is divided into slabs
+        along the vertical direction.
     """
 
     if numerix.getShape(dx) == () and numerix.getShape(dy) == ():
@@ -146,10 +160,12 @@ def Grid2D(dx=1., dy=1., nx=None, ny=None, Lx=None, Ly=None, overlap=2, communic
         return UniformGrid2D(dx=dx, dy=dy,
                              nx=nx, ny=ny,
                              overlap=overlap,
-                             communicator=communicator)
+                             communicator=communicator,
+                             partition=partition)
     else:
         from fipy.meshes.nonUniformGrid2D import NonUniformGrid2D
-        return NonUniformGrid2D(dx=dx, dy=dy, nx=nx, ny=ny, overlap=overlap, communicator=communicator)
+        return NonUniformGrid2D(dx=dx, dy=dy, nx=nx, ny=ny, overlap=overlap, communicator=communicator,
+                                partition=partition)
 
 def Grid1D(dx=1., nx=None, Lx=None, overlap=2, communicator=parallelComm):
     r""" Factory function to select between `UniformGrid1D` and
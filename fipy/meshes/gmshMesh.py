@@ -7,6 +7,7 @@ from builtins import range
 from builtins import str
 __docformat__ = 'restructuredtext'
 
+import mmap
 import os
 from subprocess import Popen, PIPE
 import sys
@@ -22,6 +23,9 @@ from fipy.tests.doctestPlus import register_skipper
 
 from fipy.meshes.mesh import Mesh
 from fipy.meshes.mesh2D import Mesh2D
+from fipy.meshes.meshCache import (_MeshCache, _meshCacheDirectory,
+                                   _meshCacheKey, _fileDigest,
+                                   _calculatedGeometry, _restoreGeometry)
 from fipy.meshes.topologies.meshTopology import _MeshTopology
 
 from fipy.tools.debug import PRINT
@@ -52,6 +56,34 @@ def parprint(str):
         if parallelComm.procID == 0:
             print(str, file=sys.stderr)
 
+def _tokenize(text, dtype):
+    """Parse the whitespace-separated numbers of `text`, counting them line by line
+
+    >>> values, counts = _tokenize(b"2\\n1 2 3\\r\\n\\n  4 5\\n", dtype=nx.INT_DTYPE)
+    >>> print(values)
+    [2 1 2 3 4 5]
+    >>> print(counts)
+    [1 3 2]
+
+    Blank lines aren't counted.
+    """
+    chars = nx.frombuffer(text, dtype=nx.uint8)
+    # spaces, tabs, carriage returns and newlines
+    blank = (chars <= ord(" "))
+    first = ~blank & nx.concatenate(([True], blank[:-1]))
+    counts = nx.bincount(nx.cumsum(chars == ord("\n"))[first])
+    return nx.fromstring(text, dtype=dtype, sep=" "), counts[counts > 0]
+
+def _raggedIndices(starts, lengths):
+    """Indices of `lengths[i]` consecutive elements from each of `starts[i]`
+
+    >>> print(_raggedIndices(nx.array([5, 0, 9]), nx.array([2, 0, 3])))
+    [ 5  6  9 10 11]
+    """
+    offsets = nx.cumsum(lengths) - lengths
+    return (nx.repeat(starts - offsets, lengths)
+            + nx.arange(nx.sum(lengths), dtype=nx.INT_DTYPE))
+
 class GmshException(Exception):
     pass
 
@@ -258,6 +290,68 @@ def openMSHFile(name, dimensions=None, coordDimensions=None, communicator=parall
                    mode=mode,
                    fileIsTemporary=fileIsTemporary)
 
+def _openCachedMSHFile(name, dimensions=None, coordDimensions=None, communicator=parallelComm, overlap=1, background=None):
+    """Open a Gmsh `MSH` file for reading, by way of the mesh cache
+
+    If :envvar:`FIPY_MESHCACHE` names a directory, the mesh is looked for
+    there before running Gmsh or parsing anything.  It is found by a hash
+    of the `.geo` script or of the contents of the `.geo` or `.msh` file,
+    of the dimensions, of the version of Gmsh, of the number of partitions
+    and of the overlap.  Each process looks for its own partition, and the
+    cache is only used if all of them are found, as reading the file needs
+    every process.  A mesh that isn't found is stored when it has been
+    read.  Files included by a `.geo` script are not hashed, so a
+    change to them needs an empty cache.  Meshes made to fit a
+    `background` aren't cached.
+
+    Parameters are those of `openMSHFile()`.
+    """
+    directory = _meshCacheDirectory()
+    if directory is None or background is not None:
+        return openMSHFile(name,
+                           dimensions=dimensions,
+                           coordDimensions=coordDimensions,
+                           communicator=communicator,
+                           overlap=overlap,
+                           mode='r',
+                           background=background)
+
+    if overlap > 1:
+        communicator = serialComm
+
+    if os.path.exists(name):
+        source = _fileDigest(name)
+    else:
+        source = name
+
+    cache = _MeshCache(directory=directory,
+                       key=_meshCacheKey(source, dimensions, coordDimensions,
+                                         gmshVersion(communicator),
+                                         communicator.Nproc, overlap),
+                       communicator=communicator)
+    cached = cache.load()
+    # a partly stored mesh is read again on every process
+    if not communicator.all(nx.array(cached is not None)):
+        cached = None
+
+    if cached is None:
+        mshFile = openMSHFile(name,
+                              dimensions=dimensions,
+                              coordDimensions=coordDimensions,
+                              communicator=communicator,
+                              overlap=overlap,
+                              mode='r')
+        mshFile.cache = cache
+    else:
+        arrays, info = cached
+        if info["Nproc"] < communicator.Nproc:
+            # Gmsh couldn't partition the mesh
+            communicator = serialComm
+        mshFile = _CachedMSHFile(arrays=arrays, info=info,
+                                 communicator=communicator)
+
+    return mshFile
+
 def openPOSFile(name, communicator=parallelComm, mode='w'):
     """Open a Gmsh `POS` post-processing file
     """
@@ -535,174 +629,317 @@ class MSHFile(GmshFile):
 
         self.mesh = None
         self.meshWritten = False
+        self.cache = None
 
         GmshFile.__init__(self, filename=filename, communicator=communicator, mode=mode, fileIsTemporary=fileIsTemporary)
 
-    def _getMetaData(self):
+    def _readSections(self):
         """
-        Extracts `gmshVersion`, file-type, and data-size in that
-        order.
-        """
-        self._seekForHeader("MeshFormat")
-        metaData = self.fileobj.readline().split()
-        self.fileobj.seek(0)
-        return [float(x) for x in metaData]
+        Find the `$MeshFormat`, `$PhysicalNames`, `$Nodes` and `$Elements`
+        sections of the file.
 
-    def _isolateData(self, title):
-        """
-        Gets all data between $[title] and $End[title], writes
-        it out to its own file.
+        The file is memory-mapped, so only these sections are read.
+
+        Returns
+        -------
+        dict of bytes
+            The text between `$[title]` and `$End[title]`, for each title
+            that is found.
         """
-        newF, newPath = tempfile.mkstemp(title, text=True)
-        newF = os.fdopen(newF, 'w')
+        sections = dict()
+        mm = mmap.mmap(self.fileobj.fileno(), 0, access=mmap.ACCESS_READ)
         try:
-            self._seekForHeader(title)
-        except Exception as e:
-            newF.close()
-            os.unlink(newPath)
-            raise
+            for title in ["MeshFormat", "PhysicalNames", "Nodes", "Elements"]:
+                begin = mm.find(("$%s" % title).encode('ascii'))
+                if begin == -1:
+                    continue
+                begin = mm.find(b"\n", begin) + 1
+                end = mm.find(("$End%s" % title).encode('ascii'), begin)
+                sections[title] = mm[begin:end]
+        finally:
+            mm.close()
 
-        # extract the actual data within section
-        while True:
-            line = self.fileobj.readline()
-            if ("$End%s" % title) not in line:
-                newF.write(line)
-            else: break
+        for title in ["MeshFormat", "Nodes", "Elements"]:
+            if title not in sections:
+                raise EOFError("No `%s' header found!" % title)
 
-        self.fileobj.seek(0)
-        newF.close()
-        return newPath
+        return sections
 
-    def _seekForHeader(self, title):
+    def _parseNodes(self, text):
         """
-        Iterate through a file until we end up at the section header
-        for `title`. Function has obvious side-effects on `self.fileobj`.
+        Return the Gmsh ID and the coordinates of each node of a `$Nodes`
+        section.
+
+        >>> f = MSHFile(filename=os.devnull, dimensions=2)
+        >>> ids, coords = f._parseNodes(b'''2
+        ... 1 0 0 0
+        ... 3 0.5 1e-3 0
+        ... ''')
+        >>> print(ids)
+        [1 3]
+        >>> print(coords[1])
+        [ 0.5    0.001  0.   ]
         """
-        while True:
-            line = self.fileobj.readline()
-            if len(line) == 0:
-                raise EOFError("No `%s' header found!" % title)
-                break
-            elif (("$%s" % title) not in line):
-                continue
-            else:
-                break # found header
+        values, counts = _tokenize(text, dtype=float)
+        nodes = values[1:].reshape((-1, 4)) # skip number of nodes
+        return nodes[:, 0].astype(nx.INT_DTYPE), nodes[:, 1:]
+
+    def _parseElements(self, text):
+        """
+        Return an `_ElementData` of every element of an `$Elements` section.
+
+        Each line is an element ID, its type, its number of tags, its tags
+        and then its nodes.  The first two tags are the physical and the
+        geometrical entities of the element.  Any others are the number of
+        partitions the element is in, followed by those partitions.
+
+        >>> f = MSHFile(filename=os.devnull, dimensions=2)
+        >>> elements = f._parseElements(b'''3
+        ... 1 15 2 0 1 1
+        ... 2 1 3 4 1 0 1 2
+        ... 3 2 6 0 1 3 1 -2 -3 1 2 3
+        ... ''')
+        >>> print(elements.shapes, elements.physicalEntities, elements.geometricalEntities)
+        [15  1  2] [0 4 0] [1 1 1]
+        >>> print(elements.nodeLists)
+        [array([1]), array([1, 2]), array([1, 2, 3])]
+        >>> print(elements.partitions, elements.partitionOffsets)
+        [ 1 -2 -3] [0 0 0 3]
+        """
+        values, counts = _tokenize(text, dtype=nx.INT_DTYPE)
+        counts = counts[1:] # skip number of elements
+        starts = nx.cumsum(counts) - counts + 1
+        # pad, so that missing tags of the last element can be looked for
+        values = nx.concatenate((values, [-1, -1, -1])).astype(nx.INT_DTYPE)
+        numTags = values[starts + 2]
+
+        # the partition tags for don't seem to always be present
+        # and don't always make much sense when they are
+        hasEntities = (numTags >= 2)
+        physicalEntities = nx.where(hasEntities, values[starts + 3], -1)
+        geometricalEntities = nx.where(hasEntities, values[starts + 4], -1)
+
+        # next item is a count
+        numPartitions = nx.maximum(numTags - 3, 0)
+        disagree = (numTags >= 3) & (values[starts + 5] != numPartitions)
+        if disagree.any():
+            i = nx.nonzero(disagree)[0][0]
+            warnings.warn("Partition count %d does not agree with number of remaining tags %d."
+                          % (values[starts[i] + 5], numPartitions[i]),
+                          SyntaxWarning, stacklevel=2)
+
+        numNodes = counts - 3 - numTags
+
+        return _ElementData(ids=values[starts],
+                            shapes=values[starts + 1],
+                            physicalEntities=physicalEntities,
+                            geometricalEntities=geometricalEntities,
+                            nodes=values[_raggedIndices(starts + 3 + numTags, numNodes)],
+                            nodeOffsets=nx.concatenate(([0], nx.cumsum(numNodes))).astype(nx.INT_DTYPE),
+                            partitions=values[_raggedIndices(starts + 6, numPartitions)],
+                            partitionOffsets=nx.concatenate(([0], nx.cumsum(numPartitions))).astype(nx.INT_DTYPE))
 
     def _deriveCellsAndFaces(self, cellsToVertIDs, shapeTypes, numCells):
         """
         Uses element information obtained from `_parseElementFile` to deliver
         `facesToVertices` and `cellsToFaces`.
-        """
 
+        Faces are numbered in the order they are first encountered, cell by
+        cell.  Duplicates are found by sorting the vertex IDs of every face
+        and collapsing identical rows, rather than by looking up each face
+        in a dictionary.
+
+        Also returns the sorted, padded vertex IDs of each face, for
+        matching Gmsh's boundary elements.
+
+        >>> f = MSHFile(filename=os.devnull, dimensions=2)
+        >>> f.numFacesPerCell = {2: 3, 3: 4}
+        >>> cells = [nx.array(c) for c in [[0, 1, 2], [1, 3, 2], [1, 4, 5, 3]]]
+        >>> facesToV, cellsToF, faceKeys = f._deriveCellsAndFaces(cells,
+        ...                                                       nx.array([2, 2, 3]),
+        ...                                                       3)
+        >>> print(facesToV)
+        [[1 2 0 3 2 4 5 3]
+         [0 1 2 1 3 1 4 5]]
+        >>> print(cellsToF)
+        [[ 0  3  5]
+         [ 1  4  6]
+         [ 2  1  7]
+         [-1 -1  3]]
+        >>> print(faceKeys[1])
+        [1 2]
+        """
+        shapeTypes = nx.asarray(shapeTypes)[:numCells]
         allShapes  = nx.unique(shapeTypes).tolist()
         maxFaces   = max([self.numFacesPerCell[x] for x in allShapes])
 
+        numNodes = nx.array([len(cell) for cell in cellsToVertIDs[:numCells]], dtype=nx.INT_DTYPE)
+        firstNode = nx.concatenate(([0], nx.cumsum(numNodes)[:-1]))
+        allNodes = nx.concatenate([nx.asarray(cell, dtype=nx.INT_DTYPE)
+                                   for cell in cellsToVertIDs[:numCells]])
+
+        orderings = dict((shapeType, self._faceOrderings(shapeType=shapeType,
+                                                         numNodes=numNodes[shapeTypes == shapeType][0]))
+                         for shapeType in allShapes)
+        maxFaceLen = max([len(face) for ordering in orderings.values() for face in ordering])
+
+        # gather every face of every cell, padded at the front with -1,
+        # along with the cell and the position within the cell it came from
+        faces = []
+        faceCells = []
+        faceSlots = []
+        for shapeType in allShapes:
+            cellIDs = nx.nonzero(shapeTypes == shapeType)[0]
+
+            for faceLen in sorted(set(len(face) for face in orderings[shapeType])):
+                slots = [slot for slot, face in enumerate(orderings[shapeType]) if len(face) == faceLen]
+                ordering = nx.array([orderings[shapeType][slot] for slot in slots], dtype=nx.INT_DTYPE)
+
+                shapeFaces = nx.empty((len(cellIDs), len(slots), maxFaceLen), dtype=nx.INT_DTYPE)
+                shapeFaces[..., :maxFaceLen - faceLen] = -1
+                shapeFaces[..., maxFaceLen - faceLen:] = allNodes[firstNode[cellIDs][:, nx.newaxis, nx.newaxis]
+                                                                  + ordering[nx.newaxis]]
+
+                faces.append(shapeFaces.reshape((-1, maxFaceLen)))
+                faceCells.append(nx.repeat(cellIDs, len(slots)))
+                faceSlots.append(nx.tile(slots, len(cellIDs)))
+
+        faces = nx.concatenate(faces)
+        faceCells = nx.concatenate(faceCells)
+        faceSlots = nx.concatenate(faceSlots)
+
+        # put faces in the order they are encountered
+        encountered = nx.argsort(faceCells * maxFaces + faceSlots, kind='stable')
+        faces = faces[encountered]
+        faceCells = faceCells[encountered]
+        faceSlots = faceSlots[encountered]
+
+        # faces are the same if they have the same vertices in any order
+        faceKeys, firstInstance, faceIDs = nx.unique(nx.sort(faces, axis=1), axis=0,
+                                                     return_index=True,
+                                                     return_inverse=True)
+
+        # renumber unique faces by their first encounter
+        encountered = nx.argsort(firstInstance)
+        renumbered = nx.empty_like(encountered)
+        renumbered[encountered] = nx.arange(len(encountered))
+
         # `cellsToFaces` must be padded with -1; see mesh.py
-        currNumFaces = 0
         cellsToFaces = nx.ones((numCells, maxFaces), 'l') * -1
-        facesDict    = {}
-        uniqueFaces  = []
-
-        # we now build `cellsToFaces` and `uniqueFaces`,
-        # the latter will result in `facesToVertices`.
-        for cellIdx in range(numCells):
-            shapeType = shapeTypes[cellIdx]
-            cell = cellsToVertIDs[cellIdx]
-
-            if shapeType in [5, 12, 17]: # hexahedron
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3], # ordering of vertices gleaned from
-                                                                 [4, 5, 6, 7], # a one-cube Grid3D example
-                                                                 [0, 1, 5, 4],
-                                                                 [3, 2, 6, 7],
-                                                                 [0, 3, 7, 4],
-                                                                 [1, 2, 6, 5]])
-            elif shapeType in [6, 13, 18]: # prism
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2],
-                                                                 [5, 4, 3],
-                                                                 [3, 4, 1, 0],
-                                                                 [4, 5, 2, 1],
-                                                                 [5, 3, 0, 2]])
-            elif shapeType in [7, 14, 19]: # pyramid
-                faces = self._extractOrderedFaces(cell=cell,
-                                                  faceOrderings=[[0, 1, 2, 3],
-                                                                 [0, 1, 4],
-                                                                 [1, 2, 4],
-                                                                 [2, 3, 4],
-                                                                 [3, 0, 4]])
-            else:
-                if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
-                    faceLength = 2 # triangle
-                elif shapeType in [3, 10, 16]:
-                    faceLength = 2 # quadrangle
-                elif shapeType in [4, 11, 29, 30, 31]:
-                    faceLength = 3 # tetrahedron
-
-                faces = self._extractRegularFaces(cell=cell,
-                                                  faceLength=faceLength,
-                                                  facesPerCell=self.numFacesPerCell[shapeType])
-
-            for faceIdx in range(len(faces)):
-                # NB: currFace is sorted for the key to spot duplicates
-                currFace = faces[faceIdx]
-                keyStr   = ' '.join([str(x) for x in sorted(currFace)])
-
-                if keyStr in facesDict:
-                    cellsToFaces[cellIdx][faceIdx] = facesDict[keyStr]
-                else: # new face
-                    facesDict[keyStr] = currNumFaces
-                    cellsToFaces[cellIdx][faceIdx] = currNumFaces
-                    uniqueFaces.append(currFace)
-                    currNumFaces += 1
-
-        # pad short faces with -1
-        maxFaceLen = max([len(f) for f in uniqueFaces])
-        uniqueFaces = [[-1] * (maxFaceLen - len(f)) + f for f in uniqueFaces]
-
-        facesToVertices = nx.array(uniqueFaces, dtype=nx.INT_DTYPE)
-
-        return facesToVertices.swapaxes(0, 1)[::-1], cellsToFaces.swapaxes(0, 1).copy('C'), facesDict
+        cellsToFaces[faceCells, faceSlots] = renumbered[nx.ravel(faceIDs)]
+
+        facesToVertices = faces[firstInstance[encountered]]
+
+        return (facesToVertices.swapaxes(0, 1)[::-1],
+                cellsToFaces.swapaxes(0, 1).copy('C'),
+                faceKeys[encountered])
 
     def _translateNodesToVertices(self, entitiesNodes, vertexMap):
-        """Translates e`ntitiesNodes` from Gmsh node IDs to `vertexCoords` indices.
-        """
-        entitiesVertices = []
+        """Translates `entitiesNodes` from Gmsh node IDs to `vertexCoords` indices.
 
-        for entity in entitiesNodes:
-            try:
-                vertIndices = vertexMap[nx.array(entity)]
-            except IndexError:
-                vertIndices = nx.ones((len(entity),), 'l') * -1
-            entitiesVertices.append(vertIndices)
+        Nodes that aren't vertices become -1.
 
-        return entitiesVertices
+        >>> f = MSHFile(filename=os.devnull, dimensions=2)
+        >>> print(f._translateNodesToVertices(nx.array([3, 5, 9, 2]),
+        ...                                   nx.array([-1, -1, -1, 0, -1, 1])))
+        [ 0  1 -1 -1]
+        """
+        known = (entitiesNodes < len(vertexMap))
+        return nx.where(known, vertexMap[nx.where(known, entitiesNodes, 0)], -1)
 
-    def _extractRegularFaces(self, cell, faceLength, facesPerCell):
-        """Return faces for a regular poly(gon|hedron)
+    def _matchFaces(self, faceKeys, facesToVertIDs):
+        """Find the FiPy faces with the same vertices as Gmsh's face elements
 
-        Given `cell`, defined by node IDs, returns an array of
-        `facesPerCell` faces of length `faceLength` in terms of nodes.
+        Parameters
+        ----------
+        faceKeys : array_like of int
+            Sorted vertex IDs of each FiPy face, padded at the front with -1,
+            as returned by `_deriveCellsAndFaces`.
+        facesToVertIDs : list of array_like of int
+            Vertex IDs of each Gmsh face element.
+
+        Returns
+        -------
+        faceIDs : ndarray of int
+            The FiPy face matching each of the `tagged` elements.
+        tagged : ndarray of int
+            The Gmsh face elements that match a FiPy face.
+
+        >>> f = MSHFile(filename=os.devnull, dimensions=2)
+        >>> faceKeys = nx.array([[-1, 1, 2], [0, 1, 2], [2, 3, 4]])
+        >>> faceIDs, tagged = f._matchFaces(faceKeys, [nx.array(face) for face in
+        ...                                            [[4, 3, 2], [2, 1], [1, 2, 3], [2, 1, -1], [1, 0, 2]]])
+        >>> print(faceIDs)
+        [2 0 1]
+        >>> print(tagged)
+        [0 1 4]
         """
-        faces = []
-        for i in range(facesPerCell):
-            aFace = []
-            for j in range(faceLength):
-                aVertex = (i + j) % len(cell) # we may wrap
-                aFace.append(int(cell[aVertex]))
-            faces.append(aFace)
-        return faces
-
-    def _extractOrderedFaces(self, cell, faceOrderings):
-        """Return faces for a 8-node hexahedron cell.
+        numFaces, maxFaceLen = faceKeys.shape
+
+        # elements that can't be a FiPy face, or that have vertices
+        # missing from this partition, are never matched
+        candidates = [i for i, face in enumerate(facesToVertIDs)
+                      if 0 < len(face) <= maxFaceLen and nx.all(nx.asarray(face) >= 0)]
+        elementKeys = -nx.ones((len(candidates), maxFaceLen), dtype=faceKeys.dtype)
+        for row, i in enumerate(candidates):
+            elementKeys[row, maxFaceLen - len(facesToVertIDs[i]):] = facesToVertIDs[i]
+        elementKeys = nx.sort(elementKeys, axis=1)
+
+        _, keyIDs = nx.unique(nx.concatenate((faceKeys, elementKeys)), axis=0,
+                              return_inverse=True)
+        keyIDs = nx.ravel(keyIDs)
+
+        keyToFace = -nx.ones((keyIDs.max() + 1 if len(keyIDs) else 0,), dtype=nx.INT_DTYPE)
+        keyToFace[keyIDs[:numFaces]] = nx.arange(numFaces)
+        faceIDs = keyToFace[keyIDs[numFaces:]]
+        matched = (faceIDs >= 0)
+
+        return faceIDs[matched], nx.array(candidates, dtype=nx.INT_DTYPE)[matched]
+
+    def _faceOrderings(self, shapeType, numNodes):
+        """Return the local node indices of each face of a cell
+
+        Parameters
+        ----------
+        shapeType : int
+            Gmsh element type of the cell.
+        numNodes : int
+            Number of nodes listed for each cell of this type.
+
+        Returns
+        -------
+        list of list of int
         """
-        def orderingToFace(vertList):
-            aFace = []
-            for i in vertList:
-                aFace.append(int(cell[i]))
-            return aFace
+        if shapeType in [5, 12, 17]: # hexahedron
+            return [[0, 1, 2, 3], # ordering of vertices gleaned from
+                    [4, 5, 6, 7], # a one-cube Grid3D example
+                    [0, 1, 5, 4],
+                    [3, 2, 6, 7],
+                    [0, 3, 7, 4],
+                    [1, 2, 6, 5]]
+        elif shapeType in [6, 13, 18]: # prism
+            return [[0, 1, 2],
+                    [5, 4, 3],
+                    [3, 4, 1, 0],
+                    [4, 5, 2, 1],
+                    [5, 3, 0, 2]]
+        elif shapeType in [7, 14, 19]: # pyramid
+            return [[0, 1, 2, 3],
+                    [0, 1, 4],
+                    [1, 2, 4],
+                    [2, 3, 4],
+                    [3, 0, 4]]
+        else:
+            if shapeType in [2, 9, 20, 21, 22, 23, 24, 25]:
+                faceLength = 2 # triangle
+            elif shapeType in [3, 10, 16]:
+                faceLength = 2 # quadrangle
+            elif shapeType in [4, 11, 29, 30, 31]:
+                faceLength = 3 # tetrahedron
 
-        return [orderingToFace(o) for o in faceOrderings]
+            # a regular poly(gon|hedron), wrapping around the cell's nodes
+            return [[(i + j) % numNodes for j in range(faceLength)]
+                    for i in range(self.numFacesPerCell[shapeType])]
 
     def read(self):
         """
@@ -713,162 +950,164 @@ class MSHFile(GmshFile):
         3. Build faces
         4. Build `cellsToFaces`
 
-        Isolate relevant data into three files, store in
-        `self.nodesPath` for `$Nodes`,
-        `self.elemsPath` for `$Elements`.
-        `self.namesFile` for `$PhysicalNames`.
+        Only the first process reads the file.  It parses the `$Nodes`
+        and `$Elements` sections in bulk and hands each partition its own
+        cells, ghost cells, faces and nodes.
 
         Returns `vertexCoords`, `facesToVertexID`, `cellsToFaceID`,
                 `cellGlobalIDMap`, `ghostCellGlobalIDMap`.
         """
-        self.version, self.fileType, self.dataSize = self._getMetaData()
-        self.nodesPath = self._isolateData("Nodes")
-        self.elemsPath = self._isolateData("Elements")
-        try:
-            self.namesPath = self._isolateData("PhysicalNames")
-        except EOFError as e:
-            self.namesPath = None
+        if self.communicator.procID == 0:
+            sections = self._readSections()
+            self.version, self.fileType, self.dataSize = [float(x) for x in sections["MeshFormat"].split()[:3]]
 
-        try:
-            if self.dimensions is None:
-                nodesFile = open(self.nodesPath, 'r')
-                nodesFile.readline() # skip number of nodes
+            parprint("Parsing nodes.")
+            nodeIDs, nodeCoords = self._parseNodes(sections["Nodes"])
 
+            if self.dimensions is None:
                 # We assume we have a 2D file unless we find a node
                 # with a non-zero Z coordinate
-                self.dimensions = 2
-                for node in nodesFile:
-                    line   = node.split()
+                self.dimensions = 3 if (nodeCoords[:, 2] != 0).any() else 2
 
-                    newVert = [float(x) for x in line]
-
-                    if newVert[2] != 0.0:
-                        self.dimensions = 3
-                        break
+            parprint("Parsing elements.")
+            elements = self._parseElements(sections["Elements"])
 
-                nodesFile.close()
-
-            self.coordDimensions = self.coordDimensions or self.dimensions
-
-            # we need a conditional here so we don't pick up 2D shapes in 3D
-            if self.dimensions == 2:
-                self.numVertsPerFace = {1: 2, # 2-node line
-                                        8: 2} # 3-node line
-                self.numFacesPerCell = { 2: 3, # 3-node triangle (3 faces)
-                                         9: 3, # 6-node triangle (we only read 1st 3)
-                                        20: 3, # 9-node triangle (we only read 1st 3)
-                                        21: 3, # 10-node triangle (we only read 1st 3)
-                                        22: 3, # 12-node triangle (we only read 1st 3)
-                                        23: 3, # 15-node triangle (we only read 1st 3)
-                                        24: 3, # 15-node triangle (we only read 1st 3)
-                                        25: 3, # 21-node triangle (we only read 1st 3)
-                                         3: 4, # 4-node quadrangle (4 faces)
-                                        10: 4, # 9-node quadrangle (we only read 1st 4)
-                                        16: 4} # 8-node quadrangle (we only read 1st 4)
-            elif self.dimensions == 3:
-                self.numVertsPerFace = { 2: 3, # 3-node triangle (3 vertices)
-                                         9: 3, # 6-node triangle (we only read 1st 3)
-                                        20: 3, # 9-node triangle (we only read 1st 3)
-                                        21: 3, # 10-node triangle (we only read 1st 3)
-                                        22: 3, # 12-node triangle (we only read 1st 3)
-                                        23: 3, # 15-node triangle (we only read 1st 3)
-                                        24: 3, # 15-node triangle (we only read 1st 3)
-                                        25: 3, # 21-node triangle (we only read 1st 3)
-                                         3: 4, # 4-node quadrangle (4 vertices)
-                                        10: 4, # 9-node quadrangle (we only read 1st 4)
-                                        16: 4} # 8-node quadrangle (we only read 1st 4)
-                self.numFacesPerCell = { 4: 4, # 4-node tetrahedron (4 faces)
-                                        11: 4, # 10-node tetrahedron (we only read 1st 4)
-                                        29: 4, # 20-node tetrahedron (we only read 1st 4)
-                                        30: 4, # 35-node tetrahedron (we only read 1st 4)
-                                        31: 4, # 56-node tetrahedron (we only read 1st 4)
-                                         5: 6, # 8-node hexahedron (6 faces)
-                                        12: 6, # 27-node tetrahedron (we only read 1st 6)
-                                        17: 6, # 20-node tetrahedron (we only read 1st 6)
-                                         6: 5, # 6-node prism (5 faces)
-                                        13: 5, # 18-node prism (we only read 1st 6)
-                                        18: 5, # 15-node prism (we only read 1st 6)
-                                         7: 5, # 5-node pyramid (5 faces)
-                                        14: 5, # 14-node pyramid (we only read 1st 5)
-                                        19: 5} # 13-node pyramid (we only read 1st 5)
+            header = (self.version, self.fileType, self.dataSize,
+                      self.dimensions, sections.get("PhysicalNames"))
+            del sections
+        else:
+            header = None
+
+        (self.version,
+         self.fileType,
+         self.dataSize,
+         self.dimensions,
+         namesText) = self.communicator.bcast(header)
+
+        self.coordDimensions = self.coordDimensions or self.dimensions
+
+        if self.dimensions == 2:
+            self.numVertsPerFace = {1: 2, # 2-node line
+                                    8: 2} # 3-node line
+            self.numFacesPerCell = { 2: 3, # 3-node triangle (3 faces)
+                                     9: 3, # 6-node triangle (we only read 1st 3)
+                                    20: 3, # 9-node triangle (we only read 1st 3)
+                                    21: 3, # 10-node triangle (we only read 1st 3)
+                                    22: 3, # 12-node triangle (we only read 1st 3)
+                                    23: 3, # 15-node triangle (we only read 1st 3)
+                                    24: 3, # 15-node triangle (we only read 1st 3)
+                                    25: 3, # 21-node triangle (we only read 1st 3)
+                                     3: 4, # 4-node quadrangle (4 faces)
+                                    10: 4, # 9-node quadrangle (we only read 1st 4)
+                                    16: 4} # 8-node quadrangle (we only read 1st 4)
+        elif self.dimensions == 3:
+            self.numVertsPerFace = { 2: 3, # 3-node triangle (3 vertices)
+                                     9: 3, # 6-node triangle (we only read 1st 3)
+                                    20: 3, # 9-node triangle (we only read 1st 3)
+                                    21: 3, # 10-node triangle (we only read 1st 3)
+                                    22: 3, # 12-node triangle (we only read 1st 3)
+                                    23: 3, # 15-node triangle (we only read 1st 3)
+                                    24: 3, # 15-node triangle (we only read 1st 3)
+                                    25: 3, # 21-node triangle (we only read 1st 3)
+                                     3: 4, # 4-node quadrangle (4 vertices)
+                                    10: 4, # 9-node quadrangle (we only read 1st 4)
+                                    16: 4} # 8-node quadrangle (we only read 1st 4)
+            self.numFacesPerCell = { 4: 4, # 4-node tetrahedron (4 faces)
+                                    11: 4, # 10-node tetrahedron (we only read 1st 4)
+                                    29: 4, # 20-node tetrahedron (we only read 1st 4)
+                                    30: 4, # 35-node tetrahedron (we only read 1st 4)
+                                    31: 4, # 56-node tetrahedron (we only read 1st 4)
+                                     5: 6, # 8-node hexahedron (6 faces)
+                                    12: 6, # 27-node tetrahedron (we only read 1st 6)
+                                    17: 6, # 20-node tetrahedron (we only read 1st 6)
+                                     6: 5, # 6-node prism (5 faces)
+                                    13: 5, # 18-node prism (we only read 1st 6)
+                                    18: 5, # 15-node prism (we only read 1st 6)
+                                     7: 5, # 5-node pyramid (5 faces)
+                                    14: 5, # 14-node pyramid (we only read 1st 5)
+                                    19: 5} # 13-node pyramid (we only read 1st 5)
+        else:
+            raise GmshException("Mesh has fewer than 2 or more than 3 dimensions")
+        if self.communicator.Nproc > 1:
+            parprint("Partitioning elements.")
+            if self.communicator.procID == 0:
+                byID = nx.argsort(nodeIDs)
+                partitions = []
+                for partition in self._partitionElements(elements,
+                                                         numberOfPartitions=self.communicator.Nproc):
+                    cellsData, ghostsData, facesData = partition
+                    vertices = nx.unique(nx.concatenate((cellsData.nodes,
+                                                         ghostsData.nodes)))
+                    # in the order of the file, as they would otherwise be
+                    vertices = nx.sort(byID[nx.searchsorted(nodeIDs, vertices, sorter=byID)])
+                    partitions.append(partition + (nodeIDs[vertices], nodeCoords[vertices]))
+                del elements, nodeIDs, nodeCoords
             else:
-                raise GmshException("Mesh has fewer than 2 or more than 3 dimensions")
+                partitions = None
 
-            parprint("Parsing elements.")
             (cellsData,
              ghostsData,
-             facesData) = self._parseElementFile()
-
-            cellsToGmshVerts = cellsData.nodes + ghostsData.nodes
-            numCellsTotal    = len(cellsData.nodes) + len(ghostsData.nodes)
-            allShapeTypes    = cellsData.shapes + ghostsData.shapes
-            allShapeTypes    = nx.array(allShapeTypes)
-            allShapeTypes    = nx.delete(allShapeTypes, nx.s_[numCellsTotal:])
-            self.physicalCellMap = nx.array(cellsData.physicalEntities
-                                            + ghostsData.physicalEntities)
-            self.geometricalCellMap = nx.array(cellsData.geometricalEntities
-                                               + ghostsData.geometricalEntities)
-
-            if numCellsTotal < 1:
-                errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
-                errStr += "\n\nGmsh output:\n%s" % "".join(self.gmshOutput).rstrip()
-                raise GmshException(errStr)
-
-            parprint("Recovering coords.")
-            parprint("numcells %d" % numCellsTotal)
-            vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(cellsToGmshVerts)
-
-            # translate Gmsh IDs to `vertexCoord` indices
-            cellsToVertIDs = self._translateNodesToVertices(cellsToGmshVerts,
-                                                            vertIDtoIdx)
-
-            parprint("Building cells and faces.")
-            (facesToV,
-             cellsToF,
-             facesDict) = self._deriveCellsAndFaces(cellsToVertIDs,
-                                                    allShapeTypes,
-                                                    numCellsTotal)
-
-            # cell entities were easy to record on parsing
-            # but we don't use Gmsh faces, so we need to correlate the nodes
-            # that make up the Gmsh faces with the vertex IDs of the FiPy faces
-            # so that we can check if any are named
-            faceEntitiesDict = dict()
-
-            # translate Gmsh IDs to `vertexCoord` indices
-            facesToVertIDs = self._translateNodesToVertices(facesData.nodes,
-                                                            vertIDtoIdx)
-
-            for face, physicalEntity, geometricalEntity in zip(facesToVertIDs,
-                                                               facesData.physicalEntities,
-                                                               facesData.geometricalEntities):
-                faceEntitiesDict[' '.join([str(x) for x in sorted(face)])] = (physicalEntity, geometricalEntity)
-
-            self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
-            for face in list(facesDict.keys()):
-                # not all faces are necessarily tagged
-                if face in faceEntitiesDict:
-                    self.physicalFaceMap[facesDict[face]] = faceEntitiesDict[face][0]
-                    self.geometricalFaceMap[facesDict[face]] = faceEntitiesDict[face][1]
-
-            self.physicalNames = self._parseNamesFile()
-
-        finally:
-            os.unlink(self.nodesPath)
-            os.unlink(self.elemsPath)
-            if self.namesPath is not None:
-                os.unlink(self.namesPath)
-
-        # convert lists of cell vertices to a properly oriented masked array
-        maxVerts = max([len(v) for v in cellsToVertIDs])
-        # ticket:539 - NumPy 1.7 casts to array before concatenation and empty array defaults to float
-        cellsToVertIDs = [nx.concatenate((v, nx.array([-1] * (maxVerts-len(v)), dtype=nx.INT_DTYPE))) for v in cellsToVertIDs]
-        cellsToVertIDs = nx.MA.masked_equal(cellsToVertIDs, value=-1).swapaxes(0, 1)
+             facesData,
+             nodeIDs,
+             nodeCoords) = self.communicator.scatter(partitions)
+        else:
+            [(cellsData, ghostsData, facesData)] = self._partitionElements(elements)
+
+        allCells = _ElementData.concatenate([cellsData, ghostsData])
+        numCellsTotal = len(allCells)
+        self.physicalCellMap = allCells.physicalEntities
+        self.geometricalCellMap = allCells.geometricalEntities
+
+        if numCellsTotal < 1:
+            errStr = "Gmsh hasn't produced any cells! Check your Gmsh code."
+            errStr += "\n\nGmsh output:\n%s" % "".join(self.gmshOutput).rstrip()
+            raise GmshException(errStr)
+
+        parprint("Recovering coords.")
+        parprint("numcells %d" % numCellsTotal)
+        vertexCoords, vertIDtoIdx = self._vertexCoordsAndMap(allCells.nodes,
+                                                             nodeIDs, nodeCoords)
+
+        # translate Gmsh IDs to `vertexCoord` indices
+        cellsToVertIDs = self._translateNodesToVertices(allCells.nodes,
+                                                        vertIDtoIdx)
+
+        parprint("Building cells and faces.")
+        (facesToV,
+         cellsToF,
+         faceKeys) = self._deriveCellsAndFaces(allCells.split(cellsToVertIDs),
+                                               allCells.shapes,
+                                               numCellsTotal)
+
+        # cell entities were easy to record on parsing
+        # but we don't use Gmsh faces, so we need to correlate the nodes
+        # that make up the Gmsh faces with the vertex IDs of the FiPy faces
+        # so that we can check if any are named
+
+        # translate Gmsh IDs to `vertexCoord` indices
+        facesToVertIDs = self._translateNodesToVertices(facesData.nodes,
+                                                        vertIDtoIdx)
+
+        self.physicalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
+        self.geometricalFaceMap = nx.zeros(facesToV.shape[-1:], 'l')
+
+        taggedFaceIDs, tagged = self._matchFaces(faceKeys, facesData.split(facesToVertIDs))
+        # not all faces are necessarily tagged
+        self.physicalFaceMap[taggedFaceIDs] = facesData.physicalEntities[tagged]
+        self.geometricalFaceMap[taggedFaceIDs] = facesData.geometricalEntities[tagged]
+
+        self.physicalNames = self._parsePhysicalNames(namesText)
+
+        # convert cell vertices to a properly oriented masked array
+        numVerts = nx.diff(allCells.nodeOffsets)
+        padded = -nx.ones((numCellsTotal, numVerts.max()), dtype=nx.INT_DTYPE)
+        padded[nx.repeat(nx.arange(numCellsTotal), numVerts),
+               nx.arange(len(cellsToVertIDs)) - nx.repeat(allCells.nodeOffsets[:-1], numVerts)] = cellsToVertIDs
+        cellsToVertIDs = nx.MA.masked_equal(padded, value=-1).swapaxes(0, 1)
 
         parprint("Done with cells and faces.")
         return (vertexCoords, facesToV, cellsToF,
-                cellsData.idmap, ghostsData.idmap,
+                cellsData.ids.tolist(), ghostsData.ids.tolist(),
                 cellsToVertIDs)
 
     def write(self, obj, time=0.0, timeindex=0):
@@ -998,160 +1237,143 @@ class MSHFile(GmshFile):
 
         self.fileobj.write("$EndElementData\n")
 
-    def _vertexCoordsAndMap(self, cellsToGmshVerts):
+    def _vertexCoordsAndMap(self, cellNodes, nodeIDs, nodeCoords):
         """
         Returns `vertexCoords` and mapping from Gmsh ID to `vertexCoords`
-        indices (same as in `MSHFile`).
-
-        Unlike parent, doesn't use `genfromtxt`
-        because we want to avoid loading the entire `.msh` file into memory.
+        indices.
+
+        Only the nodes of cells become vertices, in order of Gmsh ID.
+
+        >>> f = MSHFile(filename=os.devnull, dimensions=2, coordDimensions=2)
+        >>> vertexCoords, vertexMap = f._vertexCoordsAndMap(nx.array([7, 3, 5, 3]),
+        ...                                                 nx.array([3, 4, 7, 5]),
+        ...                                                 nx.array([[0., 0., 0.],
+        ...                                                           [1., 0., 0.],
+        ...                                                           [1., 1., 0.],
+        ...                                                           [0., 1., 0.]]))
+        >>> print(vertexCoords)
+        [[ 0.  0.  1.]
+         [ 0.  1.  1.]]
+        >>> print(vertexMap)
+        [-1 -1 -1  0 -1  1 -1  2]
         """
-        allVerts     = [v for c in cellsToGmshVerts for v in c] # flatten
-        allVerts     = nx.unique(nx.array(allVerts, dtype=nx.INT_DTYPE)) # remove dups
-        allVerts     = nx.sort(allVerts)
-        maxVertIdx   = allVerts[-1] + 1 # add one to offset zero
-        vertGIDtoIdx = nx.ones(maxVertIdx, 'l') * -1 # gmsh ID -> vertexCoords idx
-        vertexCoords = nx.empty((len(allVerts), self.coordDimensions))
-        nodeCount    = 0
-
-        # establish map. This works because allVerts is a sorted set.
+        allVerts     = nx.unique(cellNodes) # sorted, without duplicates
+        vertGIDtoIdx = nx.ones(allVerts[-1] + 1, 'l') * -1 # gmsh ID -> vertexCoords idx
         vertGIDtoIdx[allVerts] = nx.arange(len(allVerts))
 
-        nodesFile = open(self.nodesPath, 'r')
-        nodesFile.readline() # skip number of nodes
-
-        # now we walk through node file with a sorted unique list of vertices
-        # in hand. When we encounter 0th element in `allVerts`, save it
-        # to `vertexCoords` then pop its ID off `allVerts`.
-        for node in nodesFile:
-            line   = node.split()
-            nodeID = int(line[0])
-
-            if nodeID == allVerts[nodeCount]:
-                newVert = [float(x) for x in line[1:self.coordDimensions+1]]
-                vertexCoords[nodeCount,:] = nx.array(newVert)
-                nodeCount += 1
-
-            if len(allVerts) == nodeCount:
-                break
-
-        nodesFile.close()
+        # Gmsh IDs needn't be in order in the file
+        order = nx.argsort(nodeIDs, kind='stable')
+        rows = order[nx.searchsorted(nodeIDs[order], allVerts)]
+        vertexCoords = nodeCoords[rows, :self.coordDimensions]
 
         # transpose for FiPy
         transCoords = vertexCoords.swapaxes(0, 1)
         return transCoords, vertGIDtoIdx
 
-    def _parseElementFile(self):
+    def _partitionElements(self, elements, numberOfPartitions=None):
         """
-        Return three objects, the first for non-ghost cells, the second for
-        ghost cells, and the third for faces.
+        Return three `_ElementData` for each partition, the first for
+        non-ghost cells, the second for ghost cells, and the third for
+        faces.
 
         All nastiness concerning ghost cell
         calculation is consolidated here: if we were ever to need to CALCULATE
         GHOST CELLS OURSELVES, the only code we'd have to change is in here.
-        """
-
-        def _parseTags(offset, currLineInts):
-            if offset == -1:
-                # if first valid shape
-                offset = currLineInts[0]
-
-            numTags = currLineInts[2]
-            tags    = currLineInts[3:(3+numTags)]
-
-            # the partition tags for don't seem to always be present
-            # and don't always make much sense when they are
-
-            if len(tags) >= 2:
-                physicalEntity = tags.pop(0)
-                geometricalEntity = tags.pop(0)
-            else:
-                physicalEntity = geometricalEntity = -1
-
-            return offset, tags, physicalEntity, geometricalEntity
-
-
-        cellsData = _ElementData()
-        ghostsData = _ElementData()
-        facesData = _ElementData()
-
-        cellOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
-        faceOffset = -1 # this will be subtracted from gmsh ID to obtain global ID
-        pid = self.communicator.procID + 1
-
-        elemsFile = open(self.elemsPath, 'r')
-
-        elemsFile.readline() # skip number of elements
-        for el in elemsFile:
-            currLineInts = [int(x) for x in el.split()]
-            elemType     = currLineInts[1]
-
-            if elemType in list(self.numFacesPerCell.keys()):
-                # element is a cell
-
-                (cellOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=cellOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= cellOffset
-
-                if len(tags) > 0:
-                    # next item is a count
-                    if tags[0] != len(tags) - 1:
-                        warnings.warn("Partition count %d does not agree with number of remaining tags %d." % (tags[0], len(tags) - 1),
-                                      SyntaxWarning, stacklevel=2)
-                    tags = tags[1:]
-
-                if self.communicator.Nproc > 1:
-                    for tag in tags:
-                        if -tag == pid:
-                            # if we're collecting ghost cells and this is our ghost cell
-                            ghostsData.add(currLine=currLineInts, elType=elemType,
-                                           physicalEntity=physicalEntity,
-                                           geometricalEntity=geometricalEntity)
-                        elif tag == pid:
-                            # el is in this processor's partition or we collect all cells
-                            cellsData.add(currLine=currLineInts, elType=elemType,
-                                          physicalEntity=physicalEntity,
-                                          geometricalEntity=geometricalEntity)
-                else:
-                    # we collect all cells
-                    cellsData.add(currLine=currLineInts, elType=elemType,
-                                  physicalEntity=physicalEntity,
-                                  geometricalEntity=geometricalEntity)
-            elif elemType in list(self.numVertsPerFace.keys()):
-                # element is a face
-
-                (faceOffset,
-                 tags,
-                 physicalEntity,
-                 geometricalEntity) = _parseTags(offset=faceOffset,
-                                                 currLineInts=currLineInts)
-                currLineInts[0] -= faceOffset
-
-                facesData.add(currLine=currLineInts, elType=elemType,
-                              physicalEntity=physicalEntity,
-                              geometricalEntity=geometricalEntity)
-
-        elemsFile.close()
 
-        return cellsData, ghostsData, facesData
-
-
-    def _parseNamesFile(self):
+        >>> f = MSHFile(filename=os.devnull, dimensions=2)
+        >>> f.numVertsPerFace = {1: 2}
+        >>> f.numFacesPerCell = {2: 3}
+        >>> elements = f._parseElements(b'''5
+        ... 7 1 2 4 1 1 2
+        ... 8 1 2 4 1 5 6
+        ... 10 2 5 0 1 2 1 -2 1 2 3
+        ... 11 2 5 0 1 2 2 -1 2 4 3
+        ... 12 2 4 0 1 1 2 4 5 3
+        ... ''')
+
+        Without partitions, all cells are taken
+
+        >>> [(cells, ghosts, faces)] = f._partitionElements(elements)
+        >>> print(cells.ids, len(ghosts), faces.ids)
+        [0 1 2] 0 [0 1]
+
+        Partitions take their cells and ghost cells, and those faces whose
+        nodes are all in their cells
+
+        >>> for cells, ghosts, faces in f._partitionElements(elements,
+        ...                                                  numberOfPartitions=2):
+        ...     print(cells.ids, ghosts.ids, faces.ids)
+        [0] [1] [0]
+        [1 2] [0] [0]
+        """
+        isCell = nx.in1d(elements.shapes, list(self.numFacesPerCell.keys()))
+        isFace = nx.in1d(elements.shapes, list(self.numVertsPerFace.keys()))
+
+        faces = elements.take(isFace)
+        # offsets are subtracted from gmsh ID to obtain global ID
+        if isFace.any():
+            faces.ids = faces.ids - elements.ids[isFace][0]
+        cellOffset = elements.ids[isCell][0] if isCell.any() else 0
+
+        def _offsetCells(data):
+            data.ids = data.ids - cellOffset
+            return data
+
+        if numberOfPartitions is None:
+            # we collect all cells
+            return [(_offsetCells(elements.take(isCell)),
+                     _offsetCells(elements.take(nx.zeros_like(isCell))),
+                     faces)]
+
+        # the partition tags are in the partition
+        # or, if negative, the partitions that it is a ghost of.
+        # Group the cells by tag, with each partition's own cells
+        # followed by its ghosts, so that each group is a slice.
+        tagged = nx.repeat(nx.arange(len(elements)), nx.diff(elements.partitionOffsets))
+        tags = elements.partitions
+        keep = (isCell[tagged] & (tags != 0) & (abs(tags) <= numberOfPartitions))
+        tagged, tags = tagged[keep], tags[keep]
+        groups = 2 * (abs(tags) - 1) + (tags < 0)
+        grouped = tagged[nx.argsort(groups, kind="stable")]
+        bounds = nx.concatenate(([0], nx.cumsum(nx.bincount(groups,
+                                                            minlength=2 * numberOfPartitions))))
+
+        # the faces of each node, to find the faces of each partition
+        # without searching all of them
+        numFaceNodes = nx.diff(faces.nodeOffsets)
+        faceOfNode = nx.repeat(nx.arange(len(faces)), numFaceNodes)
+        byNode = nx.argsort(faces.nodes, kind="stable")
+        sortedFaceNodes = faces.nodes[byNode]
+
+        partitions = []
+        for pid in range(numberOfPartitions):
+            cellsData = _offsetCells(elements.take(grouped[bounds[2 * pid]:bounds[2 * pid + 1]]))
+            ghostsData = _offsetCells(elements.take(grouped[bounds[2 * pid + 1]:bounds[2 * pid + 2]]))
+
+            # other faces can't be faces of this partition
+            vertices = nx.unique(nx.concatenate((cellsData.nodes, ghostsData.nodes)))
+            first = nx.searchsorted(sortedFaceNodes, vertices, side="left")
+            last = nx.searchsorted(sortedFaceNodes, vertices, side="right")
+            found = faceOfNode[byNode[_raggedIndices(first, last - first)]]
+            candidates, numFound = nx.unique(found, return_counts=True)
+            partitions.append((cellsData,
+                               ghostsData,
+                               faces.take(candidates[numFound == numFaceNodes[candidates]])))
+
+        return partitions
+
+    def _parsePhysicalNames(self, text):
         physicalNames = {
             0: dict(),
             1: dict(),
             2: dict(),
             3: dict()
         }
-        if self.namesPath is not None:
-            namesFile = open(self.namesPath, 'r')
-
-            namesFile.readline() # skip number of elements
-            for nm in namesFile:
+        if text is not None:
+            for nm in text.decode('utf-8').splitlines()[1:]: # skip number of names
                 nm = nm.split()
+                if len(nm) == 0:
+                    continue
                 if self.version > 2.0:
                     dim = [int(nm.pop(0))]
                 else:
@@ -1164,10 +1386,30 @@ class MSHFile(GmshFile):
                 for d in dim:
                     physicalNames[d][name] = int(num)
 
-            namesFile.close()
-
         return physicalNames
 
+    def _syncCache(self, mesh):
+        """Store `mesh`, as read from this file, in the mesh cache, if any
+
+        Must be called before `makeMapVariables()`.
+        """
+        if self.cache is not None:
+            arrays = _calculatedGeometry(mesh)
+            arrays.update(vertexCoords=mesh.vertexCoords,
+                          faceVertexIDs=nx.MA.filled(mesh.faceVertexIDs, -1),
+                          cellFaceIDs=nx.MA.filled(mesh.cellFaceIDs, -1),
+                          cellGlobalIDs=nx.array(mesh.cellGlobalIDs, dtype=nx.INT_DTYPE),
+                          gCellGlobalIDs=nx.array(mesh.gCellGlobalIDs, dtype=nx.INT_DTYPE),
+                          orderedCellVertexIDs=mesh._orderedCellVertexIDs_data,
+                          physicalCellMap=self.physicalCellMap,
+                          geometricalCellMap=self.geometricalCellMap,
+                          physicalFaceMap=self.physicalFaceMap,
+                          geometricalFaceMap=self.geometricalFaceMap)
+            self.cache.store(arrays=arrays,
+                             info=dict(dimensions=self.dimensions,
+                                       physicalNames=self.physicalNames,
+                                       Nproc=self.communicator.Nproc))
+
     def makeMapVariables(self, mesh):
         """Utility function to make `MeshVariables` that define different domains in the mesh
         """
@@ -1270,31 +1512,153 @@ class MSHFile(GmshFile):
         """
         pass
 
+class _CachedMSHFile(MSHFile):
+    """Stands in for an `MSHFile` with a mesh read back from the mesh cache
+
+    Parameters
+    ----------
+    arrays : dict of ndarray
+        Arrays stored by `MSHFile._syncCache()`.
+    info : dict
+        Information stored by `MSHFile._syncCache()`.
+    communicator : ~fipy.tools.comms.commWrapper.CommWrapper
+        Generally, `fipy.tools.serialComm` or `fipy.tools.parallelComm`.
+    """
+    def __init__(self, arrays, info, communicator):
+        self.arrays = dict(arrays)
+        self.dimensions = info["dimensions"]
+        # JSON keys are strings
+        self.physicalNames = dict((int(dim), names)
+                                  for dim, names in info["physicalNames"].items())
+        self.communicator = communicator
+        self.fileIsTemporary = False
+        self.cache = None
+
+        self.physicalCellMap = self.arrays.pop("physicalCellMap")
+        self.geometricalCellMap = self.arrays.pop("geometricalCellMap")
+        self.physicalFaceMap = self.arrays.pop("physicalFaceMap")
+        self.geometricalFaceMap = self.arrays.pop("geometricalFaceMap")
+
+    def read(self):
+        """Returns the same as `MSHFile.read()`
+        """
+        return (self.arrays.pop("vertexCoords"),
+                self.arrays.pop("faceVertexIDs"),
+                self.arrays.pop("cellFaceIDs"),
+                self.arrays.pop("cellGlobalIDs").tolist(),
+                self.arrays.pop("gCellGlobalIDs").tolist(),
+                self.arrays.pop("orderedCellVertexIDs"))
+
+    def close(self):
+        pass
+
+    def _syncCache(self, mesh):
+        """Give `mesh` the geometry that was calculated when it was stored
+        """
+        _restoreGeometry(mesh, self.arrays)
+
 class _ElementData(object):
     """
-    Bookkeeping for cells. Declared as own class for generality.
+    Bookkeeping for elements, as flat arrays rather than one list per element.
 
     :Properties:
-    - `nodes`: A Python list of the vertices that make up this element
-    - `shapes`: A `shapeTypes` Python list
-    - `idmap`: A Python list which maps `vertexCoords` index to global ID
-    - `physicalEntities`: A Python list of the Gmsh physical entities each element is in
-    - `geometricalEntities`: A Python list of the Gmsh geometrical entities each element is in
+    - `ids`: Gmsh ID of each element, less the ID of the first of its kind
+    - `shapes`: Gmsh element type of each element
+    - `physicalEntities`: The Gmsh physical entity each element is in
+    - `geometricalEntities`: The Gmsh geometrical entity each element is in
+    - `nodes`, `nodeOffsets`: The Gmsh nodes of element `i` are
+      `nodes[nodeOffsets[i]:nodeOffsets[i+1]]`
+    - `partitions`, `partitionOffsets`: Likewise, the partitions each element
+      is in, negative for the partitions it is a ghost of
+
+    >>> elements = _ElementData(ids=nx.array([0, 1, 2]),
+    ...                         shapes=nx.array([2, 3, 2]),
+    ...                         physicalEntities=nx.array([5, 5, 6]),
+    ...                         geometricalEntities=nx.array([1, 1, 2]),
+    ...                         nodes=nx.array([1, 2, 3, 2, 4, 5, 3, 5, 6, 7]),
+    ...                         nodeOffsets=nx.array([0, 3, 7, 10]),
+    ...                         partitions=nx.array([1, 2, -1, 2]),
+    ...                         partitionOffsets=nx.array([0, 1, 3, 4]))
+    >>> some = elements.take(nx.array([False, True, True]))
+    >>> print(some.ids)
+    [1 2]
+    >>> print(some.nodeLists)
+    [array([2, 4, 5, 3]), array([5, 6, 7])]
+    >>> print(some.partitions, some.partitionOffsets)
+    [ 2 -1  2] [0 2 3]
+    >>> print(_ElementData.concatenate([some, elements.take([0])]).nodeOffsets)
+    [ 0  4  7 10]
     """
-    def __init__(self):
-        self.nodes = []
-        self.shapes = []
-        self.idmap = [] # vertexCoords idx -> gmsh ID (global ID)
-        self.physicalEntities = []
-        self.geometricalEntities = []
-
-    def add(self, currLine, elType, physicalEntity, geometricalEntity):
-        numTags = currLine[2]
-        self.nodes.append(currLine[(numTags+3):])
-        self.shapes.append(elType)
-        self.idmap.append(currLine[0])
-        self.physicalEntities.append(physicalEntity)
-        self.geometricalEntities.append(geometricalEntity)
+    def __init__(self, ids, shapes, physicalEntities, geometricalEntities,
+                 nodes, nodeOffsets, partitions, partitionOffsets):
+        self.ids = ids
+        self.shapes = shapes
+        self.physicalEntities = physicalEntities
+        self.geometricalEntities = geometricalEntities
+        self.nodes = nodes
+        self.nodeOffsets = nodeOffsets
+        self.partitions = partitions
+        self.partitionOffsets = partitionOffsets
+
+    def __len__(self):
+        return len(self.ids)
+
+    def split(self, values):
+        """Split `values`, one for each node, into an array for each element"""
+        # much quicker than `split()`
+        offsets = self.nodeOffsets.tolist()
+        return [values[begin:end] for begin, end in zip(offsets[:-1], offsets[1:])]
+
+    @property
+    def nodeLists(self):
+        """The Gmsh nodes of each element, as a list of arrays"""
+        return self.split(self.nodes)
+
+    def take(self, which):
+        """The elements selected by indices or by a mask"""
+        which = nx.asarray(which)
+        if which.dtype == bool:
+            which = nx.nonzero(which)[0]
+
+        def _takeRagged(values, offsets):
+            lengths = offsets[which + 1] - offsets[which]
+            return (values[_raggedIndices(offsets[which], lengths)],
+                    nx.concatenate(([0], nx.cumsum(lengths))).astype(nx.INT_DTYPE))
+
+        nodes, nodeOffsets = _takeRagged(self.nodes, self.nodeOffsets)
+        partitions, partitionOffsets = _takeRagged(self.partitions, self.partitionOffsets)
+
+        return _ElementData(ids=self.ids[which],
+                            shapes=self.shapes[which],
+                            physicalEntities=self.physicalEntities[which],
+                            geometricalEntities=self.geometricalEntities[which],
+                            nodes=nodes,
+                            nodeOffsets=nodeOffsets,
+                            partitions=partitions,
+                            partitionOffsets=partitionOffsets)
+
+    @staticmethod
+    def concatenate(elements):
+        """The elements of each of a list of `_ElementData`, one after the other"""
+        def _concatenateRagged(values, offsets):
+            starts = nx.cumsum([0] + [o[-1] for o in offsets[:-1]])
+            return (nx.concatenate(values),
+                    nx.concatenate([[0]] + [o[1:] + start
+                                            for o, start in zip(offsets, starts)]).astype(nx.INT_DTYPE))
+
+        nodes, nodeOffsets = _concatenateRagged([e.nodes for e in elements],
+                                                [e.nodeOffsets for e in elements])
+        partitions, partitionOffsets = _concatenateRagged([e.partitions for e in elements],
+                                                          [e.partitionOffsets for e in elements])
+
+        return _ElementData(ids=nx.concatenate([e.ids for e in elements]),
+                            shapes=nx.concatenate([e.shapes for e in elements]),
+                            physicalEntities=nx.concatenate([e.physicalEntities for e in elements]),
+                            geometricalEntities=nx.concatenate([e.geometricalEntities for e in elements]),
+                            nodes=nodes,
+                            nodeOffsets=nodeOffsets,
+                            partitions=partitions,
+                            partitionOffsets=partitionOffsets)
 
 class _GmshTopology(_MeshTopology):
 
@@ -1599,13 +1963,12 @@ class Gmsh2D(Mesh2D):
                  overlap=1,
                  background=None):
 
-        self.mshFile = openMSHFile(arg,
-                                   dimensions=2,
-                                   coordDimensions=coordDimensions,
-                                   communicator=communicator,
-                                   overlap=overlap,
-                                   mode='r',
-                                   background=background)
+        self.mshFile = _openCachedMSHFile(arg,
+                                          dimensions=2,
+                                          coordDimensions=coordDimensions,
+                                          communicator=communicator,
+                                          overlap=overlap,
+                                          background=background)
 
         # openMSHFile may have "downgraded" the communicator
         # if, e.g., too many overlaps were requested
@@ -1631,6 +1994,8 @@ class Gmsh2D(Mesh2D):
                               communicator=communicator,
                               _TopologyClass=_GmshTopology)
 
+        self.mshFile._syncCache(mesh=self)
+
         (self.physicalCellMap,
          self.geometricalCellMap,
          self.physicalCells,
@@ -1991,12 +2356,11 @@ class Gmsh3D(Mesh):
         Specifies the desired characteristic lengths of the mesh cells
     """
     def __init__(self, arg, communicator=parallelComm, overlap=1, background=None):
-        self.mshFile  = openMSHFile(arg,
-                                    dimensions=3,
-                                    communicator=communicator,
-                                    overlap=overlap,
-                                    mode='r',
-                                    background=background)
+        self.mshFile  = _openCachedMSHFile(arg,
+                                           dimensions=3,
+                                           communicator=communicator,
+                                           overlap=overlap,
+                                           background=background)
 
         # openMSHFile may have "downgraded" the communicator
         # if, e.g., too many overlaps were requested
@@ -2020,6 +2384,8 @@ class Gmsh3D(Mesh):
         if self.communicator.Nproc > 1:
             self.globalNumberOfCells = self.communicator.sum(len(self.cellGlobalIDs))
 
+        self.mshFile._syncCache(mesh=self)
+
         (self.physicalCellMap,
          self.geometricalCellMap,
          self.physicalCells,
@@ -51,22 +51,153 @@ class Mesh(AbstractMesh):
 
         self.faceCellIDs = self._calcFaceCellIDs()
 
+        # topology and geometry are calculated when first needed, so this
+        # only discards what may be left from an earlier initialization
         self._setTopology()
         self._setGeometry(scaleLength = 1.)
 
+    """
+    Calculation on demand
+    """
+
+    # Each attribute is calculated the first time it is needed, by the
+    # method named alongside it, and then kept in the instance `__dict__`.
+    # A method may calculate several attributes at once.  Attributes that
+    # are assigned, or modified in place, stay as they are until discarded.
+
+    _topology = (
+        ("_calcInteriorAndExteriorFaceIDs", ("_interiorFaces", "_exteriorFaces")),
+        ("_calcInteriorAndExteriorCellIDs", ("_interiorCellIDs", "_exteriorCellIDs")),
+        ("_calcCellToFaceOrientations", ("_cellToFaceOrientations",)),
+        ("_calcAdjacentCellIDs", ("_adjacentCellIDs",)),
+        ("_calcCellToCellIDs", ("_cellToCellIDs",)),
+        ("_calcCellToCellIDsFilled", ("_cellToCellIDsFilled",)),
+        ("_calcCellFaceConnectivity", ("_cellFaceOffsets",
+                                       "_cellFaceIndices",
+                                       "_cellFaceOrientations")),
+        ("_calcFaceVertexConnectivity", ("_faceVertexOffsets", "_faceVertexIndices")),
+        ("_calcSparsityPatterns", ("_sparsityPatterns",)),
+        ("_calcMatrixFreeFaceIDs", ("_matrixFreeFaceIDs",)),
+    )
+
+    _geometry = (
+        ("_calcFaceCenters", ("_faceCenters",)),
+        ("_calcFaceAreas", ("_faceAreas",)),
+        ("_calcCellCenters", ("_cellCenters",)),
+        ("_calcFaceToCellDistAndVec", ("_faceToCellDistances", "_cellToFaceDistanceVectors")),
+        ("_calcCellDistAndVec", ("_cellDistances", "_cellDistanceVectors")),
+        ("_calcFaceNormals", ("faceNormals",)),
+        ("_calcOrientedFaceNormals", ("_orientedFaceNormals",)),
+        ("_calcCellVolumes", ("_cellVolumes",)),
+        ("_calcFaceCellToCellNormals", ("_faceCellToCellNormals",)),
+        ("_calcFaceTangents", ("_faceTangents1", "_faceTangents2")),
+        ("_calcCellToCellDist", ("_cellToCellDistances",)),
+        ("_calcCellAreas", ("_cellAreas",)),
+        ("_calcCellNormals", ("_cellNormals",)),
+        ("_calcLeastSquaresGradMatrix", ("_leastSquaresDistanceNormals",
+                                         "_leastSquaresAdjugate",
+                                         "_leastSquaresDeterminant")),
+        ("_calcCellFacePlanes", ("_cellFacePlaneNormals",
+                                 "_cellFacePlaneOffsets",
+                                 "_vertexBounds")),
+    )
+
+    _scaledGeometry = (
+        ("_calcScaledFaceAreas", ("_scaledFaceAreas",)),
+        ("_calcScaledCellVolumes", ("_scaledCellVolumes",)),
+        ("_calcScaledCellCenters", ("_scaledCellCenters",)),
+        ("_calcScaledFaceToCellDistances", ("_scaledFaceToCellDistances",)),
+        ("_calcScaledCellDistances", ("_scaledCellDistances",)),
+        ("_calcScaledCellToCellDistances", ("_scaledCellToCellDistances",)),
+        ("_calcAreaProjections", ("_areaProjections",)),
+        ("_calcOrientedAreaProjections", ("_orientedAreaProjections",)),
+        ("_calcFaceToCellDistanceRatio", ("_faceToCellDistanceRatio",)),
+        ("_calcFaceAspectRatios", ("_faceAspectRatios",)),
+        ("_calcCellCenterTree", ("_cellCenterTree",)),
+    )
+
+    # geometry that depends on which cells are on either side of a face,
+    # rather than on the vertices alone
+    _connectedGeometry = (
+        ("_calcFaceCellToCellNormals", ("_faceCellToCellNormals",)),
+        ("_calcCellToCellDist", ("_cellToCellDistances",)),
+        ("_calcCellAreas", ("_cellAreas",)),
+        ("_calcCellNormals", ("_cellNormals",)),
+        ("_calcLeastSquaresGradMatrix", ("_leastSquaresDistanceNormals",
+                                         "_leastSquaresAdjugate",
+                                         "_leastSquaresDeterminant")),
+        ("_calcCellFacePlanes", ("_cellFacePlaneNormals",
+                                 "_cellFacePlaneOffsets",
+                                 "_vertexBounds")),
+    )
+
+    _calculations = dict((name, (calculate, names))
+                         for calculate, names in _topology + _geometry + _scaledGeometry
+                         for name in names)
+
+    def __getattr__(self, name):
+        """Calculate a topological or geometric attribute of the mesh
+
+        Only called when `name` is not found by the usual means, i.e.,
+        when it has not been calculated yet.
+
+        >>> from fipy.meshes.tri2D import Tri2D
+        >>> mesh = Tri2D(nx=2, ny=2)
+        >>> "_cellVolumes" in mesh.__dict__
+        False
+        >>> print(mesh.cellVolumes)
+        [ 0.25  0.25  0.25  0.25  0.25  0.25  0.25  0.25  0.25  0.25  0.25  0.25
+          0.25  0.25  0.25  0.25]
+        >>> print(sorted(mesh._calculatedNbytes.keys())) # doctest: +NORMALIZE_WHITESPACE
+        ['_cellCenters', '_cellDistanceVectors', '_cellDistances',
+         '_cellFaceIndices', '_cellFaceOffsets', '_cellFaceOrientations',
+         '_cellToFaceDistanceVectors', '_cellToFaceOrientations',
+         '_cellVolumes', '_faceAreas', '_faceCenters',
+         '_faceToCellDistances', '_faceVertexIndices', '_faceVertexOffsets',
+         '_scaledCellVolumes', 'faceNormals']
+
+        Attributes that are not calculated are simply missing
+
+        >>> mesh._faceFoo
+        Traceback (most recent call last):
+            ...
+        AttributeError: 'Tri2D' object has no attribute '_faceFoo'
+        """
+        try:
+            calculate, names = Mesh._calculations[name]
+        except KeyError:
+            raise AttributeError("'%s' object has no attribute '%s'"
+                                 % (self.__class__.__name__, name))
+
+        values = getattr(self, calculate)()
+        if len(names) == 1:
+            values = (values,)
+        for other, value in zip(names, values):
+            # don't overwrite a sibling that was assigned
+            self.__dict__.setdefault(other, value)
+
+        return self.__dict__[name]
+
+    def _discard(self, calculations):
+        """Forget attributes, so that they are calculated again when next needed
+        """
+        for calculate, names in calculations:
+            for name in names:
+                self.__dict__.pop(name, None)
+
+    @property
+    def _calculatedNbytes(self):
+        """Memory held by each attribute calculated so far"""
+        return dict((name, numerix.asarray(self.__dict__[name]).nbytes)
+                    for name in Mesh._calculations
+                    if name in self.__dict__)
+
     """
     Topology set and calculate
     """
 
     def _setTopology(self):
-        (self._interiorFaces,
-         self._exteriorFaces) = self._calcInteriorAndExteriorFaceIDs()
-        (self._interiorCellIDs,
-         self._exteriorCellIDs) = self._calcInteriorAndExteriorCellIDs()
-        self._cellToFaceOrientations = self._calcCellToFaceOrientations()
-        self._adjacentCellIDs = self._calcAdjacentCellIDs()
-        self._cellToCellIDs = self._calcCellToCellIDs()
-        self._cellToCellIDsFilled = self._calcCellToCellIDsFilled()
+        self._discard(self._topology)
 
     def _calcInteriorAndExteriorFaceIDs(self):
         from fipy.variables.faceVariable import FaceVariable
@@ -78,19 +209,11 @@ class Mesh(AbstractMesh):
         return interiorFaces, exteriorFaces
 
     def _calcInteriorAndExteriorCellIDs(self):
-        try:
-            import sys
-            if sys.version_info < (2, 6):
-                from sets import Set as set
-            exteriorCellIDs = set(self.faceCellIDs[0, self._exteriorFaces.value])
-            interiorCellIDs = list(set(range(self.numberOfCells)) - self._exteriorCellIDs)
-            exteriorCellIDs = list(self._exteriorCellIDs)
-        except:
-            exteriorCellIDs = self.faceCellIDs[0, self._exteriorFaces.value]
-            tmp = numerix.zeros(self.numberOfCells, 'l')
-            numerix.put(tmp, exteriorCellIDs, numerix.ones(len(exteriorCellIDs), 'l'))
-            exteriorCellIDs = numerix.nonzero(tmp)
-            interiorCellIDs = numerix.nonzero(numerix.logical_not(tmp))
+        exteriorCellIDs = self.faceCellIDs[0, self._exteriorFaces.value]
+        tmp = numerix.zeros(self.numberOfCells, 'l')
+        numerix.put(tmp, exteriorCellIDs, numerix.ones(len(exteriorCellIDs), 'l'))
+        exteriorCellIDs = numerix.nonzero(tmp)
+        interiorCellIDs = numerix.nonzero(numerix.logical_not(tmp))
         return interiorCellIDs, exteriorCellIDs
 
     def _calcCellToFaceOrientations(self):
@@ -116,31 +239,40 @@ class Mesh(AbstractMesh):
         return MA.where(MA.getmaskarray(self._cellToCellIDs), cellIDs,
                         self._cellToCellIDs)
 
+    def _calcCellFaceConnectivity(self):
+        # the cells are the columns of `cellFaceIDs`
+        valid = numerix.logical_not(MA.getmaskarray(self.cellFaceIDs)).T
+        offsets = numerix.concatenate(([0], numerix.cumsum(valid.sum(axis=1))))
+        indices = numerix.asarray(MA.filled(self.cellFaceIDs, 0)).T[valid]
+        orientations = numerix.asarray(MA.filled(self._cellToFaceOrientations, 0)).T[valid]
+        return offsets, indices, orientations
+
+    def _calcFaceVertexConnectivity(self):
+        # the faces are the columns of `faceVertexIDs`
+        valid = numerix.logical_not(MA.getmaskarray(self.faceVertexIDs)).T
+        offsets = numerix.concatenate(([0], numerix.cumsum(valid.sum(axis=1))))
+        indices = numerix.asarray(MA.filled(self.faceVertexIDs, 0)).T[valid]
+        return offsets, indices
+
+    def _calcSparsityPatterns(self):
+        # filled by the matrices built on this mesh, which depend on
+        # which cells are next to which
+        return {}
+
+    def _calcMatrixFreeFaceIDs(self):
+        # the cells on either side of each interior face, which
+        # matrix-free matrices apply the face coefficients between
+        interiorFaces = numerix.nonzero(self.interiorFaces)[0]
+        return tuple(numerix.take(ids, interiorFaces) for ids in self._adjacentCellIDs)
+
     """
     Geometry set and calculate
     """
 
     def _setGeometry(self, scaleLength = 1.):
-        self._faceCenters = self._calcFaceCenters()
-        self._faceAreas = self._calcFaceAreas()
-        self._cellCenters = self._calcCellCenters()
-        (self._internalFaceToCellDistances,
-         self._cellToFaceDistanceVectors) = self._calcFaceToCellDistAndVec()
-        (self._internalCellDistances,
-         self._cellDistanceVectors) = self._calcCellDistAndVec()
-        self.faceNormals = self._calcFaceNormals()
-        self._orientedFaceNormals = self._calcOrientedFaceNormals()
-        self._cellVolumes = self._calcCellVolumes()
-        self._faceCellToCellNormals = self._calcFaceCellToCellNormals()
-        (self._faceTangents1,
-         self._faceTangents2) = self._calcFaceTangents()
-        self._cellToCellDistances = self._calcCellToCellDist()
-
+        self._discard(self._geometry)
         self._setScaledGeometry(self.scale['length'])
 
-        self._cellAreas = self._calcCellAreas()
-        self._cellNormals = self._calcCellNormals()
-
     def _calcFaceAreas(self):
         faceVertexIDs = MA.filled(self.faceVertexIDs, -1)
         substitute = numerix.repeat(faceVertexIDs[numerix.newaxis, 0],
@@ -160,20 +292,12 @@ class Mesh(AbstractMesh):
         return numerix.sqrtDot(cross, cross) / 2.
 
     def _calcFaceCenters(self):
-        maskedFaceVertexIDs = MA.filled(self.faceVertexIDs, 0)
-
-        faceVertexCoords = numerix.take(self.vertexCoords, maskedFaceVertexIDs, axis=1)
-
-        if MA.getmask(self.faceVertexIDs) is False:
-            faceVertexCoordsMask = numerix.zeros(numerix.shape(faceVertexCoords), 'l')
-        else:
-            faceVertexCoordsMask = \
-              numerix.repeat(MA.getmaskarray(self.faceVertexIDs)[numerix.newaxis, ...],
-                             self.dim, axis=0)
-
-        faceVertexCoords = MA.array(data=faceVertexCoords, mask=faceVertexCoordsMask)
-
-        return MA.filled(MA.average(faceVertexCoords, axis=1))
+        offsets = self._faceVertexOffsets
+        if len(self._faceVertexIndices) == 0:
+            return numerix.zeros((self.dim, self.numberOfFaces), 'd')
+        faceVertexCoords = numerix.take(self.vertexCoords, self._faceVertexIndices, axis=1)
+        return (numerix.add.reduceat(faceVertexCoords, offsets[:-1], axis=1)
+                / numerix.diff(offsets))
 
     @property
     def _rightHandOrientation(self):
@@ -224,12 +348,12 @@ class Mesh(AbstractMesh):
 
     def _calcCellVolumes(self):
         tmp = self._faceCenters[0] * self._faceAreas * self.faceNormals[0]
-        tmp = numerix.take(tmp, self.cellFaceIDs) * self._cellToFaceOrientations
-        return MA.filled(MA.sum(tmp, 0))
+        tmp = numerix.take(tmp, self._cellFaceIndices) * self._cellFaceOrientations
+        return self._sumOverCellFaces(tmp)
 
     def _calcCellCenters(self):
-        tmp = numerix.take(self._faceCenters, self.cellFaceIDs, axis=1)
-        return MA.filled(MA.average(tmp, 1))
+        tmp = numerix.take(self._faceCenters, self._cellFaceIndices, axis=1)
+        return self._sumOverCellFaces(tmp) / numerix.diff(self._cellFaceOffsets)
 
     def _calcFaceToCellDistAndVec(self):
         tmp = MA.repeat(self._faceCenters[..., numerix.NewAxis,:], 2, 1)
@@ -277,26 +401,6 @@ class Mesh(AbstractMesh):
         else:
             return cellNormals
 
-    """settable geometry properties"""
-    def _getFaceToCellDistances(self):
-        return self._internalFaceToCellDistances
-
-    def _setFaceToCellDistances(self, v):
-        self._internalFaceToCellDistances = v
-        self._setScaledValues()
-
-    _faceToCellDistances = property(_getFaceToCellDistances,
-                                    _setFaceToCellDistances)
-
-    def _getCellDistances(self):
-        return self._internalCellDistances
-
-    def _setCellDistances(self, v):
-        self._internalCellDistances = v
-        self._setScaledValues()
-
-    _cellDistances = property(_getCellDistances, _setCellDistances)
-
     """
     Scaled geometry set and calc
     """
@@ -311,6 +415,9 @@ class Mesh(AbstractMesh):
         """
         Set the scale by length.
 
+        The scaled geometry is discarded and, when next needed, calculated
+        with the scale at the time of this call.
+
         Parameters
         ----------
         val : float
@@ -324,22 +431,28 @@ class Mesh(AbstractMesh):
 
         self._scale['area'] = self._calcAreaScale()
         self._scale['volume'] = self._calcVolumeScale()
-        self._setScaledValues()
-
-    def _setScaledValues(self):
-        self._scaledFaceAreas = self._scale['area'] * self._faceAreas
-        self._scaledCellVolumes = self._scale['volume'] * self._cellVolumes
-        self._scaledCellCenters = self._scale['length'] * self._cellCenters
-        self._scaledFaceToCellDistances = self._scale['length'] * self._faceToCellDistances
-        self._scaledCellDistances = self._scale['length'] * self._cellDistances
-        self._setFaceDependentScaledValues()
-
-    def _setFaceDependentScaledValues(self):
-        self._scaledCellToCellDistances = self._scale['length'] * self._cellToCellDistances
-        self._areaProjections = self._calcAreaProjections()
-        self._orientedAreaProjections = self._calcOrientedAreaProjections()
-        self._faceToCellDistanceRatio = self._calcFaceToCellDistanceRatio()
-        self._faceAspectRatios = self._calcFaceAspectRatios()
+
+        # `_scale` is shared by all meshes
+        self._geometryScale = self._scale.copy()
+        self._discard(self._scaledGeometry)
+
+    def _calcScaledFaceAreas(self):
+        return self._geometryScale['area'] * self._faceAreas
+
+    def _calcScaledCellVolumes(self):
+        return self._geometryScale['volume'] * self._cellVolumes
+
+    def _calcScaledCellCenters(self):
+        return self._geometryScale['length'] * self._cellCenters
+
+    def _calcScaledFaceToCellDistances(self):
+        return self._geometryScale['length'] * self._faceToCellDistances
+
+    def _calcScaledCellDistances(self):
+        return self._geometryScale['length'] * self._cellDistances
+
+    def _calcScaledCellToCellDistances(self):
+        return self._geometryScale['length'] * self._cellToCellDistances
 
     def _calcAreaScale(self):
         return self.scale['length']**2
@@ -411,6 +524,16 @@ class Mesh(AbstractMesh):
         newmesh = Mesh(newCoords, numerix.array(self.faceVertexIDs), numerix.array(self.cellFaceIDs))
         return newmesh
 
+    def _connectFaces(self, faces0, faces1):
+        # geometry that `_connectFaces` doesn't fix up must be calculated
+        # from the cells as they are before they are connected
+        for calculate, names in self._geometry:
+            if (calculate, names) not in self._connectedGeometry:
+                for name in names:
+                    getattr(self, name)
+
+        super(Mesh, self)._connectFaces(faces0, faces1)
+
     def _handleFaceConnection(self):
         """
         The `_faceCellToCellNormals` were added to ensure `faceNormals == _faceCellToCellNormals` for periodic grids.
@@ -420,10 +543,46 @@ class Mesh(AbstractMesh):
         >>> (m.faceNormals == m._faceCellToCellNormals).all()
         True
 
+        Everything calculated from which cells are next to which is
+        forgotten when faces are connected, including the least-squares
+        gradient, the nearest cells and the sparsity patterns of matrices
+
+        >>> from fipy.meshes.nonUniformGrid2D import NonUniformGrid2D
+        >>> m = NonUniformGrid2D(nx=4, ny=1)
+        >>> x = CellVariable(mesh=m, value=m.cellCenters[0])
+        >>> print(x.leastSquaresGrad[0])
+        [ 0.8  1.   1.   0.8]
+        >>> print(m._getNearestCellID(((3.9,), (0.5,))))
+        [3]
+        >>> eq = DiffusionTerm()
+        >>> eq.cacheMatrix()
+        >>> eq.solve(var=CellVariable(mesh=m), solver=DummySolver())
+        >>> from fipy.matrices.matrixFreeMatrix import _MatrixFreeMeshMatrix
+        >>> _, L, b = eq._buildAndAddMatrices(CellVariable(mesh=m), _MatrixFreeMeshMatrix)
+        >>> m._connectFaces(numerix.nonzero(m.facesLeft), numerix.nonzero(m.facesRight))
+        >>> print(CellVariable(mesh=m, value=m.cellCenters[0]).leastSquaresGrad[0])
+        [-1.  1.  1. -1.]
+        >>> print(sorted(name for name in ("_leastSquaresAdjugate", "_cellCenterTree",
+        ...                                "_sparsityPatterns", "_matrixFreeFaceIDs")
+        ...              if name in m.__dict__))
+        ['_leastSquaresAdjugate']
+        >>> eq = DiffusionTerm()
+        >>> eq.cacheMatrix()
+        >>> eq.solve(var=CellVariable(mesh=m), solver=DummySolver())
+        >>> print(eq.matrix.numpyArray)
+        [[-2.  1.  0.  1.]
+         [ 1. -2.  1.  0.]
+         [ 0.  1. -2.  1.]
+         [ 1.  0.  1. -2.]]
+        >>> _, L, b = eq._buildAndAddMatrices(CellVariable(mesh=m), _MatrixFreeMeshMatrix)
+        >>> print(L.numpyArray)
+        [[-2.  1.  0.  1.]
+         [ 1. -2.  1.  0.]
+         [ 0.  1. -2.  1.]
+         [ 1.  0.  1. -2.]]
         """
-        self._cellToCellDistances = self._calcCellToCellDist()
-        self._faceCellToCellNormals = self._calcFaceCellToCellNormals()
-        self._setFaceDependentScaledValues()
+        self._discard(self._connectedGeometry)
+        self._discard(self._scaledGeometry)
 
     """calculate Topology methods"""
 
@@ -545,7 +704,127 @@ class Mesh(AbstractMesh):
            [4 5 7 8]
 
         """
-        return numerix.nearest(data=self.cellCenters.globalValue, points=points)
+        tree = self._cellCenterTree
+        if tree is None:
+            return numerix.nearest(data=self.cellCenters.globalValue, points=points)
+
+        points = numerix.asarray(points)
+        if points.shape[-1] == 0:
+            return numerix.arange(0)
+
+        return tree.query(points.T)[1].astype(numerix.INT_DTYPE)
+
+    def _calcCellCenterTree(self):
+        """KD-tree of the global cell centers.
+
+        `None` if :mod:`scipy.spatial` is unavailable or the mesh has
+        physical dimensions, in which case the brute-force
+        :func:`~fipy.tools.numerix.nearest` is used.
+        """
+        centers = self.cellCenters.globalValue
+        if self.globalNumberOfCells > 0 and not isinstance(centers, PhysicalField):
+            try:
+                from scipy.spatial import cKDTree
+                return cKDTree(numerix.asarray(centers).T)
+            except ImportError:
+                pass
+
+        return None
+
+    def _calcCellFacePlanes(self):
+        # every face of a convex cell bounds a half-space that contains
+        # it; the padded faces bound nothing
+        normals = MA.filled(self._cellNormals, 0.)
+        faceCenters = numerix.take(numerix.asarray(self._faceCenters),
+                                   MA.filled(self.cellFaceIDs, 0), axis=1)
+        offsets = numerix.where(MA.getmaskarray(self.cellFaceIDs),
+                                numerix.inf,
+                                numerix.sum(normals * faceCenters, axis=0))
+        vertexCoords = numerix.asarray(self.vertexCoords)
+        bounds = numerix.array((vertexCoords.min(axis=1), vertexCoords.max(axis=1)))
+        return normals, offsets, bounds
+
+    def _getContainingCellID(self, points, candidates=8):
+        """Return the IDs of the cells that contain `points`.
+
+        The `candidates` cells with the nearest centers are tested, nearest
+        first, against the faces of each (convex) cell.  The search is
+        widened, twice as far each time, for any points that lie in none
+        of them.  Points that lie in no cell at all are assigned to the
+        nearest cell, as are all points when running in parallel.
+
+           >>> from fipy import *
+           >>> m = Grid2D(dx=(1., 4.), dy=(1.,))
+           >>> points = ((1.2, 3.5), (0.5, 0.5))
+           >>> print(m._getNearestCellID(points))
+           [0 1]
+           >>> print(m._getContainingCellID(points))
+           [1 1]
+
+        Points outside of the mesh are assigned to the nearest cell
+
+           >>> print(m._getContainingCellID(((6., -1.), (0.5, 0.5))))
+           [1 0]
+
+        The containing cell may lie beyond many nearer centers
+
+           >>> m = Grid3D(dx=(1.,) * 5, dy=(1.,) * 5, dz=(0.01,) * 4 + (50.,))
+           >>> points = ((0.5, 4.5), (0.5, 4.5), (1., 1.))
+           >>> print(m._getNearestCellID(points))
+           [75 99]
+           >>> print(m._getContainingCellID(points, candidates=2))
+           [100 124]
+        """
+        tree = self._cellCenterTree
+        if tree is None or self.communicator.Nproc > 1:
+            return self._getNearestCellID(points)
+
+        points = numerix.asarray(points)
+        M = points.shape[-1]
+        if M == 0:
+            return numerix.arange(0)
+
+        normals = self._cellFacePlaneNormals
+        offsets = self._cellFacePlaneOffsets
+        lower, upper = self._vertexBounds
+        tolerance = 1e-10 * (upper - lower).max()
+
+        # points outside of the bounding box can't be in any cell
+        inBox = ((points >= (lower - tolerance)[:, numerix.newaxis])
+                 & (points <= (upper + tolerance)[:, numerix.newaxis])).all(axis=0)
+        cellIDs = numerix.zeros(M, dtype=numerix.INT_DTYPE)
+        if not inBox.all():
+            cellIDs[~inBox] = self._getNearestCellID(points[:, ~inBox])
+        unresolved = numerix.nonzero(inBox)[0]
+        N = self.numberOfCells
+        tested = 0
+        k = min(candidates, N)
+        while len(unresolved) > 0 and tested < N:
+            nearest = tree.query(points[:, unresolved].T, k=k)[1]
+            nearest = numerix.reshape(nearest, (len(unresolved), k)).astype(numerix.INT_DTYPE)
+            if tested == 0:
+                # unless a containing cell is found
+                cellIDs[unresolved] = nearest[:, 0]
+            rows = numerix.arange(len(unresolved))
+            column = tested
+            while column < k and len(rows) > 0:
+                # test as many candidates at once as fit in a few MB
+                width = max(1, min(k - column, 2**18 // (len(rows) * normals[..., 0].size)))
+                cells = nearest[rows, column:column + width]
+                heights = (numerix.einsum('ifrc,ir->frc', normals[..., cells],
+                                          points[:, unresolved[rows]])
+                           - offsets[..., cells])
+                inside = heights.max(axis=0) <= tolerance
+                found = inside.any(axis=1)
+                first = inside.argmax(axis=1)
+                cellIDs[unresolved[rows[found]]] = cells[found, first[found]]
+                rows = rows[~found]
+                column += width
+            unresolved = unresolved[rows]
+            tested = k
+            k = min(2 * k, N)
+
+        return cellIDs
 
     def _test(self):
         """
@@ -0,0 +1,227 @@
+"""Keep meshes on disk, so that they needn't be generated again
+
+A mesh is kept as one binary ``.npy`` file per array, in a directory
+named after a hash of everything that went into making it, so a changed
+input makes a new entry, rather than invalidating an old one.  The arrays
+are memory-mapped when read back.
+"""
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from fipy.tools import numerix
+from fipy.tools.numerix import MA
+
+__all__ = []
+
+def _meshCacheDirectory():
+    """Directory of the mesh cache, if enabled with :envvar:`FIPY_MESHCACHE`
+    """
+    return os.environ.get("FIPY_MESHCACHE") or None
+
+def _meshCacheKey(*parts):
+    """Hash the inputs that determine a mesh
+
+    `bytes` are hashed as they are; anything else is hashed by its `str`.
+
+    >>> _meshCacheKey("Point(1) = {0, 0, 0};", 2) == _meshCacheKey("Point(1) = {0, 0, 0};", 2)
+    True
+    >>> _meshCacheKey("Point(1) = {0, 0, 0};", 2) == _meshCacheKey("Point(1) = {0, 0, 0};", 3)
+    False
+    >>> _meshCacheKey("12", 3) == _meshCacheKey("1", 23)
+    False
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode('utf-8')
+        digest.update(("%d:" % len(part)).encode('ascii'))
+        digest.update(part)
+    return digest.hexdigest()
+
+def _fileDigest(path, blockSize=2**20):
+    """Hash the contents of the file at `path`, without reading it all at once
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(blockSize), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class _MeshCache(object):
+    """The arrays of one partition of a mesh, kept on disk
+
+    >>> import tempfile, shutil
+    >>> from fipy.tools import serialComm
+    >>> directory = tempfile.mkdtemp()
+    >>> cache = _MeshCache(directory=directory,
+    ...                    key=_meshCacheKey("Point(1) = {0, 0, 0};", 2),
+    ...                    communicator=serialComm)
+    >>> print(cache.load())
+    None
+    >>> cache.store(arrays=dict(vertexCoords=numerix.arange(3.),
+    ...                         faceVertexIDs=MA.masked_values([1, -1], -1)),
+    ...             info=dict(dimensions=2))
+    >>> arrays, info = cache.load()
+    >>> print(arrays["vertexCoords"])
+    [ 0.  1.  2.]
+    >>> print(arrays["faceVertexIDs"])
+    [1 --]
+    >>> print(info["dimensions"])
+    2
+
+    A mesh that is already stored is left alone
+
+    >>> cache.store(arrays=dict(), info=dict(dimensions=3))
+    >>> print(cache.load()[1]["dimensions"])
+    2
+
+    >>> shutil.rmtree(directory)
+
+    Parameters
+    ----------
+    directory : str
+        Where meshes are kept.
+    key : str
+        Hash of the inputs that made the mesh, from `_meshCacheKey()`.
+    communicator : ~fipy.tools.comms.commWrapper.CommWrapper
+        The partition of the mesh is chosen by `communicator.procID`.
+    """
+
+    def __init__(self, directory, key, communicator):
+        self.path = os.path.join(directory, key, "%d" % communicator.procID)
+
+    def load(self):
+        """Read back the arrays and information of a stored mesh
+
+        Returns
+        -------
+        arrays : dict of ndarray
+            Memory-mapped copy-on-write, so that they can be modified
+            without changing the cache.
+        info : dict
+            Anything else that was stored.
+
+        or `None`, if the mesh hasn't been stored.
+        """
+        try:
+            with open(os.path.join(self.path, "index.json"), 'r') as f:
+                index = json.load(f)
+        except (IOError, OSError):
+            return None
+
+        arrays = dict()
+        for name in index["arrays"]:
+            arrays[name] = numerix.load(os.path.join(self.path, name + ".npy"),
+                                        mmap_mode='c')
+        for name, hasMask in index["masked"].items():
+            if hasMask:
+                mask = numerix.load(os.path.join(self.path, name + ".mask.npy"),
+                                    mmap_mode='c')
+            else:
+                mask = MA.nomask
+            arrays[name] = MA.array(arrays[name], mask=mask, copy=False)
+
+        return arrays, index["info"]
+
+    def store(self, arrays, info):
+        """Write the arrays and information of a mesh
+
+        The mesh is written to a scratch directory that is renamed when
+        complete, so a partly written mesh is never read and, if jobs
+        store the same mesh at once, the first to finish is kept.
+
+        Parameters
+        ----------
+        arrays : dict of ndarray
+            May be masked.
+        info : dict
+            Anything else to keep, that can be written as JSON.
+        """
+        parent = os.path.dirname(self.path)
+        try:
+            os.makedirs(parent)
+        except OSError:
+            if not os.path.isdir(parent):
+                raise
+
+        scratch = tempfile.mkdtemp(dir=parent)
+        try:
+            masked = dict()
+            for name, value in arrays.items():
+                numerix.save(os.path.join(scratch, name + ".npy"),
+                             MA.getdata(value))
+                if MA.isMaskedArray(value):
+                    masked[name] = MA.getmask(value) is not MA.nomask
+                    if masked[name]:
+                        numerix.save(os.path.join(scratch, name + ".mask.npy"),
+                                     MA.getmask(value))
+
+            # the index is written last, as it marks the mesh as complete
+            with open(os.path.join(scratch, "index.json"), 'w') as f:
+                json.dump(dict(arrays=sorted(arrays.keys()),
+                               masked=masked,
+                               info=info), f)
+
+            os.rename(scratch, self.path)
+        except OSError:
+            if not os.path.isdir(self.path):
+                raise
+        finally:
+            if os.path.isdir(scratch):
+                shutil.rmtree(scratch)
+
+def _calculatedGeometry(mesh):
+    """Calculate the connectivity and geometry of `mesh` worth keeping
+
+    Only arrays are kept, not variables, and not the geometry that
+    depends on the scale of the mesh.
+
+    >>> from fipy.meshes.tri2D import Tri2D
+    >>> mesh = Tri2D(nx=2, ny=2)
+    >>> arrays = _calculatedGeometry(mesh)
+    >>> print("_cellVolumes" in arrays, "_scaledCellVolumes" in arrays)
+    True False
+    >>> print("_exteriorFaces" in arrays)
+    False
+
+    Returns
+    -------
+    dict of ndarray
+    """
+    names = [name for calculate, names in mesh._topology + mesh._geometry
+             for name in names]
+    return dict((name, getattr(mesh, name)) for name in names
+                if isinstance(getattr(mesh, name), numerix.ndarray))
+
+def _restoreGeometry(mesh, arrays):
+    """Give `mesh` the connectivity and geometry kept by `_calculatedGeometry`
+
+    >>> from fipy.meshes.tri2D import Tri2D
+    >>> mesh = Tri2D(nx=2, ny=2)
+    >>> other = Tri2D(nx=2, ny=2, dx=2.)
+    >>> _restoreGeometry(other, _calculatedGeometry(mesh))
+    >>> print(other.cellVolumes[:2])
+    [ 0.25  0.25]
+
+    Anything else is ignored
+
+    >>> _restoreGeometry(other, dict(vertexCoords=numerix.zeros((2, 9))))
+    >>> print(other.vertexCoords.max(axis=1))
+    [ 4.  2.]
+    """
+    for name, value in arrays.items():
+        if name in mesh._calculations:
+            mesh.__dict__[name] = value
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -20,7 +20,7 @@ class NonUniformGrid2D(Mesh2D):
     Creates a 2D grid mesh with horizontal faces numbered
     first and then vertical faces.
     """
-    def __init__(self, dx=1., dy=1., nx=None, ny=None, overlap=2, communicator=parallelComm,
+    def __init__(self, dx=1., dy=1., nx=None, ny=None, overlap=2, communicator=parallelComm, partition=None,
                  _RepresentationClass=_Grid2DRepresentation, _TopologyClass=_Grid2DTopology):
 
         builder = _NonuniformGrid2DBuilder()
@@ -30,10 +30,11 @@ class NonUniformGrid2D(Mesh2D):
             'dy': dy, 
             'nx': nx, 
             'ny': ny, 
-            'overlap': overlap
+            'overlap': overlap,
+            'partition': partition
         }
 
-        builder.buildGridData([dx, dy], [nx, ny], overlap, communicator)
+        builder.buildGridData([dx, dy], [nx, ny], overlap, communicator, partition=partition)
 
         ([self.dx, self.dy],
          [self.nx, self.ny],
@@ -52,6 +53,7 @@ class NonUniformGrid2D(Mesh2D):
          self.numberOfHorizontalRows,
          self.numberOfVerticalColumns,
          self.numberOfHorizontalFaces,
+         self._globalShape,
          vertices,
          faces,
          cells,
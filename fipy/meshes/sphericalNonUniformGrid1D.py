@@ -53,15 +53,12 @@ class SphericalNonUniformGrid1D(NonUniformGrid1D):
                                                         *args,
                                                         **kwargs)
 
+        # before any geometry is calculated from the vertices
         self.vertexCoords += origin
         self.args['origin'] = origin
 
-    def _calcFaceCenters(self):
-        faceCenters = super(SphericalNonUniformGrid1D, self)._calcFaceCenters()
-        return faceCenters + self.origin
-
     def _calcFaceAreas(self):
-        return self._calcFaceCenters()[0] * self._calcFaceCenters()[0]
+        return self._faceCenters[0] * self._faceCenters[0]
 
     def _calcCellVolumes(self):
         return super(SphericalNonUniformGrid1D, self)._calcCellVolumes() / 2.
@@ -17,6 +17,30 @@ class _GridTopology(_AbstractTopology):
     def _isOrthogonal(self):
         return True
 
+    @staticmethod
+    def _blockCellIDs(shape, start, stop):
+        """Return the IDs of the cells `start <= (i, j, ...) < stop` of a
+        grid of `shape` cells, numbered with the first index varying fastest.
+
+        >>> print(_GridTopology._blockCellIDs((4, 3), (1, 1), (3, 3)))
+        [ 5  6  9 10]
+        """
+        ranges = [numerix.arange(lo, hi) for lo, hi in zip(start, stop)]
+        if 0 in [len(r) for r in ranges]:
+            return numerix.arange(0)
+        return numerix.ravel_multi_index(numerix.ix_(*ranges[::-1]),
+                                         shape[::-1]).ravel()
+
+    def _globalCellIDs(self, lower, upper):
+        offset = self.mesh.offset
+        return self._blockCellIDs(self.mesh._globalShape,
+                                  [o + lo for o, lo in zip(offset, lower)],
+                                  [o + n - up for o, n, up in zip(offset, self._localShape, upper)])
+
+    def _localCellIDs(self, lower, upper):
+        return self._blockCellIDs(self._localShape, lower,
+                                  [n - up for n, up in zip(self._localShape, upper)])
+
 class _Grid1DTopology(_GridTopology):
 
     _concatenatedClass = Mesh1D
@@ -190,6 +214,18 @@ class _Grid2DTopology(_GridTopology):
 
     _concatenatedClass = Mesh2D
 
+    @property
+    def _localShape(self):
+        return (self.mesh.nx, self.mesh.ny)
+
+    @property
+    def _overlapLower(self):
+        return (self.mesh.overlap['left'], self.mesh.overlap['bottom'])
+
+    @property
+    def _overlapUpper(self):
+        return (self.mesh.overlap['right'], self.mesh.overlap['top'])
+
     @property
     def _globalNonOverlappingCellIDs(self):
         """Return the IDs of the local mesh in the context of the global parallel mesh.
@@ -210,8 +246,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange((self.mesh.offset[1] + self.mesh.overlap['bottom']) * self.mesh.nx,
-                              (self.mesh.offset[1] + self.mesh.ny - self.mesh.overlap['top']) * self.mesh.nx)
+        return self._globalCellIDs(self._overlapLower, self._overlapUpper)
 
     @property
     def _globalOverlappingCellIDs(self):
@@ -233,7 +268,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.offset[1] * self.mesh.nx, (self.mesh.offset[1] + self.mesh.ny) * self.mesh.nx)
+        return self._globalCellIDs((0, 0), (0, 0))
 
     @property
     def _localNonOverlappingCellIDs(self):
@@ -255,8 +290,7 @@ class _Grid2DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.overlap['bottom'] * self.mesh.nx,
-                              (self.mesh.ny - self.mesh.overlap['top']) * self.mesh.nx)
+        return self._localCellIDs(self._overlapLower, self._overlapUpper)
 
     @property
     def _localOverlappingCellIDs(self):
@@ -293,6 +327,22 @@ class _Grid3DTopology(_GridTopology):
 
     _concatenatedClass = Mesh
 
+    @property
+    def _localShape(self):
+        return (self.mesh.nx, self.mesh.ny, self.mesh.nz)
+
+    @property
+    def _overlapLower(self):
+        return (self.mesh.overlap['left'],
+                self.mesh.overlap['bottom'],
+                self.mesh.overlap['front'])
+
+    @property
+    def _overlapUpper(self):
+        return (self.mesh.overlap['right'],
+                self.mesh.overlap['top'],
+                self.mesh.overlap['back'])
+
     @property
     def _globalNonOverlappingCellIDs(self):
         """
@@ -301,8 +351,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange((self.mesh.offset[2] + self.mesh.overlap['front']) * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.offset[2] + self.mesh.nz - self.mesh.overlap['back']) * self.mesh.nx * self.mesh.ny)
+        return self._globalCellIDs(self._overlapLower, self._overlapUpper)
 
     @property
     def _globalOverlappingCellIDs(self):
@@ -313,8 +362,7 @@ class _Grid3DTopology(_GridTopology):
         .. note:: Trivial except for parallel meshes
         """
 
-        return numerix.arange(self.mesh.offset[2] * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.offset[2] + self.mesh.nz) * self.mesh.nx * self.mesh.ny)
+        return self._globalCellIDs((0, 0, 0), (0, 0, 0))
 
     @property
     def _localNonOverlappingCellIDs(self):
@@ -324,8 +372,7 @@ class _Grid3DTopology(_GridTopology):
 
         .. note:: Trivial except for parallel meshes
         """
-        return numerix.arange(self.mesh.overlap['front'] * self.mesh.nx * self.mesh.ny,
-                              (self.mesh.nz - self.mesh.overlap['back']) * self.mesh.nx * self.mesh.ny)
+        return self._localCellIDs(self._overlapLower, self._overlapUpper)
 
     @property
     def _localOverlappingCellIDs(self):
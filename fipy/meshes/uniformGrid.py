@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.meshes.abstractMesh import AbstractMesh
+from fipy.tools import numerix
 
 __all__ = ["UniformGrid"]
 from future.utils import text_to_native_str
@@ -42,6 +43,20 @@ class UniformGrid(AbstractMesh):
     def _faceCellToCellNormals(self):
         return self.faceNormals
 
+    """Compressed connectivity, without padding to strip"""
+    @property
+    def _cellFaceOffsets(self):
+        return numerix.arange(self.numberOfCells + 1) * self._maxFacesPerCell
+
+    @property
+    def _cellFaceIndices(self):
+        # `cellFaceIDs` is a masked array, but nothing is masked
+        return numerix.ravel(numerix.transpose(numerix.asarray(self.cellFaceIDs)))
+
+    @property
+    def _cellFaceOrientations(self):
+        return numerix.ravel(numerix.transpose(self._cellToFaceOrientations))
+
     def _getFaceToCellDistances(self):
         return self._internalFaceToCellDistances
 
@@ -51,3 +66,7 @@ class UniformGrid(AbstractMesh):
 
     _faceToCellDistances = property(_getFaceToCellDistances,
                                     _setFaceToCellDistances)
+
+    @property
+    def _gridCellShape(self):
+        return tuple(self.shape[::-1])
@@ -26,7 +26,7 @@ class UniformGrid2D(UniformGrid):
     first and then vertical faces.
     """
     def __init__(self, dx=1., dy=1., nx=1, ny=1, origin=((0,), (0,)),
-                       overlap=2, communicator=parallelComm,
+                       overlap=2, communicator=parallelComm, partition=None,
                        _RepresentationClass=_Grid2DRepresentation,
                        _TopologyClass=_Grid2DTopology):
 
@@ -43,11 +43,12 @@ class UniformGrid2D(UniformGrid):
             'nx': nx,
             'ny': ny,
             'origin': origin,
-            'overlap': overlap
+            'overlap': overlap,
+            'partition': partition
         }
 
         builder.buildGridData([dx, dy], [nx, ny], overlap, communicator,
-                              origin)
+                              origin, partition=partition)
 
         ([self.dx, self.dy],
          [self.nx, self.ny],
@@ -66,6 +67,7 @@ class UniformGrid2D(UniformGrid):
          self.numberOfHorizontalRows,
          self.numberOfVerticalColumns,
          self.numberOfHorizontalFaces,
+         self._globalShape,
          self.numberOfVerticalFaces,
          self.origin) = builder.gridData
 
@@ -422,7 +424,7 @@ class UniformGrid2D(UniformGrid):
     def _translate(self, vector):
         return self.__class__(dx = self.args['dx'], nx = self.args['nx'],
                               dy = self.args['dy'], ny = self.args['ny'],
-                             origin = numerix.array(self.args['origin']) + vector, overlap=self.args['overlap'])
+                             origin = numerix.array(self.args['origin']) + vector, overlap=self.args['overlap'], partition=self.args['partition'])
 
     def __mul__(self, factor):
         if numerix.shape(factor) is ():
@@ -430,7 +432,7 @@ class UniformGrid2D(UniformGrid):
 
         return UniformGrid2D(dx=self.args['dx'] * numerix.array(factor[0]), nx=self.args['nx'],
                              dy=self.args['dy'] * numerix.array(factor[1]), ny=self.args['ny'],
-                             origin=numerix.array(self.args['origin']) * factor, overlap=self.args['overlap'])
+                             origin=numerix.array(self.args['origin']) * factor, overlap=self.args['overlap'], partition=self.args['partition'])
 
     @property
     def _concatenableMesh(self):
@@ -33,7 +33,7 @@ class UniformGrid3D(UniformGrid):
     Faces: XY faces numbered first, then XZ faces, then YZ faces. Within each subcategory, it is numbered in the usual way.
     """
     def __init__(self, dx = 1., dy = 1., dz = 1., nx = 1, ny = 1, nz = 1,
-                 origin = [[0], [0], [0]], overlap=2, communicator=parallelComm,
+                 origin = [[0], [0], [0]], overlap=2, communicator=parallelComm, partition=None,
                  _RepresentationClass=_Grid3DRepresentation,
                  _TopologyClass=_Grid3DTopology):
 
@@ -51,11 +51,12 @@ class UniformGrid3D(UniformGrid):
             'ny': ny,
             'nz': nz,
             'origin': origin,
-            'overlap': overlap
+            'overlap': overlap,
+            'partition': partition
         }
 
         builder.buildGridData([dx, dy, dz], [nx, ny, nz], overlap,
-                              communicator, origin)
+                              communicator, origin, partition=partition)
 
         ([self.dx, self.dy, self.dz],
          [self.nx, self.ny, self.nz],
@@ -77,6 +78,7 @@ class UniformGrid3D(UniformGrid):
          self.numberOfHorizontalRows,
          self.numberOfVerticalColumns,
          self.numberOfLayers,
+         self._globalShape,
          self.origin) = builder.gridData
 
     """
@@ -379,7 +381,7 @@ class UniformGrid3D(UniformGrid):
         return self.__class__(dx = self.args['dx'], nx = self.args['nx'],
                               dy = self.args['dy'], ny = self.args['ny'],
                               dz = self.args['dz'], nz = self.args['nz'],
-                             origin = numerix.array(self.args['origin']) + vector, overlap=self.args['overlap'])
+                             origin = numerix.array(self.args['origin']) + vector, overlap=self.args['overlap'], partition=self.args['partition'])
 
     def __mul__(self, factor):
         return UniformGrid3D(dx = self.dx * factor, nx = self.nx,
@@ -80,6 +80,9 @@ class ParallelPETScCommWrapper(PETScCommWrapper):
     def allgather(self, sendobj=None):
         return self.mpi4py_comm.allgather(sendobj=sendobj)
 
+    def scatter(self, objs=None, root=0):
+        return self.mpi4py_comm.scatter(sendobj=objs, root=root)
+
     def sum(self, a, axis=None):
         return self.mpi4py_comm.allreduce(numerix.array(a).sum(axis=axis), op=MPI.SUM)
 
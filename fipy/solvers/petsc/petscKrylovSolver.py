@@ -37,13 +37,24 @@ class PETScKrylovSolver(PETScSolver):
 
     """
       
-    def __init__(self, tolerance=1e-10, iterations=1000, precon=None):
+    def __init__(self, tolerance=1e-10, iterations=1000, precon=None,
+                 reusePreconditioner=False, reuseIterationLimit=None):
         """
         :Parameters:
           - `tolerance`: The required error tolerance.
           - `iterations`: The maximum number of iterative steps to perform.
           - `precon`: Preconditioner to use (string). 
+          - `reusePreconditioner`: If `False`, set up the preconditioner
+            for every solve. If `True`, keep it for as long as the size of
+            the matrix is unchanged. If an integer `N`, set it up again
+            every `N` solves.
+          - `reuseIterationLimit`: If a solve takes more than this many
+            iterations, set up the preconditioner again for the next
+            solve, regardless of `reusePreconditioner`.
 
+        The same `KSP` is kept between solves, so when the preconditioner
+        is reused, a solver object should not be shared between equations
+        of the same size.
         """
         if self.__class__ is PETScKrylovSolver:
             raise NotImplementedError("can't instantiate abstract base class")
@@ -51,24 +62,74 @@ class PETScKrylovSolver(PETScSolver):
         PETScSolver.__init__(self, tolerance=tolerance,
                              iterations=iterations, precon=precon)
 
+        self.reusePreconditioner = reusePreconditioner
+        self.reuseIterationLimit = reuseIterationLimit
+
+        self._ksp = None
+        self._sizes = None
+        self._setUpNext = True
+        self._solvesSinceSetUp = 0
+
+    def _getKSP(self, L):
+        """Return the `KSP`, creating it if `L` differs in size from the last
+        """
+        sizes = L.getSizes()
+        if self._ksp is not None and sizes != self._sizes:
+            self._ksp.destroy()
+            self._ksp = None
+
+        if self._ksp is None:
+            ksp = PETSc.KSP()
+            ksp.create(L.comm)
+            ksp.setType(self.solver)
+            if self.preconditioner is not None:
+                ksp.getPC().setType(self.preconditioner)
+            ksp.setTolerances(rtol=self.tolerance, max_it=self.iterations)
+            ksp.setOperators(L)
+            ksp.setFromOptions()
+
+            self._ksp = ksp
+            self._sizes = sizes
+            self._setUpNext = True
+
+        return self._ksp
+
+    def _updateReuse(self, iterations):
+        """Decide whether to set up the preconditioner for the next solve
+        """
+        if self._setUpNext:
+            self._solvesSinceSetUp = 1
+        else:
+            self._solvesSinceSetUp += 1
+
+        if self.reusePreconditioner is True:
+            self._setUpNext = False
+        elif not self.reusePreconditioner:
+            self._setUpNext = True
+        else:
+            self._setUpNext = (self._solvesSinceSetUp >= self.reusePreconditioner)
+
+        if (self.reuseIterationLimit is not None
+            and iterations > self.reuseIterationLimit):
+            self._setUpNext = True
+
     def _solve_(self, L, x, b):
-        ksp = PETSc.KSP()
-        ksp.create(L.comm)
-        ksp.setType(self.solver)
-        if self.preconditioner is not None:
-            ksp.getPC().setType(self.preconditioner)
-        ksp.setTolerances(rtol=self.tolerance, max_it=self.iterations)
         L.assemble()
+        ksp = self._getKSP(L)
         ksp.setOperators(L)
-        ksp.setFromOptions()
+        reused = not self._setUpNext
+        ksp.setReusePreconditioner(reused)
         ksp.solve(b, x)
 
+        self._updateReuse(ksp.its)
+
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
 #             L.view()
 #             b.view()
             PRINT('solver:', ksp.type)
             PRINT('precon:', ksp.getPC().type)
+            PRINT('precon reused:', reused)
             PRINT('convergence: %s' % _reason[ksp.reason])
             PRINT('iterations: %d / %d' % (ksp.its, self.iterations))
             PRINT('norm:', ksp.norm)
@@ -7,7 +7,8 @@ import os
 
 from scipy.sparse.linalg import splu
 
-from fipy.solvers.scipy.scipySolver import _ScipySolver
+from fipy.solvers.scipy.scipySolver import _ScipySolver, _matrixDigests
+from fipy.tools import instrumentation
 from fipy.tools import numerix
 
 __all__ = ["LinearLUSolver"]
@@ -19,8 +20,123 @@ class LinearLUSolver(_ScipySolver):
     The `LinearLUSolver` solves a linear system of equations using
     LU-factorization.  The `LinearLUSolver` is a wrapper class for the
     the Scipy `scipy.sparse.linalg.splu` module.
+
+    When the matrix does not change between solves, as for a linear
+    problem with constant coefficients and a fixed time step, the
+    factorization can be kept and reused
+
+    >>> from fipy import CellVariable, Grid1D, TransientTerm, DiffusionTerm
+    >>> mesh = Grid1D(nx=100)
+    >>> var = CellVariable(mesh=mesh, value=0.)
+    >>> var.constrain(1., where=mesh.facesLeft)
+    >>> eq = TransientTerm() == DiffusionTerm(coeff=1.)
+    >>> solver = LinearLUSolver(reuseFactorization=True)
+    >>> for step in range(5):
+    ...     eq.solve(var=var, dt=1., solver=solver)
+    >>> print(solver._factorizations)
+    1
+
+    which gives the same solution as factorizing on every step
+
+    >>> var2 = CellVariable(mesh=mesh, value=0.)
+    >>> var2.constrain(1., where=mesh.facesLeft)
+    >>> for step in range(5):
+    ...     eq.solve(var=var2, dt=1., solver=LinearLUSolver())
+    >>> print(numerix.allclose(var, var2))
+    True
+
+    A new factorization is made when the matrix changes
+
+    >>> eq.solve(var=var, dt=2., solver=solver)
+    >>> print(solver._factorizations)
+    2
+
+    With `refactorEvery`, a factorization is reused for that many solves
+    even if the matrix has changed.  The stale factors then only serve to
+    drive the iterative refinement of the solution against the current
+    matrix, so this is suited to matrices that change slowly
+
+    >>> var.value = 0.
+    >>> var2.value = 0.
+    >>> solver = LinearLUSolver(refactorEvery=3)
+    >>> for step in range(6):
+    ...     dt = 1. + step / 10.
+    ...     eq.solve(var=var, dt=dt, solver=solver)
+    ...     eq.solve(var=var2, dt=dt, solver=LinearLUSolver())
+    >>> print(solver._factorizations)
+    2
+    >>> print(numerix.allclose(var, var2))
+    True
     """
 
+    def __init__(self, tolerance=1e-10, iterations=1000, precon=None,
+                 reuseFactorization=False, refactorEvery=None):
+        """
+        Create a `LinearLUSolver`.
+
+        Parameters
+        ----------
+        tolerance : float
+            Required error tolerance.
+        iterations : int
+            Maximum number of iterative steps to perform.
+        precon
+            *ignored*
+        reuseFactorization : bool
+            Keep the factorization and reuse it for as long as the
+            matrix is unchanged.
+        refactorEvery : int
+            Reuse the factorization for this many solves, even if the
+            values of the matrix have changed, before factorizing again.
+            A factorization is always made if the sparsity pattern of the
+            matrix changes.  Implies `reuseFactorization`.
+        """
+        super(LinearLUSolver, self).__init__(tolerance=tolerance,
+                                             iterations=iterations,
+                                             precon=precon)
+        self.reuseFactorization = reuseFactorization or refactorEvery is not None
+        self.refactorEvery = refactorEvery
+
+        self._LU = None
+        self._pattern = None
+        self._values = None
+        self._solvesSinceFactorization = 0
+        self._factorizations = 0
+
+    def _factorize(self, L):
+        """Return the factorization of `L`, reusing the last if allowed
+        """
+        matrix = L.matrix
+        with instrumentation._timed("conversion"):
+            matrix = matrix.asformat("csc")
+
+        if self.reuseFactorization:
+            pattern, values = _matrixDigests(matrix)
+
+            if self._LU is not None and pattern == self._pattern:
+                if values == self._values:
+                    return self._LU
+                elif (self.refactorEvery is not None
+                      and self._solvesSinceFactorization < self.refactorEvery):
+                    self._solvesSinceFactorization += 1
+                    return self._LU
+
+            self._pattern = pattern
+            self._values = values
+
+        with instrumentation._timed("preconditioner"):
+            LU = splu(matrix, diag_pivot_thresh=1.,
+                              relax=1,
+                              panel_size=10,
+                              permc_spec=3)
+        self._solvesSinceFactorization = 1
+        self._factorizations += 1
+
+        if self.reuseFactorization:
+            self._LU = LU
+
+        return LU
+
     def _solve_(self, L, x, b):
         diag = L.takeDiagonal()
         maxdiag = max(numerix.absolute(diag))
@@ -28,10 +144,7 @@ class LinearLUSolver(_ScipySolver):
         L = L * (1 / maxdiag)
         b = b * (1 / maxdiag)
 
-        LU = splu(L.matrix.asformat("csc"), diag_pivot_thresh=1.,
-                                            relax=1,
-                                            panel_size=10,
-                                            permc_spec=3)
+        LU = self._factorize(L)
 
         error0 = numerix.sqrt(numerix.sum((L * x - b)**2))
 
@@ -43,6 +156,7 @@ class LinearLUSolver(_ScipySolver):
 
             xError = LU.solve(errorVector)
             x[:] = x - xError
+            instrumentation._count("iterations")
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             from fipy.tools.debug import PRINT
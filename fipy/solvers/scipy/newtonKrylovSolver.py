@@ -0,0 +1,295 @@
+from __future__ import division
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+import os
+
+from scipy.sparse.linalg import LinearOperator, gmres
+
+from fipy.solvers.scipy.scipySolver import _ScipySolver
+from fipy.solvers.scipy.preconditioners.iluPreconditioner import ILUPreconditioner
+from fipy.solvers.solver import MaximumIterationWarning
+from fipy.tools import instrumentation
+from fipy.tools import numerix
+
+__all__ = ["NewtonKrylovSolver"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+class _JacobianSolver(_ScipySolver):
+    """Receives the assembled matrix of a Jacobian `Term`
+    """
+    pass
+
+class NewtonKrylovSolver(_ScipySolver):
+    r"""
+    The `NewtonKrylovSolver` solves a nonlinear equation with Newton's
+    method, solving for each Newton step with GMRES.
+
+    The nonlinear residual of the equation,
+
+    .. math::
+
+       \vec{F}(\vec{u}) = \mathsf{L}(\vec{u}) \vec{u} - \vec{b}(\vec{u}),
+
+    is evaluated with :meth:`~fipy.terms.term.Term.justResidualVector`.
+    The Jacobian of :math:`\vec{F}` is either assembled from a `Term`
+    supplied by the user, as for the
+    :class:`~fipy.solvers.trilinos.trilinosNonlinearSolver.TrilinosNonlinearSolver`,
+    or never formed at all, its products with a vector :math:`\vec{v}`
+    being approximated by the finite difference
+
+    .. math::
+
+       \mathsf{J}\vec{v} \approx
+       \frac{\vec{F}(\vec{u} + \epsilon\vec{v}) - \vec{F}(\vec{u})}{\epsilon}.
+
+    Without a Jacobian, GMRES is preconditioned with the linearized matrix
+    :math:`\mathsf{L}(\vec{u})`, which is what a sweep would solve with.
+    The tolerance of each linear solve is chosen by the second method of
+    Eisenstat and Walker [#EW]_, so that early Newton steps are not
+    solved more accurately than they deserve, and each step is cut back,
+    if need be, until it reduces the residual.  Each GMRES iteration
+    without a Jacobian costs an evaluation of the residual, so a
+    good preconditioner matters more than it does for a linear solve.
+
+    A nonlinear diffusion problem, which is slow to converge by sweeping
+
+    >>> from fipy import CellVariable, Grid1D, DiffusionTerm
+    >>> mesh = Grid1D(nx=50, dx=0.02)
+    >>> phi = CellVariable(mesh=mesh, value=0.)
+    >>> phi.constrain(0., where=mesh.facesLeft)
+    >>> phi.constrain(1., where=mesh.facesRight)
+    >>> D = 1. + 10 * phi.arithmeticFaceValue**2
+    >>> eq = DiffusionTerm(coeff=D)
+    >>> sweeps = 0
+    >>> residual = 1.
+    >>> while residual > 1e-8:
+    ...     residual = eq.sweep(var=phi)
+    ...     sweeps += 1
+    >>> print(sweeps > 20)
+    True
+    >>> swept = phi.copy()
+
+    converges in a few Newton steps
+
+    >>> phi.value = 0.
+    >>> solver = NewtonKrylovSolver(equation=eq, tolerance=1e-10)
+    >>> residual = solver.solve(var=phi)
+    >>> print(solver.newtonIterations < 10)
+    True
+    >>> print(numerix.allclose(phi, swept, atol=1e-6))
+    True
+
+    and with fewer evaluations of the residual if the Jacobian is given as
+    a `Term`
+
+    >>> evaluations = solver.residualEvaluations
+
+    >>> from fipy import CentralDifferenceConvectionTerm
+    >>> jacobian = (DiffusionTerm(coeff=D, var=phi)
+    ...             + CentralDifferenceConvectionTerm(coeff=20 * phi.arithmeticFaceValue
+    ...                                                     * phi.faceGrad, var=phi))
+    >>> phi.value = 0.
+    >>> solver = NewtonKrylovSolver(equation=eq, jacobian=jacobian, tolerance=1e-10)
+    >>> residual = solver.solve(var=phi)
+    >>> print(solver.newtonIterations < 10)
+    True
+    >>> print(solver.residualEvaluations < evaluations)
+    True
+    >>> print(numerix.allclose(phi, swept, atol=1e-6))
+    True
+
+    .. [#EW] S. C. Eisenstat and H. F. Walker, "Choosing the forcing terms
+       in an inexact Newton method", *SIAM J. Sci. Comput.* **17** (1996)
+       16--32.
+    """
+
+    def __init__(self, equation, jacobian=None, tolerance=1e-10, iterations=50,
+                 linearIterations=100, precon=None, lineSearches=20):
+        """
+        Parameters
+        ----------
+        equation : ~fipy.terms.term.Term
+            The nonlinear equation to solve.
+        jacobian : ~fipy.terms.term.Term
+            `Term` whose matrix is the Jacobian of `equation`.  If `None`,
+            products with the Jacobian are approximated by finite
+            differences of the residual.
+        tolerance : float
+            Required reduction of the L2 norm of the residual, relative to
+            the initial residual.
+        iterations : int
+            Maximum number of Newton steps to take.
+        linearIterations : int
+            Maximum number of GMRES iterations for each Newton step.
+        precon
+            Preconditioner for GMRES, applied to the Jacobian, if given,
+            or else to the linearized matrix of `equation`.  An
+            `ILUPreconditioner` if `None`.
+        lineSearches : int
+            Maximum number of times to cut back each Newton step.
+        """
+        if precon is None:
+            precon = ILUPreconditioner()
+
+        super(NewtonKrylovSolver, self).__init__(tolerance=tolerance,
+                                                 iterations=iterations,
+                                                 precon=precon)
+        self.equation = equation
+        self.jacobian = jacobian
+        self.linearIterations = linearIterations
+        self.lineSearches = lineSearches
+
+        self._jacobianSolver = _JacobianSolver()
+
+    # Eisenstat-Walker forcing terms, choice 2
+    _etaMax = 0.9
+    _gamma = 0.9
+    _alpha = 2.
+
+    # sufficient decrease of the Armijo line search
+    _armijo = 1e-4
+
+    def _setValue(self, u):
+        self.var[:] = numerix.reshape(u, self.var.shape)
+
+    def _residual(self, var, u, dt):
+        """Evaluate the nonlinear residual at `u`
+
+        Leaves the linearized system at `u` in `self.matrix`.
+        """
+        if u is not None:
+            self._setValue(u)
+        self.residualEvaluations += 1
+        F = self.equation.justResidualVector(var=var, solver=self, dt=dt)
+        return numerix.array(F, dtype=float).ravel()
+
+    def _jacobianOperator(self, var, u, F, dt):
+        """Returns the Jacobian at `u` and a preconditioner for it
+        """
+        if self.jacobian is not None:
+            self._jacobianSolver = self.jacobian._prepareLinearSystem(var=var,
+                                                                      solver=self._jacobianSolver,
+                                                                      boundaryConditions=(),
+                                                                      dt=dt)
+            L = self._jacobianSolver.matrix
+            J = L.matrix
+        else:
+            L = self.matrix
+            unorm = numerix.L2norm(u)
+
+            def matvec(v):
+                v = numerix.ravel(v)
+                vnorm = numerix.L2norm(v)
+                if vnorm == 0:
+                    return numerix.zeros_like(F)
+                eps = numerix.sqrt(numerix.finfo(float).eps) * (1. + unorm) / vnorm
+                Fv = self._residual(var=var, u=u + eps * v, dt=dt)
+                return (Fv - F) / eps
+
+            J = LinearOperator((len(F), len(F)), matvec=matvec, dtype=float)
+
+        with instrumentation._timed("conversion"):
+            A = L.matrix.asformat("csr")
+        M = self.preconditioner._applyToMatrix(A, blocks=getattr(L, "numberOfEquations", 1))
+
+        return J, M
+
+    def _forcingTerm(self, eta, Fnorm, FnormOld, stopNorm):
+        """Choose the relative tolerance of the next linear solve
+        """
+        if eta is None:
+            return 0.5 * self._etaMax
+        newEta = self._gamma * (Fnorm / FnormOld)**self._alpha
+        # safeguard against the tolerance falling too fast
+        previous = self._gamma * eta**self._alpha
+        if previous > 0.1:
+            newEta = max(newEta, previous)
+        newEta = min(newEta, self._etaMax)
+        # don't solve more accurately than the nonlinear tolerance needs
+        return max(newEta, 0.5 * stopNorm / Fnorm)
+
+    def solve(self, var=None, dt=None):
+        """Solve `equation`, starting from the current value of `var`
+
+        Parameters
+        ----------
+        var : ~fipy.variables.cellVariable.CellVariable
+            `Variable` to be solved for.  Provides the initial guess and
+            the old value and holds the solution on completion.
+        dt : float
+            Timestep size.
+
+        Returns
+        -------
+        float
+            The L2 norm of the final residual.
+        """
+        with instrumentation._recordSweep(self.equation, var):
+            self.newtonIterations = 0
+            self.residualEvaluations = 0
+
+            F = self._residual(var=var, u=None, dt=dt)
+            u = numerix.array(self.var, dtype=float).ravel()
+            Fnorm = Fnorm0 = numerix.L2norm(F)
+            stopNorm = self.tolerance * Fnorm0
+            FnormOld = None
+            eta = None
+
+            while Fnorm > stopNorm and self.newtonIterations < self.iterations:
+                eta = self._forcingTerm(eta, Fnorm, FnormOld, stopNorm)
+
+                J, M = self._jacobianOperator(var=var, u=u, F=F, dt=dt)
+                with instrumentation._timed("solve"):
+                    du, info = gmres(J, -F,
+                                     tol=eta,
+                                     atol=0.,
+                                     maxiter=self.linearIterations,
+                                     M=M,
+                                     **self._callbackArgs())
+
+                # backtrack until the residual decreases sufficiently
+                lam = 1.
+                for search in range(self.lineSearches + 1):
+                    Fnew = self._residual(var=var, u=u + lam * du, dt=dt)
+                    FnormNew = numerix.L2norm(Fnew)
+                    if (FnormNew <= (1. - self._armijo * lam * (1. - eta)) * Fnorm
+                        or search == self.lineSearches):
+                        break
+                    lam *= 0.5
+
+                u = u + lam * du
+                F = Fnew
+                FnormOld, Fnorm = Fnorm, FnormNew
+                self.newtonIterations += 1
+
+            if 'FIPY_VERBOSE_SOLVER' in os.environ:
+                from fipy.tools.debug import PRINT
+                PRINT('Newton iterations: %d / %d' % (self.newtonIterations, self.iterations))
+                PRINT('residual evaluations:', self.residualEvaluations)
+                PRINT('residual:', Fnorm)
+
+            if Fnorm > stopNorm:
+                import warnings
+                warnings.warn(MaximumIterationWarning(self, self.newtonIterations, Fnorm / Fnorm0),
+                              stacklevel=2)
+
+        return Fnorm
+
+    def _callbackArgs(self):
+        callback = instrumentation._iterationCallback()
+        if callback is None:
+            return {}
+        else:
+            return dict(callback=callback, callback_type="pr_norm")
+
+    def _solve(self):
+        raise NotImplementedError("use %s.solve()" % self.__class__.__name__)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,103 @@
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse.linalg import LinearOperator, spilu
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+
+__all__ = ["ILUPreconditioner"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+class ILUPreconditioner(Preconditioner):
+    """
+    Incomplete LU preconditioner for Scipy solvers.
+    Really just a wrapper class for `scipy.sparse.linalg.spilu`.
+
+    The incomplete factors are not symmetric, so this preconditioner
+    should be used with `LinearGMRESSolver` or `LinearBicgstabSolver`
+    rather than `LinearPCGSolver`.
+
+    Without dropping, the incomplete factorization is complete
+
+    >>> from scipy.sparse import diags
+    >>> from fipy.tools import numerix
+    >>> A = diags([[-1.] * 3, [2., 4., 8., 16.], [-1.] * 3], [-1, 0, 1]).tocsr()
+    >>> precon = ILUPreconditioner(dropTolerance=0.)
+    >>> x = numerix.array((1., 2., 3., 4.))
+    >>> print(numerix.allclose(precon._applyToMatrix(A).matvec(A * x), x))
+    True
+
+    The factorization is only repeated when the matrix changes
+
+    >>> M = precon._applyToMatrix(A.copy())
+    >>> print(precon._setUps)
+    1
+    >>> M = precon._applyToMatrix(2 * A)
+    >>> print(precon._setUps)
+    2
+
+    unless it is allowed to go stale
+
+    >>> precon = ILUPreconditioner(updateEvery=2)
+    >>> for scale in (1., 2., 3., 4., 5.):
+    ...     M = precon._applyToMatrix(scale * A)
+    >>> print(precon._setUps)
+    3
+
+    The preconditioner reduces the number of iterations needed by the
+    solver, but not the solution
+
+    >>> from fipy import (CellVariable, FaceVariable, Grid2D,
+    ...                   DiffusionTerm, ImplicitSourceTerm)
+    >>> from fipy.solvers.scipy import LinearGMRESSolver, LinearLUSolver
+    >>> mesh = Grid2D(nx=20, ny=20)
+    >>> D = FaceVariable(mesh=mesh, value=1.)
+    >>> D.setValue(100., where=mesh.faceCenters[0] > 10.)
+    >>> eq = (DiffusionTerm(coeff=D)
+    ...       == ImplicitSourceTerm(coeff=1.) - 1.)
+    >>> var = CellVariable(mesh=mesh)
+    >>> var.constrain(0., where=mesh.exteriorFaces)
+    >>> var2 = CellVariable(mesh=mesh)
+    >>> var2.constrain(0., where=mesh.exteriorFaces)
+    >>> eq.solve(var=var,
+    ...          solver=LinearGMRESSolver(tolerance=1e-10,
+    ...                                   precon=ILUPreconditioner()))
+    >>> eq.solve(var=var2, solver=LinearLUSolver())
+    >>> print(numerix.allclose(var, var2))
+    True
+    """
+
+    def __init__(self, dropTolerance=None, fillFactor=None, updateEvery=None):
+        """
+        Create an `ILUPreconditioner` object.
+
+        Parameters
+        ----------
+        dropTolerance : float
+            Drop entries of the factors smaller than this, relative to the
+            matrix (`drop_tol` of `spilu`).
+        fillFactor : float
+            Limit on the ratio of the number of entries of the factors to
+            those of the matrix (`fill_factor` of `spilu`).
+        updateEvery : int
+            Reuse the factorization for this many solves, even if the values
+            of the matrix have changed.
+        """
+        super(ILUPreconditioner, self).__init__(updateEvery=updateEvery)
+        self.dropTolerance = dropTolerance
+        self.fillFactor = fillFactor
+
+    def _setUp(self, matrix):
+        ILU = spilu(matrix.asformat("csc"),
+                    drop_tol=self.dropTolerance,
+                    fill_factor=self.fillFactor)
+
+        return LinearOperator(matrix.shape, matvec=ILU.solve, dtype=matrix.dtype)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -0,0 +1,52 @@
+from __future__ import division
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+from scipy.sparse.linalg import LinearOperator
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+from fipy.tools import numerix
+
+__all__ = ["JacobiPreconditioner"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+class JacobiPreconditioner(Preconditioner):
+    """
+    Jacobi preconditioner for Scipy solvers.
+
+    Scales by the inverse of the diagonal of the matrix.
+
+    >>> from scipy.sparse import diags
+    >>> A = diags([[-1.] * 3, [2., 4., 8., 16.], [-1.] * 3], [-1, 0, 1]).tocsr()
+    >>> precon = JacobiPreconditioner()
+    >>> print(precon._applyToMatrix(A).matvec(numerix.ones(4)))
+    [ 0.5     0.25    0.125   0.0625]
+
+    Only the diagonal is needed, so matrix-free operators can be
+    preconditioned, too
+
+    >>> from scipy.sparse.linalg import aslinearoperator
+    >>> operator = aslinearoperator(A)
+    >>> operator.diagonal = A.diagonal
+    >>> print(precon._applyToMatrix(operator).matvec(numerix.ones(4)))
+    [ 0.5     0.25    0.125   0.0625]
+    """
+
+    def _applyToOperator(self, operator):
+        return self._setUp(operator)
+
+    def _setUp(self, matrix):
+        diagonal = matrix.diagonal()
+        inverse = numerix.where(diagonal == 0, 1., 1. / numerix.where(diagonal == 0, 1., diagonal))
+
+        return LinearOperator(matrix.shape,
+                              matvec=lambda x: inverse * numerix.ravel(x),
+                              dtype=matrix.dtype)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
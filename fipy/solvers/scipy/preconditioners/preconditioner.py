@@ -0,0 +1,99 @@
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+import scipy.sparse as sp
+
+from fipy.solvers.scipy.scipySolver import _matrixDigests
+from fipy.tools import instrumentation
+
+__all__ = ["Preconditioner"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+class Preconditioner(object):
+    """
+    The base Preconditioner class for the Scipy solvers.
+
+    The setup of a preconditioner is kept and reused for as long as the
+    matrix it is applied to is unchanged.
+
+    .. attention:: This class is abstract. Always create one of its subclasses.
+    """
+
+    def __init__(self, updateEvery=None):
+        """
+        Create a `Preconditioner` object.
+
+        Parameters
+        ----------
+        updateEvery : int
+            Reuse the setup for this many solves, even if the values of
+            the matrix have changed, before setting up again.  A stale
+            preconditioner slows the convergence of the solver, but does
+            not change its solution.  A setup is always made if the
+            sparsity pattern of the matrix changes.
+        """
+        if self.__class__ is Preconditioner:
+            raise NotImplementedError("can't instantiate abstract base class")
+
+        self.updateEvery = updateEvery
+
+        self._operator = None
+        self._pattern = None
+        self._values = None
+        self._solvesSinceSetUp = 0
+        self._setUps = 0
+        self._blocks = 1
+
+    def _applyToMatrix(self, matrix, blocks=1):
+        """
+        Returns a `scipy.sparse.linalg.LinearOperator` that approximates
+        the inverse of `matrix`.
+
+        Parameters
+        ----------
+        matrix : ~scipy.sparse.spmatrix
+            The matrix to precondition.
+        blocks : int
+            The number of equations (and solution variables) whose
+            contiguous blocks of rows (and columns) make up `matrix`.
+        """
+        if not sp.issparse(matrix):
+            return self._applyToOperator(matrix)
+
+        with instrumentation._timed("conversion"):
+            matrix = matrix.asformat("csr")
+        pattern, values = _matrixDigests(matrix)
+        pattern = (pattern, blocks)
+
+        if self._operator is not None and pattern == self._pattern:
+            if values == self._values:
+                return self._operator
+            elif (self.updateEvery is not None
+                  and self._solvesSinceSetUp < self.updateEvery):
+                self._solvesSinceSetUp += 1
+                return self._operator
+
+        self._pattern = pattern
+        self._values = values
+        self._blocks = blocks
+        with instrumentation._timed("preconditioner"):
+            self._operator = self._setUp(matrix)
+        self._solvesSinceSetUp = 1
+        self._setUps += 1
+
+        return self._operator
+
+    def _applyToOperator(self, operator):
+        """
+        Returns a `scipy.sparse.linalg.LinearOperator` that approximates
+        the inverse of a matrix-free `operator`.
+        """
+        raise NotImplementedError("%s requires an assembled matrix" % self.__class__.__name__)
+
+    def _setUp(self, matrix):
+        """
+        Returns a `scipy.sparse.linalg.LinearOperator` for the CSR `matrix`.
+        """
+        raise NotImplementedError
@@ -0,0 +1,35 @@
+from __future__ import unicode_literals
+__docformat__ = 'restructuredtext'
+
+from fipy.solvers.scipy.preconditioners.preconditioner import Preconditioner
+
+__all__ = ["SmoothedAggregationPreconditioner"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+class SmoothedAggregationPreconditioner(Preconditioner):
+    """
+    Smoothed aggregation algebraic multigrid preconditioner for Scipy
+    solvers.  Really just a wrapper class for
+    `pyamg.smoothed_aggregation_solver`, which must be installed.
+    """
+
+    def __init__(self, cycle='V', updateEvery=None):
+        """
+        Create a `SmoothedAggregationPreconditioner` object.
+
+        Parameters
+        ----------
+        cycle : {'V', 'W', 'F', 'AMLI'}
+            Type of multigrid cycle to apply.
+        updateEvery : int
+            Reuse the multigrid hierarchy for this many solves, even if the
+            values of the matrix have changed.
+        """
+        super(SmoothedAggregationPreconditioner, self).__init__(updateEvery=updateEvery)
+        self.cycle = cycle
+
+    def _setUp(self, matrix):
+        from pyamg import smoothed_aggregation_solver
+
+        return smoothed_aggregation_solver(matrix).aspreconditioner(cycle=self.cycle)
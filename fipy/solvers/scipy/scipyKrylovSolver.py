@@ -6,6 +6,7 @@ __all__ = []
 import os
 
 from fipy.solvers.scipy.scipySolver import _ScipySolver
+from fipy.tools import instrumentation
 
 class _ScipyKrylovSolver(_ScipySolver):
     """
@@ -14,18 +15,53 @@ class _ScipyKrylovSolver(_ScipySolver):
     .. attention:: This class is abstract. Always create one of its subclasses.
     """
 
+    def __init__(self, tolerance=1e-15, iterations=2000, precon=None, matrixFree=False):
+        """
+        Parameters
+        ----------
+        tolerance : float
+            Required error tolerance.
+        iterations : int
+            Maximum number of iterative steps to perform.
+        precon
+            Preconditioner to use.
+        matrixFree : bool
+            Apply the terms face by face, instead of assembling a sparse
+            matrix.  Only preconditioners that do not need the matrix,
+            such as the `JacobiPreconditioner`, can be used.
+        """
+        super(_ScipyKrylovSolver, self).__init__(tolerance=tolerance, iterations=iterations, precon=precon)
+        self.matrixFree = matrixFree
+
+    @property
+    def _matrixClass(self):
+        if self.matrixFree:
+            from fipy.matrices.matrixFreeMatrix import _MatrixFreeMeshMatrix
+            return _MatrixFreeMeshMatrix
+        else:
+            return super(_ScipyKrylovSolver, self)._matrixClass
+
+    def _callbackArgs(self, callback):
+        """Arguments to pass `callback` to `solveFnc`, if not `None`
+        """
+        if callback is None:
+            return {}
+        else:
+            return dict(callback=callback)
+
     def _solve_(self, L, x, b):
         A = L.matrix
         if self.preconditioner is None:
             M = None
         else:
-            M = self.preconditioner._applyToMatrix(A)
+            M = self.preconditioner._applyToMatrix(A, blocks=getattr(L, "numberOfEquations", 1))
 
         x, info = self.solveFnc(A, b, x,
                                 tol=self.tolerance,
                                 maxiter=self.iterations,
                                 M=M,
-                                atol='legacy')
+                                atol='legacy',
+                                **self._callbackArgs(instrumentation._iterationCallback()))
 
         if 'FIPY_VERBOSE_SOLVER' in os.environ:
             if info < 0:
@@ -3,10 +3,26 @@ __docformat__ = 'restructuredtext'
 
 __all__ = []
 
+import hashlib
+
 from fipy.matrices.scipyMatrix import _ScipyMeshMatrix
 from fipy.solvers.solver import Solver
 from fipy.tools import numerix
 
+def _digest(*arrays):
+    digest = hashlib.sha1()
+    for array in arrays:
+        digest.update(numerix.ascontiguousarray(array))
+    return digest.hexdigest()
+
+def _matrixDigests(matrix):
+    """Return digests of the sparsity pattern and of the values of `matrix`
+
+    `matrix` must be in a compressed (CSR or CSC) format.
+    """
+    return ((matrix.format, matrix.shape, _digest(matrix.indptr, matrix.indices)),
+            _digest(matrix.data))
+
 class _ScipySolver(Solver):
     """
     The base `ScipySolver` class.
@@ -50,6 +50,9 @@ class ParallelEpetraCommWrapper(EpetraCommWrapper):
         """
         return self.mpi4py_comm.allgather(sendobj=obj)
 
+    def scatter(self, objs, root=0):
+        return self.mpi4py_comm.scatter(sendobj=objs, root=root)
+
     def MaxAll(self, obj):
         """return max across all processes
         """
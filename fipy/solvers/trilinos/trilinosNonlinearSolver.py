@@ -22,6 +22,7 @@ class _NOXInterface(NOX.Epetra.Interface.Required, NOX.Epetra.Interface.Jacobian
 
         self.colMap = globalMatrix.colMap
         self.domainMap = globalMatrix.domainMap
+        self.importer = globalMatrix._overlappingImporter
 
         if self.solver.jacobian is None:
             # Define the Jacobian interface/operator
@@ -58,8 +59,7 @@ class _NOXInterface(NOX.Epetra.Interface.Required, NOX.Epetra.Interface.Jacobian
             overlappingVector = Epetra.Vector(self.colMap, self.solver.var)
 
             overlappingVector.Import(u,
-                                     Epetra.Import(self.colMap,
-                                                   self.domainMap),
+                                     self.importer,
                                      Epetra.Insert)
 
             self.solver.var.value = overlappingVector
@@ -80,8 +80,7 @@ class _NOXInterface(NOX.Epetra.Interface.Required, NOX.Epetra.Interface.Jacobian
             overlappingVector = Epetra.Vector(self.colMap, self.solver.var)
 
             overlappingVector.Import(u,
-                                     Epetra.Import(self.colMap,
-                                                   self.domainMap),
+                                     self.importer,
                                      Epetra.Insert)
 
             self.solver.var.value = overlappingVector
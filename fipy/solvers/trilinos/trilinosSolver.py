@@ -43,8 +43,9 @@ class TrilinosSolver(Solver):
             else:
                 s = (localNonOverlappingCellIDs,)
 
-            nonOverlappingVector = Epetra.Vector(globalMatrix.domainMap,
-                                                 self.var[s].ravel())
+            nonOverlappingVector = self._epetraVector("nonOverlapping",
+                                                      globalMatrix.domainMap,
+                                                      self.var[s].ravel())
             from fipy.variables.coupledCellVariable import _CoupledCellVariable
 
             if isinstance(self.RHSvector, _CoupledCellVariable):
@@ -53,17 +54,47 @@ class TrilinosSolver(Solver):
                 RHSvector = numerix.reshape(numerix.array(self.RHSvector), self.var.shape)[s].ravel()
 
 
-            nonOverlappingRHSvector = Epetra.Vector(globalMatrix.rangeMap,
-                                                    RHSvector)
+            nonOverlappingRHSvector = self._epetraVector("nonOverlappingRHS",
+                                                         globalMatrix.rangeMap,
+                                                         RHSvector)
 
             del RHSvector
 
-            overlappingVector = Epetra.Vector(globalMatrix.colMap, self.var)
+            overlappingVector = self._epetraVector("overlapping",
+                                                   globalMatrix.colMap,
+                                                   numerix.ravel(self.var))
 
             self.globalVectors = (globalMatrix, nonOverlappingVector, nonOverlappingRHSvector, overlappingVector)
 
         return self.globalVectors
 
+    def _epetraVector(self, name, map, values):
+        """Fill an `Epetra.Vector` with `values`
+
+        The vector is reused from the previous solve, as long as it is
+        still distributed according to `map`.  The maps of mesh matrices
+        are cached, so this is the case when the same solver is used
+        repeatedly for the same mesh and number of variables.
+
+        Parameters
+        ----------
+        name : str
+            Identifies the role of the vector in the solution.
+        map : ~PyTrilinos.Epetra.Map
+            The required distribution of the vector.
+        values : array_like
+            The local values of the vector.
+        """
+        if not hasattr(self, '_epetraVectors'):
+            self._epetraVectors = {}
+        cachedMap, vector = self._epetraVectors.get(name, (None, None))
+        if cachedMap is map:
+            vector[:] = values
+        else:
+            vector = Epetra.Vector(map, values)
+            self._epetraVectors[name] = (map, vector)
+        return vector
+
     def _deleteGlobalMatrixAndVectors(self):
         self.matrix.flush()
         del self.globalVectors
@@ -83,8 +114,7 @@ class TrilinosSolver(Solver):
                      nonOverlappingRHSvector)
 
         overlappingVector.Import(nonOverlappingVector,
-                                 Epetra.Import(globalMatrix.colMap,
-                                               globalMatrix.domainMap),
+                                 globalMatrix._overlappingImporter,
                                  Epetra.Insert)
 
         self.var.value = numerix.reshape(numerix.array(overlappingVector), self.var.shape)
@@ -107,8 +137,7 @@ class TrilinosSolver(Solver):
 
             overlappingResidual = Epetra.Vector(globalMatrix.colMap)
             overlappingResidual.Import(residual,
-                                       Epetra.Import(globalMatrix.colMap,
-                                                     globalMatrix.domainMap),
+                                       globalMatrix._overlappingImporter,
                                        Epetra.Insert)
 
             return overlappingResidual
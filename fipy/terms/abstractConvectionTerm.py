@@ -189,7 +189,9 @@ class _AbstractConvectionTerm(FaceTerm):
 
 
         ids = self._reshapeIDs(var, numerix.arange(mesh.numberOfCells))
-        L.addAt(numerix.array(self.constraintL).ravel(), ids.ravel(), ids.swapaxes(0, 1).ravel())
+        L._addAtPattern(numerix.array(self.constraintL).ravel(),
+                        key=("cells", self._vectorSize(var)),
+                        ids=lambda: (ids.ravel(), ids.swapaxes(0, 1).ravel()))
         b += numerix.reshape(self.constraintB.value, ids.shape).sum(0).ravel()
 
         return (var, L, b)
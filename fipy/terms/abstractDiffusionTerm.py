@@ -183,51 +183,10 @@ class _AbstractDiffusionTerm(_UnaryTerm):
         id1 = numerix.take(id1, interiorFaces)
         id2 = numerix.take(id2, interiorFaces)
 
-        id1 = self._reshapeIDs(var, id1)
-        id2 = self._reshapeIDs(var, id2)
-
-##         print 'id1',id1
-##         print 'id2',id2
-
         coefficientMatrix = SparseMatrix(mesh=mesh, bandwidth = mesh._maxFacesPerCell + 1)
-        interiorCoeff = numerix.take(coeff, interiorFaces, axis=-1).ravel()
-        coefficientMatrix.addAt(interiorCoeff, id1.ravel(), id1.swapaxes(0, 1).ravel())
-        coefficientMatrix.addAt(-interiorCoeff, id1.ravel(), id2.swapaxes(0, 1).ravel())
-        coefficientMatrix.addAt(-interiorCoeff, id2.ravel(), id1.swapaxes(0, 1).ravel())
-        coefficientMatrix.addAt(interiorCoeff, id2.ravel(), id2.swapaxes(0, 1).ravel())
-
-##         print 'coefficientMatrix',coefficientMatrix
-##         raw_input('stopped')
-
-##         interiorCoeff = numerix.array(coeff)
-
-##         interiorCoeff[...,mesh.exteriorFaces.value] = 0
-##         print 'interiorCoeff',interiorCoeff
-##         interiorCoeff = numerix.take(interiorCoeff, mesh.cellFaceIDs, axis=-1)
-## ##        print interiorCoeff.shape
-## ##        print interiorCoeff[:,:,0]
-## ##        print interiorCoeff[:,:,1]
-
-##         coefficientMatrix = SparseMatrix(mesh=mesh, bandwidth = mesh._maxFacesPerCell + 1)
-
-## ##        print 'numerix.sum(interiorCoeff, -2)',numerix.sum(interiorCoeff, -2)
-## ##        print numerix.sum(interiorCoeff, -2).ravel()
-## ##        raw_input('stopped')
-## ##        coefficientMatrix.addAtDiagonal(numerix.sum(interiorCoeff, -2).ravel())
-## ##        print 'coefficientMatrix',coefficientMatrix
-
-##         del interiorCoeff
-
-##         interiorFaces = mesh.interiorFaceIDs
-##         interiorFaceCellIDs = mesh.interiorFaceCellIDs
-
-##         interiorCoeff = -numerix.take(coeff, interiorFaces, axis=-1)
-
-##         print 'interiorCoeff',interiorCoeff
-##         raw_input('stopped')
-##         coefficientMatrix.addAt(interiorCoeff, interiorFaceCellIDs[0], interiorFaceCellIDs[1])
-##         interiorCoeff = -numerix.take(coeff, interiorFaces, axis=-1)
-##         coefficientMatrix.addAt(interiorCoeff, interiorFaceCellIDs[1], interiorFaceCellIDs[0])
+        minusCoeff = -numerix.asarray(coeff)
+        self._addInteriorFaceCoefficients(coefficientMatrix, var, interiorFaces, id1, id2,
+                                          coeffs=(coeff, minusCoeff, minusCoeff, coeff))
 
         return coefficientMatrix
 
@@ -319,7 +278,9 @@ class _AbstractDiffusionTerm(_UnaryTerm):
                 self.constraintL = -constrainedNormalsDotCoeffOverdAP.divergence * mesh.cellVolumes
 
             ids = self._reshapeIDs(var, numerix.arange(mesh.numberOfCells))
-            L.addAt(self.constraintL.ravel(), ids.ravel(), ids.swapaxes(0, 1).ravel())
+            L._addAtPattern(self.constraintL.ravel(),
+                            key=("cells", self._vectorSize(var)),
+                            ids=lambda: (ids.ravel(), ids.swapaxes(0, 1).ravel()))
             b += numerix.reshape(self.constraintB.ravel(), ids.shape).sum(-2).ravel()
 
         return (var, L, b)
@@ -422,6 +383,24 @@ class _AbstractDiffusionTerm(_UnaryTerm):
 
         return (var, L, b)
 
+    def _assemblyInputs(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        from fipy.variables.variable import Variable
+
+        inputs = [coeff for coeff in self.coeff if isinstance(coeff, Variable)]
+        inputs.append(self.nthCoeff)
+
+        if self.order > 0:
+            # the constrained face values and gradients enter the RHS vector
+            for constraint in var.faceGrad.constraints + var.arithmeticFaceValue.constraints:
+                inputs += [constraint, constraint.value, constraint.where]
+
+        # the anisotropic source depends on the gradient of the solution,
+        # and may belong to a lower order term
+        if self.order > 2 or hasattr(self, 'anisotropySource'):
+            inputs.append(var)
+
+        return inputs
+
     def _getDiffusionGeomCoeff(self, var):
         if var is self.var or self.var is None:
             return self._getGeomCoeff(var)
@@ -87,6 +87,14 @@ class CellTerm(_NonDiffusionTerm):
 
         return self.coeffVectors
 
+    def _assemblyInputs(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        from fipy.variables.variable import Variable
+
+        coeffVectors = self._getCoeffVectors_(var=var, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+        return [var.old] + [coeffVectors[key] for key in sorted(coeffVectors)
+                            if isinstance(coeffVectors[key], Variable)]
+
     def _buildMatrixInline_(self, L, oldArray, b, dt, coeffVectors):
         oldArray = oldArray.value.ravel()
         N = len(oldArray)
@@ -115,8 +123,9 @@ class CellTerm(_NonDiffusionTerm):
         ids = self._reshapeIDs(oldArray, numerix.arange(oldArray.shape[-1]))
         b += (oldArray.value[numerix.newaxis] * coeffVectors['old value']).sum(-2).ravel() / dt
         b += coeffVectors['b vector'][numerix.newaxis].sum(-2).ravel()
-        L.addAt(coeffVectors['new value'].ravel() / dt, ids.ravel(), ids.swapaxes(0, 1).ravel())
-        L.addAt(coeffVectors['diagonal'].ravel(), ids.ravel(), ids.swapaxes(0, 1).ravel())
+        L._addAtPattern(coeffVectors['new value'].ravel() / dt + coeffVectors['diagonal'].ravel(),
+                        key=("cells", self._vectorSize(oldArray)),
+                        ids=lambda: (ids.ravel(), ids.swapaxes(0, 1).ravel()))
 
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
 
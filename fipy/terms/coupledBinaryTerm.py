@@ -60,6 +60,12 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
 
         Only called at top-level by `_prepareLinearSystem()`
 
+        Each block is added straight into the coupled matrix.  Matrix
+        classes that support it (see `_ScipyMatrix._assemble()`) only
+        collect the (row, column, value) triplets of the blocks, with
+        their offsets, and assemble them all at once.  A separate matrix
+        for each equation is only built if that equation is to be cached.
+
         """
 
         from fipy.matrices.offsetSparseMatrix import OffsetSparseMatrix
@@ -73,7 +79,10 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
 
             SparseMatrix.equationIndex = equationIndex
             termRHSvector = 0
-            termMatrix = SparseMatrix(mesh=var.mesh)
+            if uncoupledTerm._cacheMatrix:
+                termMatrix = SparseMatrix(mesh=var.mesh)
+            else:
+                termMatrix = None
 
             for varIndex, tmpVar in enumerate(var.vars):
 
@@ -87,12 +96,13 @@ class _CoupledBinaryTerm(_AbstractBinaryTerm):
                                                                                      diffusionGeomCoeff=uncoupledTerm._getDiffusionGeomCoeff(tmpVar),
                                                                                      buildExplicitIfOther=buildExplicitIfOther)
 
-                termMatrix += tmpMatrix
+                matrix += tmpMatrix
+                if termMatrix is not None:
+                    termMatrix += tmpMatrix
                 termRHSvector += tmpRHSvector
 
             uncoupledTerm._buildCache(termMatrix, termRHSvector)
             RHSvectors += [CellVariable(value=termRHSvector, mesh=var.mesh)]
-            matrix += termMatrix
 
         return (var, matrix, _CoupledCellVariable(RHSvectors))
 
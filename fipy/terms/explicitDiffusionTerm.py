@@ -33,6 +33,16 @@ class ExplicitDiffusionTerm(_AbstractDiffusionTerm):
 
         return (var, SparseMatrix(mesh=var.mesh), b - L * var.value)
 
+    def _assemblyInputs(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        if hasattr(var, 'old'):
+            varOld = var.old
+        else:
+            varOld = var
+
+        inputs = _AbstractDiffusionTerm._assemblyInputs(self, varOld, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+
+        return inputs + [varOld]
+
     def _getNormals(self, mesh):
         return mesh._faceCellToCellNormals
 
@@ -38,13 +38,11 @@ class FaceTerm(_NonDiffusionTerm):
         mesh = var.mesh
         coeffMatrix = self._getCoeffMatrix_(var, weight)
 
-        id1 = self._reshapeIDs(var, id1)
-        id2 = self._reshapeIDs(var, id2)
-
-        L.addAt(numerix.take(coeffMatrix['cell 1 diag'], interiorFaces, axis=-1).ravel(), id1.ravel(), id1.swapaxes(0, 1).ravel())
-        L.addAt(numerix.take(coeffMatrix['cell 1 offdiag'], interiorFaces, axis=-1).ravel(), id1.ravel(), id2.swapaxes(0, 1).ravel())
-        L.addAt(numerix.take(coeffMatrix['cell 2 offdiag'], interiorFaces, axis=-1).ravel(), id2.ravel(), id1.swapaxes(0, 1).ravel())
-        L.addAt(numerix.take(coeffMatrix['cell 2 diag'], interiorFaces, axis=-1).ravel(), id2.ravel(), id2.swapaxes(0, 1).ravel())
+        self._addInteriorFaceCoefficients(L, var, interiorFaces, id1, id2,
+                                          coeffs=(coeffMatrix['cell 1 diag'],
+                                                  coeffMatrix['cell 1 offdiag'],
+                                                  coeffMatrix['cell 2 offdiag'],
+                                                  coeffMatrix['cell 2 diag']))
 
         N = mesh.numberOfCells
         M = mesh._maxFacesPerCell
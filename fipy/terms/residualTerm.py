@@ -26,6 +26,9 @@ class ResidualTerm(_ExplicitSourceTerm):
     def _getGeomCoeff(self, var):
         return self.coeff
 
+    def _assemblyInputs(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        return None
+
     def _buildMatrix(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
         vec = self.equation.justResidualVector(var=None,
                                                boundaryConditions=boundaryConditions,
@@ -29,3 +29,8 @@ class SourceTerm(CellTerm):
 
     def _checkDt(self, dt):
         return 1.
+
+    def _assemblyInputs(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        # the old value has no weight in a source
+        inputs = CellTerm._assemblyInputs(self, var, transientGeomCoeff=transientGeomCoeff, diffusionGeomCoeff=diffusionGeomCoeff)
+        return inputs[1:]
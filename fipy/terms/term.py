@@ -6,6 +6,7 @@ __docformat__ = 'restructuredtext'
 import os
 
 from fipy import input
+from fipy.tools import instrumentation
 from fipy.tools import numerix
 from fipy.terms import AbstractBaseClassError
 from fipy.terms import SolutionVariableRequiredError
@@ -39,6 +40,7 @@ class Term(object):
         self._matrix = None
         self._cacheRHSvector = False
         self._RHSvector = None
+        self._assembly = None
         self.var = var
 
     def _calcVars(self):
@@ -56,6 +58,15 @@ class Term(object):
     def _buildAndAddMatrices(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None, buildExplicitIfOther=False):
         raise NotImplementedError
 
+    def _assemblyInputs(self, var, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Everything, besides `dt`, that the matrix and RHS vector depend on
+
+        Returns a list of objects, whose identity and, for `Variable`
+        objects, `_version` determine the result of `_buildMatrix()`, or
+        `None` if the term must be rebuilt every time.
+        """
+        return None
+
     def _checkVar(self, var):
         raise NotImplementedError
 
@@ -173,9 +184,11 @@ class Term(object):
             Timestep size.
         """
 
-        solver = self._prepareLinearSystem(var, solver, boundaryConditions, dt)
+        with instrumentation._recordSweep(self, var):
+            solver = self._prepareLinearSystem(var, solver, boundaryConditions, dt)
 
-        solver._solve()
+            with instrumentation._timed("solve"):
+                solver._solve()
 
     def sweep(self, var=None, solver=None, boundaryConditions=(), dt=None, underRelaxation=None, residualFn=None, cacheResidual=False, cacheError=False):
         r"""
@@ -211,25 +224,30 @@ class Term(object):
             :math:`\vec{e}` and store it in the `errorVector` member of
             `Term`
         """
-        solver = self._prepareLinearSystem(var=var, solver=solver, boundaryConditions=boundaryConditions, dt=dt)
-        solver._applyUnderRelaxation(underRelaxation=underRelaxation)
-        residual = solver._calcResidual(residualFn=residualFn)
-
-        if cacheResidual or cacheError:
-            self.residualVector = solver._calcResidualVector(residualFn=residualFn)
-
-        if cacheError:
-            self.errorVector = solver.var.copy()
-            var_tmp = solver.var
-            RHS_tmp = solver.RHSvector
-            solver._storeMatrix(var=self.errorVector, matrix=solver.matrix, RHSvector=self.residualVector)
-            solver._solve()
-            solver._storeMatrix(var=var_tmp, matrix=solver.matrix, RHSvector=RHS_tmp)
-
-        if not cacheResidual:
-            self.residualVector = None
-
-        solver._solve()
+        with instrumentation._recordSweep(self, var):
+            solver = self._prepareLinearSystem(var=var, solver=solver, boundaryConditions=boundaryConditions, dt=dt)
+            solver._applyUnderRelaxation(underRelaxation=underRelaxation)
+
+            with instrumentation._timed("residual"):
+                residual = solver._calcResidual(residualFn=residualFn)
+
+                if cacheResidual or cacheError:
+                    self.residualVector = solver._calcResidualVector(residualFn=residualFn)
+
+            if cacheError:
+                self.errorVector = solver.var.copy()
+                var_tmp = solver.var
+                RHS_tmp = solver.RHSvector
+                solver._storeMatrix(var=self.errorVector, matrix=solver.matrix, RHSvector=self.residualVector)
+                with instrumentation._timed("solve"):
+                    solver._solve()
+                solver._storeMatrix(var=var_tmp, matrix=solver.matrix, RHSvector=RHS_tmp)
+
+            if not cacheResidual:
+                self.residualVector = None
+
+            with instrumentation._timed("solve"):
+                solver._solve()
 
         return residual
 
@@ -6,6 +6,7 @@ __all__ = []
 import os
 
 from fipy import input
+from fipy.tools import instrumentation
 from fipy.tools import numerix
 from fipy.terms.term import Term
 
@@ -58,25 +59,26 @@ class _UnaryTerm(Term):
 
         """
 
-        if var is self.var or self.var is None:
-            var, matrix, RHSvector = self._buildMatrix(var,
-                                                       SparseMatrix,
-                                                       boundaryConditions=boundaryConditions,
-                                                       dt=dt,
-                                                       transientGeomCoeff=transientGeomCoeff,
-                                                       diffusionGeomCoeff=diffusionGeomCoeff)
-        elif buildExplicitIfOther:
-            _, matrix, RHSvector = self._buildMatrix(self.var,
-                                                     SparseMatrix,
-                                                     boundaryConditions=boundaryConditions,
-                                                     dt=dt,
-                                                     transientGeomCoeff=transientGeomCoeff,
-                                                     diffusionGeomCoeff=diffusionGeomCoeff)
-            RHSvector = RHSvector - matrix * self.var.value
-            matrix = SparseMatrix(mesh=var.mesh)
-        else:
-            RHSvector = numerix.zeros(len(var.ravel()), 'd')
-            matrix = SparseMatrix(mesh=var.mesh)
+        with instrumentation._timedTerm(self):
+            if var is self.var or self.var is None:
+                var, matrix, RHSvector = self._buildMatrixIfChanged(var,
+                                                                    SparseMatrix,
+                                                                    boundaryConditions=boundaryConditions,
+                                                                    dt=dt,
+                                                                    transientGeomCoeff=transientGeomCoeff,
+                                                                    diffusionGeomCoeff=diffusionGeomCoeff)
+            elif buildExplicitIfOther:
+                _, matrix, RHSvector = self._buildMatrix(self.var,
+                                                         SparseMatrix,
+                                                         boundaryConditions=boundaryConditions,
+                                                         dt=dt,
+                                                         transientGeomCoeff=transientGeomCoeff,
+                                                         diffusionGeomCoeff=diffusionGeomCoeff)
+                RHSvector = RHSvector - matrix * self.var.value
+                matrix = SparseMatrix(mesh=var.mesh)
+            else:
+                RHSvector = numerix.zeros(len(var.ravel()), 'd')
+                matrix = SparseMatrix(mesh=var.mesh)
 
         if ('FIPY_DISPLAY_MATRIX' in os.environ
              and "terms" in os.environ['FIPY_DISPLAY_MATRIX'].lower().split()):
@@ -86,6 +88,123 @@ class _UnaryTerm(Term):
 
         return (var, matrix, RHSvector)
 
+    def _assemblyKey(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Summarize the state that `_buildMatrix()` depends on
+
+        Returns the objects the build depends on and a tuple of their
+        versions, the matrix class and `dt`, or `None` if the term must be
+        rebuilt.
+        """
+        if len(boundaryConditions) > 0 or self._vectorSize(var) > 1:
+            return None
+
+        inputs = self._assemblyInputs(var,
+                                      transientGeomCoeff=transientGeomCoeff,
+                                      diffusionGeomCoeff=diffusionGeomCoeff)
+        if inputs is None:
+            return None
+
+        if dt is not None:
+            try:
+                dt = float(dt)
+            except (TypeError, ValueError):
+                return None
+
+        from fipy.variables.variable import Variable
+        versions = tuple(obj._version if isinstance(obj, Variable) else None
+                         for obj in inputs)
+
+        return [var] + list(inputs), (SparseMatrix, dt, versions)
+
+    def _buildMatrixIfChanged(self, var, SparseMatrix, boundaryConditions=(), dt=None, transientGeomCoeff=None, diffusionGeomCoeff=None):
+        """Build the matrix and RHS vector, unless nothing they depend on has changed
+
+        Terms that report what they depend on (see `_assemblyInputs()`)
+        keep the result of their last build and return copies of it for as
+        long as none of those `Variable` objects has been assigned to
+        (see `Variable._version`).  A diffusion term with a fixed
+        coefficient is thus only assembled once, even when the equation is
+        swept repeatedly to resolve a nonlinear source.
+
+        >>> from fipy import (CellVariable, Grid1D, Variable, DiffusionTerm,
+        ...                   ImplicitSourceTerm, TransientTerm)
+        >>> m = Grid1D(nx=10)
+        >>> def sweeps(D, v):
+        ...     v.constrain(1., where=m.facesLeft)
+        ...     diffusion = DiffusionTerm(coeff=D)
+        ...     source = ImplicitSourceTerm(coeff=-v)
+        ...     eq = diffusion + source - TransientTerm()
+        ...     assemblies = []
+        ...     for sweep in range(3):
+        ...         eq.sweep(var=v, dt=1.)
+        ...         assemblies.append((diffusion._assembly, source._assembly))
+        ...     v.updateOld()
+        ...     D.value = 2.
+        ...     eq.sweep(var=v, dt=1.)
+        ...     assemblies.append((diffusion._assembly, source._assembly))
+        ...     return assemblies
+        >>> v = CellVariable(mesh=m, value=0., hasOld=True)
+        >>> assemblies = sweeps(Variable(1.), v)
+
+        The diffusion term is reused until its coefficient changes, whereas
+        the source term, which depends on the solution, is rebuilt every
+        sweep
+
+        >>> print([assembly[0] is assemblies[0][0] for assembly in assemblies])
+        [True, True, True, False]
+        >>> print([assembly[1] is assemblies[0][1] for assembly in assemblies])
+        [True, False, False, False]
+
+        The solution is the same as when everything is rebuilt
+
+        >>> v2 = CellVariable(mesh=m, value=0., hasOld=True)
+        >>> D2 = Variable(1.)
+        >>> def rebuild(self, *args, **kwargs):
+        ...     return None
+        >>> DiffusionTerm._assemblyInputs = rebuild
+        >>> assemblies = sweeps(D2, v2)
+        >>> del DiffusionTerm._assemblyInputs
+        >>> print(assemblies[0][0] is None)
+        True
+        >>> print(numerix.allclose(v, v2))
+        True
+        """
+        key = self._assemblyKey(var, SparseMatrix,
+                                boundaryConditions=boundaryConditions,
+                                dt=dt,
+                                transientGeomCoeff=transientGeomCoeff,
+                                diffusionGeomCoeff=diffusionGeomCoeff)
+
+        if key is None:
+            self._assembly = None
+            return self._buildMatrix(var,
+                                     SparseMatrix,
+                                     boundaryConditions=boundaryConditions,
+                                     dt=dt,
+                                     transientGeomCoeff=transientGeomCoeff,
+                                     diffusionGeomCoeff=diffusionGeomCoeff)
+
+        inputs, state = key
+        if (self._assembly is None
+            or self._assembly[1] != state
+            or len(self._assembly[0]) != len(inputs)
+            or not all(a is b for a, b in zip(self._assembly[0], inputs))):
+            _, matrix, RHSvector = self._buildMatrix(var,
+                                                     SparseMatrix,
+                                                     boundaryConditions=boundaryConditions,
+                                                     dt=dt,
+                                                     transientGeomCoeff=transientGeomCoeff,
+                                                     diffusionGeomCoeff=diffusionGeomCoeff)
+            self._assembly = (inputs, state, matrix, RHSvector)
+
+        _, _, matrix, RHSvector = self._assembly
+
+        # the caller accumulates the contributions of other terms in place
+        L = SparseMatrix(mesh=var.mesh)
+        L += matrix
+
+        return (var, L, numerix.array(RHSvector))
+
     def _reshapeIDs(self, var, ids):
         shape = (self._vectorSize(var), self._vectorSize(var), ids.shape[-1])
         ids = numerix.resize(ids, shape)
@@ -94,6 +213,48 @@ class _UnaryTerm(Term):
         ids += X[..., numerix.newaxis]
         return ids
 
+    def _addInteriorFaceCoefficients(self, L, var, interiorFaces, id1, id2, coeffs):
+        """Add the contributions of the interior faces to `L` in one pass
+
+        The positions of the four blocks, (`id1`, `id1`), (`id1`, `id2`),
+        (`id2`, `id1`) and (`id2`, `id2`), only depend on the mesh and the
+        shape of `var`, so matrices that support it reuse the sparsity
+        pattern from sweep to sweep.  On structured grids, they write the
+        coefficients straight into the bands of the matrix.
+
+        Parameters
+        ----------
+        L : ~fipy.matrices.sparseMatrix._SparseMatrix
+            The matrix to add to.
+        var : ~fipy.variables.cellVariable.CellVariable
+            The solution variable.
+        interiorFaces : array_like of int
+            The IDs of the interior faces.
+        id1, id2 : array_like of int
+            The cells on either side of each of the `interiorFaces`.
+        coeffs : tuple
+            The 'cell 1 diag', 'cell 1 offdiag', 'cell 2 offdiag' and
+            'cell 2 diag' coefficients at every face.
+        """
+        if self._vectorSize(var) == 1 and L._gridStencil is not None:
+            # the connectivity of a structured grid is known, so the
+            # coefficients are banded without gathering the interior faces
+            L._addAtGridStencil(coeffs)
+            return
+
+        vector = numerix.concatenate([numerix.take(coeff, interiorFaces, axis=-1).ravel()
+                                      for coeff in coeffs])
+
+        def ids():
+            reshapedID1 = self._reshapeIDs(var, id1)
+            reshapedID2 = self._reshapeIDs(var, id2)
+            rows = (reshapedID1, reshapedID1, reshapedID2, reshapedID2)
+            cols = (reshapedID1, reshapedID2, reshapedID1, reshapedID2)
+            return (numerix.concatenate([row.ravel() for row in rows]),
+                    numerix.concatenate([col.swapaxes(0, 1).ravel() for col in cols]))
+
+        L._addAtPattern(vector, key=("interiorFaces", self._vectorSize(var)), ids=ids)
+
     def _getDefaultSolver(self, var, solver, *args, **kwargs):
         if solver and not solver._canSolveAsymmetric():
             import warnings
@@ -9,15 +9,17 @@ import os
 import sys
 import gzip
 
+from fipy.tools import numerix
 from fipy.tools import parallelComm
 
-__all__ = ["write", "read"]
+__all__ = ["write", "read", "writeCheckpoint", "readCheckpoint"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
 # TODO: add test to show that round trip pickle of mesh doesn't work properly
 # FIXME: pickle fails to work properly on numpy 1.1 (run gapFillMesh.py)
-def write(data, filename = None, extension = '', communicator=parallelComm):
+def write(data, filename = None, extension = '', communicator=parallelComm,
+          protocol=pickle.HIGHEST_PROTOCOL, compresslevel=9):
     """
     Pickle an object and write it to a file. Wrapper for
     `cPickle.dump()`.
@@ -31,6 +33,13 @@ def write(data, filename = None, extension = '', communicator=parallelComm):
         >>> print(old.numberOfCells == new.numberOfCells)
         True
 
+    Files can be written without compression and in older protocols
+
+        >>> f, tempfile = write(old, protocol=0, compresslevel=None)
+        >>> new = read(tempfile, f)
+        >>> print(old.numberOfCells == new.numberOfCells)
+        True
+
     Parameters
     ----------
     data
@@ -43,6 +52,12 @@ def write(data, filename = None, extension = '', communicator=parallelComm):
         Used if `filename` is not given.
     communicator : ~fipy.tools.comms.commWrapper.CommWrapper
         A duck-typed object with `procID` and `Nproc` attributes is sufficient
+    protocol : int
+        Pickle protocol to use.  Files written with the default, binary,
+        protocol cannot be read by older versions of Python.
+    compresslevel : int
+        Level of gzip compression, from 1 (fastest) to 9 (smallest).  If
+        `None`, the file is not compressed.
     """
     if communicator.procID == 0:
         if filename is None:
@@ -50,12 +65,16 @@ def write(data, filename = None, extension = '', communicator=parallelComm):
             (f, _filename) =  tempfile.mkstemp(extension)
         else:
             (f, _filename) = (None, filename)
-        fileStream = gzip.GzipFile(filename=_filename, mode='wb', fileobj=None)
+        if compresslevel is None:
+            fileStream = open(_filename, mode='wb')
+        else:
+            fileStream = gzip.GzipFile(filename=_filename, mode='wb', fileobj=None,
+                                       compresslevel=compresslevel)
     else:
         fileStream = open(os.devnull, mode='wb')
         (f, _filename) = (None, os.devnull)
 
-    pickle.dump(data, fileStream, 0)
+    pickle.dump(data, fileStream, protocol)
     fileStream.close()
 
     if filename is None:
@@ -78,7 +97,12 @@ def read(filename, fileobject=None, communicator=parallelComm, mesh_unmangle=Fal
         Whether to correct improper pickling of non-uniform meshes (ticket:243)
     """
     if communicator.procID == 0:
-        fileStream = gzip.GzipFile(filename=filename, mode='r', fileobj=None)
+        with open(filename, mode='rb') as fileStream:
+            compressed = (fileStream.read(2) == b'\x1f\x8b')
+        if compressed:
+            fileStream = gzip.GzipFile(filename=filename, mode='r', fileobj=None)
+        else:
+            fileStream = open(filename, mode='rb')
         data = fileStream.read()
         fileStream.close()
         if fileobject is not None:
@@ -124,6 +148,193 @@ def read(filename, fileobject=None, communicator=parallelComm, mesh_unmangle=Fal
 
     return unpickler.load()
 
+def _checkpointFile(dirname, name, procID, compress):
+    return os.path.join(dirname,
+                        "%s.%d.%s" % (name, procID, "npz" if compress else "npy"))
+
+def _saveArray(dirname, name, procID, value, compress):
+    filename = _checkpointFile(dirname, name, procID, compress)
+    if compress:
+        numerix.savez_compressed(filename, value=value)
+    else:
+        numerix.save(filename, value)
+
+def _loadArray(dirname, name, procID, compress, mmap_mode):
+    filename = _checkpointFile(dirname, name, procID, compress)
+    if compress:
+        with numerix.load(filename) as npz:
+            return npz["value"]
+    else:
+        return numerix.load(filename, mmap_mode=mmap_mode)
+
+def writeCheckpoint(dirname, variables, compress=False):
+    """
+    Write the values of `CellVariable` objects to a checkpoint directory.
+
+    Each processor writes the values of the cells it owns, in binary, to
+    its own file, so the time to write a checkpoint does not grow with the
+    number of processors.  Values are written in the units of each
+    variable, but the units themselves are not recorded.
+
+        >>> import tempfile
+        >>> from fipy import CellVariable, Grid2D
+        >>> mesh = Grid2D(nx=3, ny=2)
+        >>> phi = CellVariable(mesh=mesh, value=mesh.cellCenters[0])
+        >>> velocity = CellVariable(mesh=mesh, rank=1, value=mesh.cellCenters)
+        >>> dirname = tempfile.mkdtemp()
+        >>> writeCheckpoint(dirname, {"phi": phi, "velocity": velocity})
+
+    The values are read back from memory-mapped files
+
+        >>> values = readCheckpoint(dirname)
+        >>> print(values["phi"])
+        [ 0.5  1.5  2.5  0.5  1.5  2.5]
+        >>> print(isinstance(values["phi"], numerix.memmap))
+        True
+        >>> print(numerix.allequal(values["velocity"], velocity.value))
+        True
+
+        >>> import shutil
+        >>> del values
+        >>> shutil.rmtree(dirname)
+
+    A checkpoint written in parallel, here mimicked by two fake
+    processors, is assembled from the file of each processor
+
+        >>> from fipy import Grid1D
+        >>> from fipy.tools.comms.dummyComm import DummyComm
+        >>> class FakeComm(DummyComm):
+        ...     def __init__(self, procID, Nproc):
+        ...         self._procID, self._Nproc = procID, Nproc
+        ...     procID = property(lambda self: self._procID)
+        ...     Nproc = property(lambda self: self._Nproc)
+        >>> dirname = tempfile.mkdtemp()
+        >>> for procID in range(2):
+        ...     mesh = Grid1D(nx=10, communicator=FakeComm(procID, 2))
+        ...     phi = CellVariable(mesh=mesh, value=mesh.cellCenters[0])
+        ...     writeCheckpoint(dirname, {"phi": phi}, compress=True)
+        >>> print(readCheckpoint(dirname)["phi"])
+        [ 0.5  1.5  2.5  3.5  4.5  5.5  6.5  7.5  8.5  9.5]
+
+    and can be restarted on a different number of processors
+
+        >>> mesh = Grid1D(nx=10, communicator=FakeComm(1, 3))
+        >>> print(numerix.allequal(readCheckpoint(dirname, mesh=mesh)["phi"],
+        ...                        mesh.cellCenters[0]))
+        True
+
+        >>> import shutil
+        >>> shutil.rmtree(dirname)
+
+    Parameters
+    ----------
+    dirname : str
+        Name of the directory to write the checkpoint to.  It is created
+        if it does not exist.
+    variables : dict
+        The `CellVariable` objects to write, keyed by name.  They must all
+        be defined on the same mesh.
+    compress : bool
+        Whether to compress the files.  Compressed files cannot be memory
+        mapped when they are read.
+    """
+    meshes = dict((id(var.mesh), var.mesh) for var in variables.values())
+    if len(meshes) != 1:
+        raise ValueError("checkpointed variables must be defined on one mesh")
+    mesh = list(meshes.values())[0]
+    communicator = mesh.communicator
+
+    try:
+        os.makedirs(dirname)
+    except OSError:
+        if not os.path.isdir(dirname):
+            raise
+
+    localIDs = mesh._localNonOverlappingCellIDs
+    _saveArray(dirname, "_cellIDs", communicator.procID,
+               mesh._globalNonOverlappingCellIDs, compress)
+    for name, var in variables.items():
+        value = numerix.asarray(var.numericValue)[..., localIDs]
+        _saveArray(dirname, name, communicator.procID, value, compress)
+
+    if communicator.procID == 0:
+        index = dict(Nproc=communicator.Nproc,
+                     compress=compress,
+                     names=list(variables.keys()))
+        with open(os.path.join(dirname, "index.pickle"), mode='wb') as f:
+            pickle.dump(index, f, pickle.HIGHEST_PROTOCOL)
+
+    communicator.Barrier()
+
+def readCheckpoint(dirname, mesh=None, mmap_mode='r'):
+    """
+    Read the values written by :func:`writeCheckpoint`.
+
+    Parameters
+    ----------
+    dirname : str
+        Name of the checkpoint directory.
+    mesh : ~fipy.meshes.mesh.Mesh
+        If given, return values for the cells of this processor's portion
+        of `mesh` (including its ghost cells), so that only those values
+        are read.  Otherwise, return values for all cells.
+    mmap_mode : {'r', 'r+', 'c', None}
+        How to memory map uncompressed files.  A checkpoint written on one
+        processor is returned as the memory-mapped arrays themselves, when
+        `mesh` is not given.
+
+    Returns
+    -------
+    dict
+        The values, with the cells along the last axis, keyed by name.
+    """
+    with open(os.path.join(dirname, "index.pickle"), mode='rb') as f:
+        index = pickle.load(f)
+
+    Nproc = index["Nproc"]
+    compress = index["compress"]
+    cellIDs = [_loadArray(dirname, "_cellIDs", procID, compress, None)
+               for procID in range(Nproc)]
+    numberOfCells = sum(len(IDs) for IDs in cellIDs)
+
+    ordered = (Nproc == 1
+               and numerix.array_equal(cellIDs[0], numerix.arange(numberOfCells)))
+
+    if mesh is not None:
+        # which processor owns each global cell, and where in its file
+        owner = numerix.empty((numberOfCells,), dtype=int)
+        position = numerix.empty((numberOfCells,), dtype=int)
+        for procID, IDs in enumerate(cellIDs):
+            owner[IDs] = procID
+            position[IDs] = numerix.arange(len(IDs))
+        wanted = numerix.asarray(mesh._globalOverlappingCellIDs)
+
+    values = {}
+    for name in index["names"]:
+        parts = [_loadArray(dirname, name, procID, compress, mmap_mode)
+                 for procID in range(Nproc)]
+
+        if mesh is None and ordered:
+            values[name] = parts[0]
+            continue
+
+        if mesh is None:
+            value = numerix.empty(parts[0].shape[:-1] + (numberOfCells,),
+                                  dtype=parts[0].dtype)
+            for IDs, part in zip(cellIDs, parts):
+                value[..., IDs] = part
+        else:
+            value = numerix.empty(parts[0].shape[:-1] + (len(wanted),),
+                                  dtype=parts[0].dtype)
+            for procID, part in enumerate(parts):
+                mask = owner[wanted] == procID
+                if mask.any():
+                    value[..., mask] = part[..., position[wanted[mask]]]
+
+        values[name] = value
+
+    return values
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
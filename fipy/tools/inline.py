@@ -1,6 +1,6 @@
 from __future__ import unicode_literals
 from builtins import range
-__all__ = ["doInline"]
+__all__ = ["doInline", "doFuse"]
 from future.utils import text_to_native_str
 __all__ = [text_to_native_str(n) for n in __all__]
 
@@ -13,6 +13,11 @@ if '--inline' in [s.lower() for s in sys.argv[1:]]:
 else:
     doInline = 'FIPY_INLINE' in os.environ
 
+if '--fuse' in [s.lower() for s in sys.argv[1:]]:
+    doFuse = True
+else:
+    doFuse = 'FIPY_FUSE' in os.environ
+
 _inlineFrameComment = 'FIPY_INLINE_COMMENT' in os.environ
 
 def _getframeinfo(level, context=1):
@@ -0,0 +1,277 @@
+"""Record where the time of each sweep of an equation goes
+
+Instrumentation is off, and costs next to nothing, unless a
+`SweepProfiler` is active or a callback has been registered with
+`registerCallback()`.  Each call to :meth:`~fipy.terms.term.Term.sweep` or
+:meth:`~fipy.terms.term.Term.solve` then produces one record for the sweep
+and one for each term built in it.  Records are flat dictionaries, so they
+can be written as JSON lines or passed straight to
+`pandas.DataFrame`.
+
+The time of a sweep record is split, exclusively, between
+
+``coefficients``
+    recalculating the values of `Variable` objects,
+``assembly``
+    building the matrix and RHS vector of each term,
+``conversion``
+    converting the assembled matrix to the format needed by the solver,
+``preconditioner``
+    setting up the preconditioner (or the factorization of
+    `LinearLUSolver`),
+``solve``
+    the rest of the linear solve,
+``residual``
+    calculating the residual, and
+``other``
+    everything else,
+
+with ``time`` the total.  ``iterations`` counts the iterations of the
+linear solver, where it reports them, and ``recomputations`` the number of
+`Variable` values recalculated.  Term records give the ``time`` spent
+building each term, the part of it spent in ``coefficients``, and whether
+a previous build was ``reused``.
+
+>>> from fipy import (CellVariable, Grid1D, DiffusionTerm,
+...                   ImplicitSourceTerm, TransientTerm)
+>>> from fipy.solvers.scipy import LinearPCGSolver
+>>> mesh = Grid1D(nx=100)
+>>> var = CellVariable(mesh=mesh, name="phi", value=0., hasOld=True)
+>>> var.constrain(1., where=mesh.facesLeft)
+>>> eq = TransientTerm() == DiffusionTerm(coeff=1.) - ImplicitSourceTerm(coeff=var)
+>>> with SweepProfiler() as profiler:
+...     for sweep in range(3):
+...         res = eq.sweep(var=var, dt=1., solver=LinearPCGSolver())
+>>> sweeps = [record for record in profiler.records if record["kind"] == "sweep"]
+>>> print(len(sweeps))
+3
+>>> print(sweeps[0]["var"])
+phi
+>>> total = sum(sweeps[0][category] for category in CATEGORIES + ("other",))
+>>> print(numerix.allclose(total, sweeps[0]["time"]))
+True
+>>> print(sweeps[0]["iterations"] > 0)
+True
+>>> print(sweeps[0]["recomputations"] > 0)
+True
+>>> terms = [record for record in profiler.records
+...          if record["kind"] == "term" and record["sweep"] == sweeps[1]["sweep"]]
+>>> print(sorted((record["term"], record["reused"]) for record in terms))
+[('DiffusionTerm', True), ('ImplicitSourceTerm', False), ('TransientTerm', True)]
+
+Records are written as JSON lines
+
+>>> import json
+>>> from io import StringIO
+>>> stream = StringIO()
+>>> profiler.write(stream)
+>>> lines = stream.getvalue().splitlines()
+>>> print(len(lines) == len(profiler.records))
+True
+>>> print(json.loads(lines[-1])["kind"])
+sweep
+
+or handed, as they are made, to the registered callbacks
+
+>>> records = []
+>>> registerCallback(records.append)
+>>> res = eq.sweep(var=var, dt=1., solver=LinearPCGSolver())
+>>> unregisterCallback(records.append)
+>>> res = eq.sweep(var=var, dt=1., solver=LinearPCGSolver())
+>>> print([record["kind"] for record in records])
+['term', 'term', 'term', 'sweep']
+"""
+from __future__ import division
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+import json
+from timeit import default_timer
+
+from fipy.tools import numerix
+
+__all__ = ["SweepProfiler", "registerCallback", "unregisterCallback", "CATEGORIES"]
+from future.utils import text_to_native_str
+__all__ = [text_to_native_str(n) for n in __all__]
+
+CATEGORIES = ("coefficients", "assembly", "conversion", "preconditioner", "solve", "residual")
+
+_profilers = []
+_callbacks = []
+
+# the sweep being recorded, if any
+_sweep = None
+_sweeps = 0
+
+def registerCallback(callback):
+    """Call `callback` with every record, as it is made
+
+    Parameters
+    ----------
+    callback : function
+        Takes a single record (a `dict`) as argument.
+    """
+    _callbacks.append(callback)
+
+def unregisterCallback(callback):
+    """Stop calling a `callback` registered with `registerCallback()`
+    """
+    _callbacks.remove(callback)
+
+class SweepProfiler(object):
+    """Collect the records of the sweeps made while active
+
+    Use as a context manager.  Profilers can be nested.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def __enter__(self):
+        _profilers.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _profilers.remove(self)
+
+    def write(self, stream):
+        """Write the records to `stream`, as JSON lines
+        """
+        for record in self.records:
+            stream.write(json.dumps(record) + "\n")
+
+class _NullTimer(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+_nullTimer = _NullTimer()
+
+class _Timer(object):
+    def __init__(self, sweep, category, count=None):
+        self.sweep = sweep
+        self.category = category
+        self.count = count
+
+    def __enter__(self):
+        if self.count is not None:
+            self.sweep.record[self.count] += 1
+        self.sweep.stack.append(self)
+        self.children = 0.
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.elapsed = default_timer() - self.start
+        self.sweep.stack.pop()
+        self.sweep.record[self.category] += self.elapsed - self.children
+        if self.sweep.stack:
+            self.sweep.stack[-1].children += self.elapsed
+
+class _TermTimer(_Timer):
+    def __init__(self, sweep, term):
+        super(_TermTimer, self).__init__(sweep=sweep, category="assembly")
+        self.term = term
+
+    def __enter__(self):
+        self.assembly = getattr(self.term, "_assembly", None)
+        self.coefficients = self.sweep.record["coefficients"]
+        return super(_TermTimer, self).__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super(_TermTimer, self).__exit__(exc_type, exc_value, traceback)
+        assembly = getattr(self.term, "_assembly", None)
+        self.sweep.terms.append({
+            "kind": "term",
+            "sweep": self.sweep.record["sweep"],
+            "term": self.term.__class__.__name__,
+            "time": self.elapsed,
+            "coefficients": self.sweep.record["coefficients"] - self.coefficients,
+            "reused": assembly is not None and assembly is self.assembly
+        })
+
+class _Sweep(object):
+    def __init__(self, term, var):
+        global _sweeps
+        _sweeps += 1
+        self.record = dict(kind="sweep",
+                           sweep=_sweeps,
+                           equation=term.__class__.__name__,
+                           var=getattr(var, "name", "") or "",
+                           iterations=0,
+                           recomputations=0)
+        self.record.update((category, 0.) for category in CATEGORIES)
+        self.terms = []
+        self.stack = []
+
+    def __enter__(self):
+        global _sweep
+        _sweep = self
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _sweep
+        _sweep = None
+        self.record["time"] = default_timer() - self.start
+        self.record["other"] = self.record["time"] - sum(self.record[category]
+                                                         for category in CATEGORIES)
+        if exc_type is None:
+            for record in self.terms + [self.record]:
+                for profiler in _profilers:
+                    profiler.records.append(record)
+                for callback in _callbacks:
+                    callback(record)
+
+def _recordSweep(term, var):
+    """Record a sweep of `term`, unless already recording one
+    """
+    if (_profilers or _callbacks) and _sweep is None:
+        return _Sweep(term=term, var=var)
+    else:
+        return _nullTimer
+
+def _timed(category, count=None):
+    """Add the time spent in the block to `category` of the current sweep
+
+    Time spent in nested blocks is only counted in their own category.  If
+    given, the `count` of the sweep is incremented.
+    """
+    if _sweep is None:
+        return _nullTimer
+    else:
+        return _Timer(sweep=_sweep, category=category, count=count)
+
+def _timedTerm(term):
+    """Record the time spent building `term`
+    """
+    if _sweep is None:
+        return _nullTimer
+    else:
+        return _TermTimer(sweep=_sweep, term=term)
+
+def _countIterations(*args):
+    if _sweep is not None:
+        _sweep.record["iterations"] += 1
+
+def _iterationCallback():
+    """Returns a callback for the linear solver, if iterations are being counted
+    """
+    if _sweep is None:
+        return None
+    else:
+        return _countIterations
+
+def _count(count, increment=1):
+    if _sweep is not None:
+        _sweep.record[count] += increment
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -10,7 +10,8 @@ def _suite():
             'numerix',
             'dump',
             'vector',
-            'sharedtempfile'
+            'sharedtempfile',
+            'instrumentation'
         ), base = __name__)
 
     return theSuite
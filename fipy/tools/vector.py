@@ -2,8 +2,6 @@
 """
 from __future__ import unicode_literals
 
-from builtins import range
-from builtins import zip
 from fipy.tools import inline, numerix
 
 __all__ = ["putAdd", "prune"]
@@ -15,28 +13,59 @@ __all__ = [text_to_native_str(n) for n in __all__]
 def _putAdd(vector, ids, additionVector, mask=False):
     """This is a temporary replacement for `Numeric.put` as it was not doing
     what we thought it was doing.
+
+    Contributions to repeated `ids` accumulate, and the elements of
+    `additionVector` that are masked are skipped.
+
+    >>> vector = numerix.zeros((5,), 'd')
+    >>> _putAdd(vector, numerix.array((0, 3, 0, 4)), (1., 2., 3., 4.),
+    ...         mask=numerix.array((False, False, False, True)))
+    >>> print(vector)
+    [ 4.  0.  0.  2.  0.]
+
+    The `mask` need not be boolean
+
+    >>> vector = numerix.zeros((5,), 'd')
+    >>> _putAdd(vector, numerix.array((0, 3, 0, 4)), (1., 2., 3., 4.),
+    ...         mask=numerix.array((0, 1, 0, 1)))
+    >>> print(vector)
+    [ 4.  0.  0.  0.  0.]
+
+    If `additionVector` has more dimensions than `vector`, each of its rows
+    is added to the corresponding row of `vector`
+
+    >>> vector = numerix.zeros((2, 3), 'd')
+    >>> _putAdd(vector, numerix.MA.array(((0, 1), (1, 2)), mask=((0, 0), (0, 1))),
+    ...         numerix.arange(8.).reshape((2, 2, 2)),
+    ...         mask=numerix.array(((0, 0), (0, 1)), dtype=bool))
+    >>> print(vector)
+    [[  0.   3.   0.]
+     [  4.  11.   0.]]
     """
     additionVector = numerix.array(additionVector)
 
+    if len(vector.shape) < len(additionVector.shape):
+        rows = vector.shape[0]
+    else:
+        rows = 1
+    size = vector.size // rows
+
+    ids = numerix.ravel(numerix.MA.filled(ids, 0))
+    additionVector = additionVector.reshape((rows, -1))
+    # like zip(), only use as many values as there are ids
+    N = min(len(ids), additionVector.shape[-1])
+    ids = ids[:N]
+    additionVector = additionVector[..., :N]
+
     if numerix.sometrue(mask):
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value, masked in zip(ids.flat, additionVector[j].flat, mask.flat):
-                    if not masked:
-                        vector[j].flat[id] += value
-        else:
-            for id, value, masked in zip(ids.flat, additionVector.flat, mask.flat):
-                if not masked:
-                    vector.flat[id] += value
+        unmasked = ~numerix.ravel(numerix.asarray(mask, dtype=bool))[:N]
+        ids = ids[unmasked]
+        additionVector = additionVector[..., unmasked]
 
-    else:
-        if len(vector.shape) < len(additionVector.shape):
-            for j in range(vector.shape[0]):
-                for id, value in zip(ids.flat, additionVector[j].flat):
-                    vector[j].flat[id] += value
-        else:
-            for id, value in zip(ids.flat, additionVector.flat):
-                vector.flat[id] += value
+    ids = (ids + numerix.arange(rows)[..., numerix.newaxis] * size).ravel()
+    contribution = numerix.bincount(ids, weights=additionVector.ravel(), minlength=vector.size)
+
+    vector += contribution.reshape(vector.shape).astype(vector.dtype)
 
 if inline.doInline:
     ## FIXME: inline version doesn't account for all of the conditions that Python
@@ -82,7 +82,7 @@ class BetaNoiseVariable(NoiseVariable):
       :alt: histogram of random values with a beta distribution
 
     """
-    def __init__(self, mesh, alpha, beta, name = '', hasOld = 0):
+    def __init__(self, mesh, alpha, beta, name = '', hasOld = 0, seed = None):
         r"""
         Parameters
         ----------
@@ -92,8 +92,13 @@ class BetaNoiseVariable(NoiseVariable):
             The parameter :math:`\alpha`.
         beta : float
             The parameter :math:`\beta`.
+        seed : int
+            Seed for the random streams of this variable, which are
+            generated independently on each processor.  If `None`, the
+            `fipy.tools.numerix.random` module is used instead.
         """
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
         self.alpha = self._requires(alpha)
         self.beta = self._requires(beta)
 
@@ -101,6 +106,9 @@ class BetaNoiseVariable(NoiseVariable):
         return random.beta(a = self.alpha, b = self.beta,
                            size = [self.mesh.globalNumberOfCells])
 
+    def _standardRandom(self, generator, size):
+        return generator.beta(a=self.alpha, b=self.beta, size=size)
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
@@ -133,12 +133,19 @@ class CellVariable(_MeshVariable):
     def setValue(self, value, unit = None, where = None):
         _MeshVariable.setValue(self, value=self._globalToLocalValue(value), unit=unit, where=where)
 
-    def __call__(self, points=None, order=0, nearestCellIDs=None):
+    def __call__(self, points=None, order=0, nearestCellIDs=None, containingCell=False):
         r"""
-        Interpolates the `CellVariable` to a set of points using a
-        method that has a memory requirement on the order of `Ncells` by
-        `Npoints` in general, but uses only `Ncells` when the
-        `CellVariable`'s mesh is a `UniformGrid` object.
+        Interpolates the `CellVariable` to a set of points, using the
+        cell with the nearest center to each point.  Nearest cells are
+        found directly on a `UniformGrid` object and otherwise with a
+        KD-tree of the cell centers that is cached on the mesh (or by
+        brute force, with a memory requirement on the order of `Ncells`
+        by `Npoints`, if :mod:`scipy` is unavailable).
+
+        On a mesh with cells of different sizes, the cell with the
+        nearest center need not be the cell that contains the point.
+        With `containingCell`, the few cells with the nearest centers
+        are tested for the one that does.
 
         Tests
 
@@ -159,6 +166,12 @@ class CellVariable(_MeshVariable):
             >>> print(v0(m1.cellCenters.globalValue, order=1))
             [ 0.125  0.25   0.5    0.625  0.25   0.375  0.875  1.     0.5    0.875
               1.875  2.25   0.625  1.     2.25   2.625]
+            >>> m2 = Grid2D(dx=(1., 4.), dy=(1.,))
+            >>> v2 = CellVariable(mesh=m2, value=m2.cellCenters[0])
+            >>> print(v2(((1.2,), (0.5,))))
+            [ 0.5]
+            >>> print(v2(((1.2,), (0.5,)), containingCell=True))
+            [ 3.]
 
         Parameters
         ----------
@@ -169,11 +182,18 @@ class CellVariable(_MeshVariable):
         nearestCellIDs : array_like
             Optional argument if user can calculate own
             nearest cell IDs array, shape should be same as points
+        containingCell : bool
+            Interpolate from the cell that contains each point, rather
+            than from the cell with the nearest center.  Points outside
+            of the mesh use the nearest cell.
         """
         if points is not None:
 
             if nearestCellIDs is None:
-                nearestCellIDs = self.mesh._getNearestCellID(points)
+                if containingCell:
+                    nearestCellIDs = self.mesh._getContainingCellID(points)
+                else:
+                    nearestCellIDs = self.mesh._getNearestCellID(points)
 
             if order == 0:
                 return self.globalValue[..., nearestCellIDs]
@@ -584,6 +604,7 @@ class CellVariable(_MeshVariable):
             self.faceConstraints.append(value)
             self._requires(value.value)
             # self._requires(value.where) ???
+            self._markChanged()
             self._markStale()
         else:
 ##            _MeshVariable.constrain(value, where)
@@ -607,6 +628,8 @@ class CellVariable(_MeshVariable):
             _MeshVariable.release(self, constraint=constraint)
         except ValueError:
             self.faceConstraints.remove(constraint)
+            self._markChanged()
+            self._markStale()
 
     def _test(self):
         """
@@ -650,7 +673,8 @@ class CellVariable(_MeshVariable):
 
 class _ReMeshedCellVariable(CellVariable):
     def __init__(self, oldVar, newMesh):
-        newValues = oldVar.getValue(points = newMesh.cellCenters)
+        points = numerix.asarray(newMesh.cellCenters)
+        newValues = oldVar(points=points, containingCell=True)
         CellVariable.__init__(self, newMesh, name = oldVar.name, value = newValues, unit = oldVar.unit)
 
 def _test():
@@ -310,6 +310,7 @@ class DistanceVariable(CellVariable):
             raise Exception("Neither `lsmlib` nor `skfmm` can be found on the $PATH")
 
         self._value = distance(numerix.reshape(self._value, shape), dx=dx, order=order).flatten()
+        self._markChanged()
         self._markFresh()
 
     @property
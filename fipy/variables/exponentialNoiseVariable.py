@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.tools.numerix import random
+from fipy.tools import numerix
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["ExponentialNoiseVariable"]
@@ -76,7 +77,7 @@ class ExponentialNoiseVariable(NoiseVariable):
       :alt: histogram of random values with an exponential distribution
 
     """
-    def __init__(self, mesh, mean=0.0, name = '', hasOld = 0):
+    def __init__(self, mesh, mean=0.0, name = '', hasOld = 0, seed = None):
         r"""
         Parameters
         ----------
@@ -84,14 +85,25 @@ class ExponentialNoiseVariable(NoiseVariable):
             The mesh on which to define the noise.
         mean : float
             The mean of the distribution :math:`\mu`.
+        seed : int
+            Seed for the random streams of this variable, which are
+            generated independently on each processor.  If `None`, the
+            `fipy.tools.numerix.random` module is used instead.
         """
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
         self.mean = self._requires(mean)
 
     def random(self):
         return random.exponential(scale = self.mean,
                                   size = [self.mesh.globalNumberOfCells])
 
+    def _standardRandom(self, generator, size):
+        return generator.standard_exponential(size=size)
+
+    def _scaleRandom(self, rnd):
+        return numerix.asarray(self.mean) * rnd
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
@@ -0,0 +1,384 @@
+from __future__ import unicode_literals
+from builtins import object
+__docformat__ = 'restructuredtext'
+
+__all__ = []
+
+import os
+
+from fipy.tools import numerix
+from fipy.tools.numerix import NUMERIX
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+## `numexpr` is only used on request, as it may round differently than `numpy`
+_useNumexpr = (numexpr is not None
+               and os.environ.get('FIPY_FUSE', '').lower() == 'numexpr')
+
+def _codeKey(op):
+    code = op.__code__
+    return (code.co_code, code.co_names, code.co_consts, code.co_argcount)
+
+## The arithmetic and comparison operators of `Variable` are lambdas.  Each
+## is matched by its byte code to the ufunc it applies and to whether it
+## swaps its arguments.
+_lambdaUfuncs = dict((_codeKey(op), (ufunc, swap)) for op, ufunc, swap in [
+    (lambda a, b: a+b, NUMERIX.add, False),
+    (lambda a, b: a-b, NUMERIX.subtract, False),
+    (lambda a, b: b-a, NUMERIX.subtract, True),
+    (lambda a, b: a*b, NUMERIX.multiply, False),
+    (lambda a, b: a / b, NUMERIX.true_divide, False),
+    (lambda a, b: b / a, NUMERIX.true_divide, True),
+    (lambda a, b: pow(a, b), NUMERIX.power, False),
+    (lambda a, b: pow(b, a), NUMERIX.power, True),
+    (lambda a, b: numerix.fmod(a, b), NUMERIX.fmod, False),
+    (lambda a, b: a<b, NUMERIX.less, False),
+    (lambda a, b: a<=b, NUMERIX.less_equal, False),
+    (lambda a, b: a==b, NUMERIX.equal, False),
+    (lambda a, b: a!=b, NUMERIX.not_equal, False),
+    (lambda a, b: a>b, NUMERIX.greater, False),
+    (lambda a, b: a>=b, NUMERIX.greater_equal, False),
+    (lambda a: -a, NUMERIX.negative, False)])
+
+_numexprOperators = {
+    NUMERIX.add: "+",
+    NUMERIX.subtract: "-",
+    NUMERIX.multiply: "*",
+    NUMERIX.true_divide: "/",
+    NUMERIX.power: "**"
+}
+
+_numexprFunctions = dict((getattr(NUMERIX, name), name) for name in [
+    "exp", "expm1", "log", "log10", "log1p", "sqrt",
+    "sin", "cos", "tan", "arcsin", "arccos", "arctan", "arctan2",
+    "sinh", "cosh", "tanh", "arcsinh", "arccosh", "arctanh"])
+_numexprFunctions[NUMERIX.absolute] = "abs"
+
+def _isPlain(value):
+    return (type(value) in (int, float, bool)
+            or isinstance(value, (NUMERIX.ndarray, NUMERIX.generic))
+            and not isinstance(value, NUMERIX.ma.MaskedArray))
+
+class _FusedEvaluator(object):
+    """Evaluate a tree of operator variables in one pass.
+
+    Each operation in the tree is applied with a :mod:`numpy` ufunc that
+    writes into a scratch array, which is kept for the next evaluation.
+    An operation reuses the scratch array of one of its operands when the
+    shape and type match, so only the result is allocated on each pass.
+    The whole tree is handed to :mod:`numexpr` instead, if it is
+    installed, if it is requested with `FIPY_FUSE=numexpr`, and if the
+    tree consists of floating point arithmetic.
+
+    Operator variables that are cached, that cannot be inlined, or that
+    apply anything other than a recognized ufunc are evaluated as usual
+    and treated as operands.
+
+    >>> from fipy import CellVariable, Grid1D, numerix
+    >>> mesh = Grid1D(nx=4)
+    >>> phi = CellVariable(mesh=mesh, value=(1., 2., 3., 4.))
+    >>> T = CellVariable(mesh=mesh, value=(300., 400., 500., 600.))
+    >>> D = 2. * numerix.exp(-1000. / (8.314 * T)) * phi**2
+    >>> fused = _FusedEvaluator(useNumexpr=False)
+    >>> print(numerix.array_equal(fused.evaluate(D), D._calcValue_()))
+    True
+
+    The intermediate results are marked fresh, so the tree still responds
+    to changes in its operands
+
+    >>> phi.value = (4., 3., 2., 1.)
+    >>> print(numerix.allclose(fused.evaluate(D), D._calcValue_()))
+    True
+
+    but no value is kept for them, even if one was cached while another
+    variable required them
+
+    >>> u = CellVariable(mesh=mesh, value=(4., 3., 2., 1.))
+    >>> a = u * 2.
+    >>> b = a + 1.
+    >>> c = a * 3.
+    >>> print(a.value)
+    [ 8.  6.  4.  2.]
+    >>> del c
+    >>> import gc
+    >>> _ = gc.collect()
+    >>> u.value = (1., 2., 3., 4.)
+    >>> print(fused.evaluate(b))
+    [ 3.  5.  7.  9.]
+    >>> c = a * 3.
+    >>> print(a.value)
+    [ 2.  4.  6.  8.]
+
+    Sweeping a nonlinear equation with fused coefficients converges to the
+    same solution as without them
+
+    >>> from fipy import TransientTerm, ImplicitSourceTerm
+    >>> from fipy.tools import inline
+    >>> from builtins import range
+    >>> def sweepTransient():
+    ...     var = CellVariable(mesh=Grid1D(nx=1), value=1., hasOld=True)
+    ...     eq = (TransientTerm(var) == ImplicitSourceTerm(-1.5)
+    ...                                 + var * 1.5 + 1.)
+    ...     for step in range(2):
+    ...         var.updateOld()
+    ...         for sweep in range(8):
+    ...             eq.solve(var, dt=1.)
+    ...     return var
+    >>> doFuse = inline.doFuse
+    >>> inline.doFuse = True
+    >>> var = sweepTransient()
+    >>> inline.doFuse = doFuse
+    >>> print(var.allclose(numerix.sqrt(3.)))
+    1
+
+    Repeated evaluation reuses the same scratch arrays
+
+    >>> first = fused.evaluate(D)
+    >>> scratch = [id(a) for arrays in fused.scratch.values() for a in arrays]
+    >>> second = fused.evaluate(D)
+    >>> print(len(scratch) > 0)
+    True
+    >>> print(scratch == [id(a) for arrays in fused.scratch.values() for a in arrays])
+    True
+
+    but the result is never one of them
+
+    >>> print(first is second or id(second) in scratch)
+    False
+    >>> print(numerix.allclose(second, D._calcValue_()))
+    True
+
+    Integer and boolean operations keep their `numpy` types
+
+    >>> i = CellVariable(mesh=mesh, value=(1, 2, 3, 4))
+    >>> print(fused.evaluate((i * 3 - 1) / 2))
+    [ 1.   2.5  4.   5.5]
+    >>> print(fused.evaluate((i * 2) > 5))
+    [False False  True  True]
+    >>> print(fused.evaluate(((i * 2) > 5) * (phi * 2.) + 1.))
+    [ 1.  1.  5.  3.]
+
+    :mod:`numexpr` agrees to within rounding
+
+    >>> print(numerix.allclose(_FusedEvaluator(useNumexpr=True).evaluate(D),
+    ...                        D._calcValue_()))
+    True
+
+    Operands with physical dimensions are evaluated in the usual way
+
+    >>> x = CellVariable(mesh=mesh, value=(1., 2., 3., 4.), unit="m")
+    >>> print(fused.evaluate(2 * x + x))
+    [  3.   6.   9.  12.] m
+    """
+    def __init__(self, useNumexpr=None):
+        if useNumexpr is None:
+            useNumexpr = _useNumexpr
+        self.useNumexpr = useNumexpr and numexpr is not None
+        self.scratch = {}
+        self._free = {}
+
+    def evaluate(self, var):
+        """Return the value of the operator variable `var`.
+        """
+        leaves = []
+        fused = []
+        tree = self._parse(var, leaves, fused, isRoot=True)
+
+        if isinstance(tree, int):
+            return var._calcValue_()
+
+        values = []
+        from fipy.variables.variable import Variable
+        for leaf in leaves:
+            if isinstance(leaf, Variable):
+                values.append(leaf.value)
+            else:
+                values.append(leaf)
+
+        self._free = dict((key, list(arrays)) for key, arrays in self.scratch.items())
+
+        result = None
+        if self.useNumexpr:
+            result = self._evaluateNumexpr(tree, values)
+        if result is None:
+            result = self._evaluate(tree, values, isRoot=True)[0]
+
+        # The intermediate values are not kept, as `_getValue` does for
+        # any uncached variable, but the variables must still be freshened
+        # so that later changes to the operands propagate to `var`.
+        # `fused` is in post-order, so each variable is freshened after
+        # those it requires and before those that require it
+        for node in fused[:-1]:
+            node._setValueInternal(value=None)
+            node._markFresh()
+
+        return result
+
+    @staticmethod
+    def _ufunc(var):
+        op = var.op
+        if isinstance(op, NUMERIX.ufunc):
+            if op.nin == len(var.var) and op.nout == 1:
+                return op, False
+        elif hasattr(op, "__code__"):
+            return _lambdaUfuncs.get(_codeKey(op), (None, False))
+
+        return None, False
+
+    def _parse(self, var, leaves, fused, isRoot=False):
+        from fipy.variables.variable import Variable
+
+        ufunc = None
+        if (isinstance(var, Variable) and hasattr(var, "op")
+            and var.canInline and (isRoot or not var._isCached())):
+            ufunc, swap = self._ufunc(var)
+
+        if ufunc is None:
+            leaves.append(var)
+            return len(leaves) - 1
+
+        children = [self._parse(v, leaves, fused) for v in var.var]
+        fused.append(var)
+
+        return (var, ufunc, swap, children)
+
+    def _acquire(self, shape, dtype):
+        key = (shape, dtype.str)
+        if self._free.get(key):
+            return self._free[key].pop()
+
+        array = numerix.empty(shape, dtype)
+        self.scratch.setdefault(key, []).append(array)
+        return array
+
+    def _release(self, array):
+        self._free.setdefault((array.shape, array.dtype.str), []).append(array)
+
+    @staticmethod
+    def _resultType(ufunc, inputs):
+        # apply `ufunc` to one element of each array operand (keeping
+        # scalars as they are, as they affect `numpy`'s casting)
+        samples = [x[(slice(0, 1),) * x.ndim] if isinstance(x, NUMERIX.ndarray) else x
+                   for x in inputs]
+        with numerix.errstate(all='ignore'):
+            return NUMERIX.asarray(ufunc(*samples)).dtype
+
+    @staticmethod
+    def _fastPower(inputs):
+        # `ndarray.__pow__` squares or takes the square root of floating
+        # point arrays directly, which `power` does not
+        base, exponent = inputs
+        if (isinstance(base, NUMERIX.ndarray)
+            and NUMERIX.issubdtype(base.dtype, NUMERIX.inexact)
+            and numerix.shape(exponent) == ()):
+            if exponent == 2:
+                return NUMERIX.square, [base]
+            elif exponent == 0.5:
+                return NUMERIX.sqrt, [base]
+
+        return NUMERIX.power, inputs
+
+    def _evaluate(self, tree, values, isRoot=False):
+        """Return the value of `tree` and whether it is a scratch array
+        """
+        if isinstance(tree, int):
+            return values[tree], False
+
+        var, ufunc, swap, children = tree
+        operands = [self._evaluate(child, values) for child in children]
+        inputs = [value for value, isScratch in operands]
+        scratch = [value for value, isScratch in operands if isScratch]
+
+        isScratch = False
+        if not all(_isPlain(value) for value in inputs):
+            result = var.op(*inputs)
+        else:
+            if swap:
+                inputs = inputs[::-1]
+
+            if ufunc is NUMERIX.power:
+                ufunc, inputs = self._fastPower(inputs)
+
+            shape = NUMERIX.broadcast(*inputs).shape
+            if shape == ():
+                result = ufunc(*inputs)
+            else:
+                dtype = self._resultType(ufunc, inputs)
+                if isRoot:
+                    out = numerix.empty(shape, dtype)
+                else:
+                    for i, out in enumerate(scratch):
+                        if out.shape == shape and out.dtype == dtype:
+                            del scratch[i]
+                            break
+                    else:
+                        out = self._acquire(shape, dtype)
+                    isScratch = True
+
+                result = ufunc(*inputs, out=out)
+
+        for value in scratch:
+            self._release(value)
+
+        return result, isScratch
+
+    def _expression(self, tree, values, names):
+        """Return a :mod:`numexpr` expression for `tree`, or `None`
+        """
+        if isinstance(tree, int):
+            value = values[tree]
+            if not _isPlain(value):
+                return None
+            elif numerix.shape(value) == ():
+                # literals let `numexpr` simplify, e.g., `x**2` to `x*x`
+                if NUMERIX.issubdtype(NUMERIX.asarray(value).dtype, NUMERIX.integer):
+                    return "(%r)" % int(value)
+                elif NUMERIX.asarray(value).dtype == NUMERIX.float64:
+                    return "(%r)" % float(value)
+            elif value.dtype == NUMERIX.float64:
+                name = "v%d" % tree
+                names[name] = value
+                return name
+            return None
+
+        var, ufunc, swap, children = tree
+        args = [self._expression(child, values, names) for child in children]
+        if None in args:
+            return None
+        if swap:
+            args = args[::-1]
+
+        if ufunc is NUMERIX.negative:
+            return "(-%s)" % args[0]
+        elif ufunc in _numexprOperators and len(args) == 2:
+            return "(%s %s %s)" % (args[0], _numexprOperators[ufunc], args[1])
+        elif ufunc in _numexprFunctions:
+            return "%s(%s)" % (_numexprFunctions[ufunc], ", ".join(args))
+        else:
+            return None
+
+    def _evaluateNumexpr(self, tree, values):
+        names = {}
+        expression = self._expression(tree, values, names)
+        if expression is None:
+            return None
+
+        if len(names) == 0:
+            return None
+
+        shape = NUMERIX.broadcast(*list(names.values())).shape
+        if shape == ():
+            return None
+
+        out = numerix.empty(shape, NUMERIX.float64)
+        return numexpr.evaluate(expression, local_dict=names, out=out)
+
+def _test():
+    import fipy.tests.doctestPlus
+    return fipy.tests.doctestPlus.testmod()
+
+if __name__ == "__main__":
+    _test()
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.tools.numerix import random
+from fipy.tools import numerix
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["GammaNoiseVariable"]
@@ -81,7 +82,7 @@ class GammaNoiseVariable(NoiseVariable):
       :alt: histogram of random values with a gamma distribution
 
     """
-    def __init__(self, mesh, shape, rate, name = '', hasOld = 0):
+    def __init__(self, mesh, shape, rate, name = '', hasOld = 0, seed = None):
         r"""
         Parameters
         ----------
@@ -91,9 +92,14 @@ class GammaNoiseVariable(NoiseVariable):
             The shape parameter, :math:`\alpha`.
         rate : float
             The rate or inverse scale parameter, :math:`\beta`.
+        seed : int
+            Seed for the random streams of this variable, which are
+            generated independently on each processor.  If `None`, the
+            `fipy.tools.numerix.random` module is used instead.
 
         """
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
         self.shapeParam = self._requires(shape)
         self.rate = self._requires(rate)
 
@@ -101,6 +107,12 @@ class GammaNoiseVariable(NoiseVariable):
         return random.gamma(shape=self.shapeParam, scale=self.rate,
                             size=[self.mesh.globalNumberOfCells])
 
+    def _standardRandom(self, generator, size):
+        return generator.standard_gamma(shape=self.shapeParam, size=size)
+
+    def _scaleRandom(self, rnd):
+        return numerix.asarray(self.rate) * rnd
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.tools.numerix import random, sqrt
+from fipy.tools import numerix
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["GaussianNoiseVariable"]
@@ -106,7 +107,7 @@ class GaussianNoiseVariable(NoiseVariable):
       :alt: histogram of random values with a Gaussian distribution
 
     """
-    def __init__(self, mesh, name = '', mean = 0., variance = 1., hasOld = 0):
+    def __init__(self, mesh, name = '', mean = 0., variance = 1., hasOld = 0, seed = None):
         """
         Parameters
         ----------
@@ -116,10 +117,15 @@ class GaussianNoiseVariable(NoiseVariable):
             The mean of the noise distribution, :math:`\mu`.
         variance : float
             The variance of the noise distribution, :math:`\sigma^2`.
+        seed : int
+            Seed for the random streams of this variable, which are
+            generated independently on each processor.  If `None`, the
+            `fipy.tools.numerix.random` module is used instead.
         """
         self.mean = mean
         self.variance = variance
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
 
     def parallelRandom(self):
 
@@ -134,6 +140,13 @@ class GaussianNoiseVariable(NoiseVariable):
         else:
             return None
 
+    def _standardRandom(self, generator, size):
+        return generator.standard_normal(size=size)
+
+    def _scaleRandom(self, rnd):
+        return (numerix.asarray(self.mean)
+                + numerix.sqrt(numerix.asarray(self.variance)) * rnd)
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
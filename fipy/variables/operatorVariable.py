@@ -49,11 +49,19 @@ def _OperatorVariableClass(baseClass=object):
                 return self._calcValue_()
             else:
                 from fipy.tools import inline
-                if inline.doInline:
+                if inline.doFuse:
+                    return self._execFused()
+                elif inline.doInline:
                     return self._execInline(comment=self.comment)
                 else:
                     return self._calcValue_()
 
+        def _execFused(self):
+            if not hasattr(self, "_fusedEvaluator"):
+                from fipy.variables.fusedEvaluator import _FusedEvaluator
+                self._fusedEvaluator = _FusedEvaluator()
+            return self._fusedEvaluator.evaluate(self)
+
         def _calcValue_(self):
             pass
 
@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 __docformat__ = 'restructuredtext'
 
 from fipy.tools.numerix import random
+from fipy.tools import numerix
 from fipy.variables.noiseVariable import NoiseVariable
 
 __all__ = ["UniformNoiseVariable"]
@@ -45,7 +46,7 @@ class UniformNoiseVariable(NoiseVariable):
        :align: center
        :alt: histogram of random values with a uniform distribution
     """
-    def __init__(self, mesh, name = '', minimum = 0., maximum = 1., hasOld = 0):
+    def __init__(self, mesh, name = '', minimum = 0., maximum = 1., hasOld = 0, seed = None):
         """
         Parameters
         ----------
@@ -55,15 +56,27 @@ class UniformNoiseVariable(NoiseVariable):
             The minimum (not-inclusive) value of the distribution.
         maximum : float
             The maximum (not-inclusive) value of the distribution.
+        seed : int
+            Seed for the random streams of this variable, which are
+            generated independently on each processor.  If `None`, the
+            `fipy.tools.numerix.random` module is used instead.
         """
         self.minimum = minimum
         self.maximum = maximum
-        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld)
+        NoiseVariable.__init__(self, mesh = mesh, name = name, hasOld = hasOld,
+                               seed = seed)
 
     def random(self):
         return random.uniform(self.minimum, self.maximum,
                               size=[self.mesh.globalNumberOfCells])
 
+    def _standardRandom(self, generator, size):
+        return generator.random(size=size)
+
+    def _scaleRandom(self, rnd):
+        minimum = numerix.asarray(self.minimum)
+        return minimum + (numerix.asarray(self.maximum) - minimum) * rnd
+
 def _test():
     import fipy.tests.doctestPlus
     return fipy.tests.doctestPlus.testmod()
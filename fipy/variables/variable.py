@@ -5,9 +5,11 @@ from builtins import str
 from future.utils import string_types
 __docformat__ = 'restructuredtext'
 
+import itertools
 import os
 
 from fipy.tools.dimensions import physicalField
+from fipy.tools import instrumentation
 from fipy.tools import numerix
 from fipy.tools import parser
 from fipy.tools import inline
@@ -48,6 +50,10 @@ class Variable(object):
 
     _cacheNever = False
 
+    # see `_version`
+    _stamp = 0
+    _stamps = itertools.count(1)
+
     def __new__(cls, *args, **kwds):
         return object.__new__(cls)
 
@@ -445,18 +451,21 @@ class Variable(object):
         if self._value is None:
             self._getValue()
         self._value[index] = value
+        self._markChanged()
         self._markFresh()
 
     def itemset(self, value):
         if self._value is None:
             self._getValue()
         self._value.itemset(value)
+        self._markChanged()
         self._markFresh()
 
     def put(self, indices, value):
         if self._value is None:
             self._getValue()
         numerix.put(self._value, indices, value)
+        self._markChanged()
         self._markFresh()
 
     def __call__(self):
@@ -490,7 +499,8 @@ class Variable(object):
         """
 
         if self.stale or not self._isCached() or self._value is None:
-            value = self._calcValue()
+            with instrumentation._timed("coefficients", count="recomputations"):
+                value = self._calcValue()
             if self._isCached():
                 self._setValueInternal(value=value)
             else:
@@ -584,6 +594,7 @@ class Variable(object):
             self._constraints = []
         self._constraints.append(value)
         self._requires(value.value)
+        self._markChanged()
         self._markStale()
 
     def release(self, constraint):
@@ -604,6 +615,8 @@ class Variable(object):
         [ 2 10 10 10]
         """
         self.constraints.remove(constraint)
+        self._markChanged()
+        self._markStale()
 
     def _isCached(self):
         return self._cacheAlways or (self._cached and not self._cacheNever)
@@ -719,6 +732,7 @@ class Variable(object):
         else:
             self._value[:] = value
 
+        self._markChanged()
         self._markFresh()
 
     def _setNumericValue(self, value):
@@ -830,6 +844,50 @@ class Variable(object):
             self.stale = 1
             self.__markStale()
 
+    def _markChanged(self):
+        """Record that the value of `self` was changed, rather than recalculated
+        """
+        self._stamp = next(Variable._stamps)
+
+    @property
+    def _version(self):
+        """The most recent change to `self` or to any `Variable` it requires
+
+        Unlike `stale`, which is cleared as soon as the value is
+        recalculated, `_version` can be recorded and compared later, to
+        find out whether anything the value depends on has been changed in
+        between.  Only assignments (and constraints) count as changes, so
+        neither creating a `Variable` nor building a new expression out of
+        unchanged `Variable` objects does.
+
+        >>> a = Variable(value=3.)
+        >>> b = Variable(value=4.)
+        >>> c = a * b + a
+        >>> version = c._version
+        >>> print(c)
+        15.0
+        >>> print(c._version == version)
+        True
+        >>> print((c + 1)._version == version)
+        True
+        >>> b.value = 5.
+        >>> print(c._version == version)
+        False
+        >>> print(c._version > version)
+        True
+        """
+        version = self._stamp
+        visited = set([id(self)])
+        required = list(self.requiredVariables)
+        while required:
+            var = required.pop()
+            if id(var) not in visited:
+                visited.add(id(var))
+                version = max(version, var._stamp)
+                required.extend(var.requiredVariables)
+
+        return version
+
     def _requires(self, var):
         if isinstance(var, Variable):
             self.requiredVariables.append(var)